@@ -0,0 +1,173 @@
+"""Headless batch simulation, does not import PySide6"""
+import config
+config.setup(force=True)
+
+# Std Lib imports
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+import sys
+import os
+
+from returns import result as _result
+
+# Internal imports
+from automaton.automatonProvider import AutomatonProvider
+from automaton.automatonSimulator import AutomatonSimulator
+from automaton.compiledAutomaton import CompiledDFA, CompiledMealy, CompiledNFA
+from automaton.inputSource import MappedInput, tokenise
+from automaton.parallelSimulator import ParallelSimulator, WordSimulator, WordResultT
+from serializer import load_dcg_dict, to_simulation_request
+from extensions_loader import Extensions_Loader
+from utils.tracer import Tracer, TRACE, JsonLinesSink
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+def read_words(stream: _ty.TextIO, separator: str) -> _a.Iterator[_ty.List[str]]:
+    """Lazily reads one input word per line
+
+    :param stream: The stream to read from
+    :param separator: The separator between the tokens of a word, an empty separator splits into single characters
+    :return: An iterator over the tokenized words
+    """
+    for line in stream:
+        line = line.rstrip("\r\n")
+        if not line:
+            yield []
+        elif separator:
+            yield line.split(separator)
+        else:
+            yield list(line)
+
+
+def read_tokens(stream: _ty.TextIO, separator: str, chunk_size: int = 64 * 1024) -> _a.Iterator[str]:
+    """Lazily reads the whole input as a single word, line breaks only separate tokens
+
+    :param stream: The stream to read from
+    :param separator: The separator between the tokens, an empty separator splits into single characters
+    :param chunk_size: The number of characters read at once
+    :return: An iterator over the tokens, empty tokens are skipped
+    """
+    return tokenise(iter(lambda: stream.read(chunk_size), ""), separator)
+
+
+def format_result(index: int, result: WordResultT, separator: str) -> str:
+    """Formats the result of one word as a tab separated line
+
+    :param index: The index of the word
+    :param result: The result of the simulation
+    :param separator: The separator used to join the output of the automaton
+    :return: The line
+    """
+    success, message, output = result
+    fields: _ty.List[str] = [str(index), "accept" if success else "reject", message]
+    if output is not None:
+        fields.append(output if isinstance(output, str) else separator.join(str(token) for token in output))
+    return "\t".join(fields)
+
+
+def main(argv: _ty.List[str] | None = None) -> int:
+    """Runs the cli
+
+    :param argv: The command line arguments, sys.argv[1:] if None
+    :return: The exit code
+    """
+    parser = ArgumentParser(description=f"{config.PROGRAM_NAME} (headless)")
+    parser.add_argument("automaton", help="Path to the automaton file (.json, .yml, .yaml or .au).")
+    parser.add_argument("-i", "--input", default="-",
+                        help="Path to a file with one input word per line, - for stdin (default: -)")
+    parser.add_argument("-s", "--separator", default=",",
+                        help="Separator between the tokens of a word, an empty string splits into characters "
+                             "(default: ,)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Number of worker processes, 0 for one per cpu core (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=1024,
+                        help="Number of words sent to a worker at once (default: 1024)")
+    parser.add_argument("--max-steps", type=int, default=AutomatonSimulator.DEFAULT_MAX_STEPS,
+                        help="Steps after which a word is rejected as non-halting, 0 for unlimited. By default "
+                             "only --max-duration and the cycle detection stop a non-halting automaton "
+                             f"(default: {AutomatonSimulator.DEFAULT_MAX_STEPS})")
+    parser.add_argument("--max-duration", type=float, default=AutomatonSimulator.DEFAULT_MAX_DURATION,
+                        help="Seconds after which a word is rejected as non-halting, 0 for unlimited "
+                             f"(default: {AutomatonSimulator.DEFAULT_MAX_DURATION})")
+    parser.add_argument("--no-cycle-detection", action="store_true",
+                        help="Do not reject words on which the automaton repeats a configuration")
+    parser.add_argument("--stream", action="store_true",
+                        help="Simulates the whole input as a single word while reading it, in bounded memory. Only "
+                             "for finite automata (e.g. dfa, nfa) and transducers (e.g. mealy), the output is "
+                             "written to stdout and the result to stderr. Input files are memory mapped")
+    parser.add_argument("--specialise", action="store_true",
+                        help="Generates Python source specialised to the automaton and runs it instead of the "
+                             "compiled tables, faster for many words or long inputs. Only for dfa, mealy and nfa with "
+                             "at most 64 states, all others are simulated as usual")
+    parser.add_argument("--trace-file", default=None,
+                        help="Appends the trace events of every simulation step as JSON lines to this file, only "
+                             "words simulated in this process are traced (default: None)")
+    args = parser.parse_args(argv)
+
+    if args.trace_file is not None:
+        Tracer().add_sink(JsonLinesSink(os.path.join(config.OLD_CWD, args.trace_file)), TRACE)
+
+    results = sys.stdout
+    with redirect_stdout(sys.stderr):  # Diagnostic prints of the extensions must not end up between the results
+        automaton_path: str = os.path.join(config.OLD_CWD, args.automaton)
+        end: str = automaton_path.rsplit(".", maxsplit=1)[-1]
+        filetype: _ty.Literal["json", "yaml", "binary"] | None = {"json": "json", "yml": "yaml", "yaml": "yaml",
+                                                                  "au": "binary"}.get(end, None)  # type: ignore
+        if filetype is None:
+            print(f"The loading of the file '{os.path.basename(automaton_path)}' has failed.\n"
+                  f"Incompatible file extension.")
+            return 1
+        try:
+            with open(automaton_path, "rb") as f:
+                simulation_request: _ty.Dict[str, _ty.Any] = to_simulation_request(load_dcg_dict(f.read(), filetype),
+                                                                                   [])
+            simulation_request.update(max_steps=args.max_steps, max_duration=args.max_duration,
+                                      cycle_detection=not args.no_cycle_detection, specialise=args.specialise)
+        except Exception as e:
+            print(f"The loading of the file '{os.path.basename(automaton_path)}' has failed: {e}")
+            return 1
+
+        extensions: dict[str, list[_ty.Type[_ty.Any]]] = Extensions_Loader(config.base_app_dir).load_content()
+        AutomatonProvider(None).load_from_dict(extensions)
+
+        stream: _ty.TextIO = sys.stdin
+        if args.input != "-":
+            stream = open(os.path.join(config.OLD_CWD, args.input), "r", encoding="utf-8")
+        try:
+            if args.stream:
+                tokens: _ty.Iterable[str] = (MappedInput(os.path.join(config.OLD_CWD, args.input), args.separator)
+                                             if args.input != "-" else read_tokens(stream, args.separator))
+                word_simulator: WordSimulator = WordSimulator(simulation_request)
+                transducer: CompiledMealy | None = word_simulator.get_transducer()
+                compiled: CompiledDFA | CompiledNFA | None = word_simulator.get_compiled()
+                if transducer is not None:
+                    state, consumed = transducer.write(tokens, results, args.separator)
+                    results.write("\n")
+                    result = transducer.get_result(state)  # The output ends where the transducer got stuck
+                elif compiled is not None:
+                    state, consumed = compiled.run(tokens)
+                    result = compiled.get_result(state)
+                else:
+                    print("The simulation has failed: Only finite automata and transducers can be streamed")
+                    return 1
+                print(format_result(0, (isinstance(result, _result.Success), str(result._inner_value), None),
+                                    args.separator) + f"\t{consumed}")
+                return 0
+            with ParallelSimulator(simulation_request, args.workers or None, args.chunk_size) as simulator:
+                for i, result in enumerate(simulator.run(read_words(stream, args.separator))):
+                    results.write(format_result(i, result, args.separator) + "\n")
+        except ValueError as e:
+            print(f"The simulation has failed: {e}")
+            return 1
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            Tracer().clear_sinks()  # Flushes the trace file
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -50,7 +50,7 @@ def _configure() -> dict[str, str]:
     accumulated_logs = "Starting cloning of defaults ...\n"
     old_cwd = _os.getcwd()
     install_dir = _os.path.join(old_cwd, "default-config")
-    base_app_dir = _os.path.join(_os.environ.get("LOCALAPPDATA", "."), PROGRAM_NAME_NORMALIZED)
+    base_app_dir = _os.path.abspath(_os.path.join(_os.environ.get("LOCALAPPDATA", "."), PROGRAM_NAME_NORMALIZED))
 
     if INDEV and _os.path.exists(base_app_dir):  # Remove everything to simulate a fresh install
         if not INDEV_KEEP_RUNTIME_FILES:
@@ -147,10 +147,13 @@ def check() -> RuntimeError | None:
     return None
 
 
-def setup() -> None:
-    """Setup the app, this does not include checking for compatibility"""
+def setup(force: bool = False) -> None:
+    """Setup the app, this does not include checking for compatibility
+
+    :param force: Also set up if check() was not run, e.g. for the headless cli, which does not depend on the OS
+    """
     global CONFIG_DONE, exported_logs, base_app_dir, old_cwd
-    if CONFIG_DONE or not CHECK_DONE:
+    if CONFIG_DONE or not (CHECK_DONE or force):
         return None
     CONFIG_DONE = True
     exported_vars = _configure()
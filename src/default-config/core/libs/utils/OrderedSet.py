@@ -10,28 +10,80 @@ T = _ty.TypeVar('T')
 # Docs generated with Github Copilot
 
 
+_TOMBSTONE: _ty.Any = object()  # Marks the slot of a removed item until the next compaction
+
+
 class OrderedSet(_ty.Generic[T]):
     def __init__(self, iterable: _ty.Iterable = None) -> None:
         """
         OrderedSet is a hybrid of list and set. It maintains the order of elements like a list and ensures that each
-        element is unique like a set. It is implemented using a list and a set. The list maintains the order of elements
-        and the set ensures that each element is unique. The list is used to maintain the order of elements and the set is
-        used to check if an element is already present in the OrderedSet."""
-        self._items: list[T] = []
-        self._seen: set[T] = set()
+        element is unique like a set. It is implemented using a list of slots and a dict from each item to its slot.
+        Removed items leave a tombstone in their slot, so removing is O(1). A Fenwick tree counts the live slots, so
+        get_index and get_by_index are O(log n) regardless of the tombstones. The tombstones are compacted away once
+        they make up half of the slots."""
+        self._slots: list[T] = []
+        self._positions: dict[T, int] = {}
+        self._tombstones: int = 0
+        self._tree: list[int] = []  # Fenwick tree over the slots, 1 for every live slot and 0 for every tombstone
         if iterable:
             for item in iterable:
                 self.add(item)
 
+    def _compact(self) -> None:
+        """
+        Removes all tombstones, afterwards the slot of every item is its index.
+        :return: None
+        """
+        self._slots = [item for item in self._slots if item is not _TOMBSTONE]
+        self._positions = {item: i for i, item in enumerate(self._slots)}
+        self._tombstones = 0
+        tree: list[int] = [1] * len(self._slots)
+        for i in range(1, len(tree) + 1):  # Builds the tree in O(n), every node adds itself to its parent
+            parent: int = i + (i & -i)
+            if parent <= len(tree):
+                tree[parent - 1] += tree[i - 1]
+        self._tree = tree
+
+    def _count_before(self, slot: int) -> int:
+        """
+        Returns the number of live slots before a slot.
+        :param slot: The slot
+        :return: The number of live slots in front of it
+        """
+        tree: list[int] = self._tree
+        count: int = 0
+        while slot > 0:
+            count += tree[slot - 1]
+            slot &= slot - 1
+        return count
+
+    def _find_slot(self, index: int) -> int:
+        """
+        Returns the slot of the live item with a given index, by descending the Fenwick tree.
+        :param index: The index, 0 <= index < len(self)
+        :return: The slot of the item
+        """
+        tree: list[int] = self._tree
+        slot: int = 0
+        step: int = 1 << len(tree).bit_length()
+        while step:
+            if slot + step <= len(tree) and tree[slot + step - 1] <= index:
+                slot += step
+                index -= tree[slot - 1]
+            step >>= 1
+        return slot
+
     def add(self, item: T) -> None:
         """
         Adds an item to the OrderedSet if it is not already present in the OrderedSet.
         :param item: The item to be added to the OrderedSet.
         :return: None
         """
-        if item not in self._seen:
-            self._items.append(item)
-            self._seen.add(item)
+        if item not in self._positions:
+            self._positions[item] = len(self._slots)
+            self._slots.append(item)
+            i: int = len(self._slots)  # The node of the new slot covers the slots (i - lowbit(i), i]
+            self._tree.append(1 + self._count_before(i - 1) - self._count_before(i - (i & -i)))
 
     def discard(self, item: T) -> None:
         """
@@ -39,9 +91,21 @@ class OrderedSet(_ty.Generic[T]):
         :param item: The item to be removed from the OrderedSet.
         :return: None
         """
-        if item in self._seen:
-            self._items.remove(item)
-            self._seen.remove(item)
+        slot: int | None = self._positions.pop(item, None)
+        if slot is None:
+            return
+        if slot == len(self._slots) - 1:  # The last item needs no tombstone, no other node covers its node
+            self._slots.pop()
+            self._tree.pop()
+        else:
+            self._slots[slot] = _TOMBSTONE
+            self._tombstones += 1
+            i: int = slot + 1
+            while i <= len(self._tree):
+                self._tree[i - 1] -= 1
+                i += i & -i
+            if self._tombstones * 2 > len(self._slots):
+                self._compact()
 
     def remove(self, item: T) -> None:
         """
@@ -50,7 +114,7 @@ class OrderedSet(_ty.Generic[T]):
         :param item: The item to be removed from the OrderedSet.
         :return: None
         """
-        if item not in self._seen:
+        if item not in self._positions:
             raise KeyError(f"{item} not in OrderedSet")
         self.discard(item)
 
@@ -59,8 +123,10 @@ class OrderedSet(_ty.Generic[T]):
         Removes all items from the OrderedSet.
         :return: None
         """
-        self._items.clear()
-        self._seen.clear()
+        self._slots.clear()
+        self._positions.clear()
+        self._tombstones = 0
+        self._tree.clear()
 
     def get_index(self, item: T) -> int:
         """
@@ -68,7 +134,11 @@ class OrderedSet(_ty.Generic[T]):
         :param item: The item whose index is to be returned.
         :return: The index of the item in the OrderedSet.
         """
-        return self._items.index(item)
+        try:
+            slot: int = self._positions[item]
+        except KeyError:
+            raise ValueError(f"{item} is not in OrderedSet") from None
+        return self._count_before(slot) if self._tombstones else slot
 
     def get_by_index(self, index: int) -> T:
         """
@@ -76,21 +146,30 @@ class OrderedSet(_ty.Generic[T]):
         :param index: The index of the item to be returned.
         :return: The item at the given index in the OrderedSet.
         """
-        return self._items[index]
+        if not self._tombstones:
+            return self._slots[index]
+        size: int = len(self._positions)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("OrderedSet index out of range")
+        return self._slots[self._find_slot(index)]
 
     def to_list(self) -> list[T]:
         """
         Returns the items in the OrderedSet as a list.
         :return: The items in the OrderedSet as a list.
         """
-        return self._items
+        if self._tombstones:
+            return [item for item in self._slots if item is not _TOMBSTONE]
+        return list(self._slots)
 
     def to_set(self) -> set[T]:
         """
         Returns the items in the OrderedSet as a set.
         :return: The items in the OrderedSet as a set.
         """
-        return self._seen
+        return set(self._positions)
 
     @staticmethod
     def from_list(lst: _ty.List[T]) -> 'OrderedSet':
@@ -100,19 +179,40 @@ class OrderedSet(_ty.Generic[T]):
     def from_set(st: _ty.Set[T]) -> 'OrderedSet':
         return OrderedSet(st)
 
+    def __getstate__(self) -> list[T]:
+        """
+        Returns the live items for copying and pickling, the tombstone is not part of the state.
+        :return: The items in order.
+        """
+        return self.to_list()
+
+    def __setstate__(self, items: list[T]) -> None:
+        """
+        Restores a copied or unpickled OrderedSet from its items.
+        :param items: The items in order.
+        :return: None
+        """
+        self.__init__(items)
+
     def __len__(self):
         """
         Returns the number of items in the OrderedSet.
         :return: The number of items in the OrderedSet.
         """
-        return len(self._items)
+        return len(self._positions)
 
     def __iter__(self):
         """
         Returns an iterator over the items in the OrderedSet.
         :return: An iterator over the items in the OrderedSet.
         """
-        return iter(self._items)
+        slots: list[T] = self._slots
+        for item in slots:  # Items may be added or removed while iterating
+            if item is _TOMBSTONE:
+                continue
+            if slots is not self._slots and item not in self._positions:  # Removed after a compaction
+                continue
+            yield item
 
     def __contains__(self, item: T):
         """
@@ -120,14 +220,14 @@ class OrderedSet(_ty.Generic[T]):
         :param item: The item to be checked for presence in the OrderedSet.
         :return: True if the item is present in the OrderedSet, False otherwise.
         """
-        return item in self._seen
+        return item in self._positions
 
     def __repr__(self):
         """
         Returns a string representation of the OrderedSet.
         :return: A string representation of the OrderedSet.
         """
-        return f"OrderedSet({self._items})"
+        return f"OrderedSet({list(self)})"
 
     def __eq__(self, other):
         """
@@ -136,7 +236,7 @@ class OrderedSet(_ty.Generic[T]):
         :return: True if the OrderedSet is equal to the other OrderedSet, False otherwise.
         """
         if isinstance(other, OrderedSet):
-            return self._items == other._items
+            return list(self) == list(other)
         return False
 
     def __or__(self, other):
@@ -147,7 +247,7 @@ class OrderedSet(_ty.Generic[T]):
         """
         if not isinstance(other, (OrderedSet, set)):
             return NotImplemented
-        return OrderedSet(self._items + [item for item in other if item not in self])
+        return OrderedSet([*self, *(item for item in other if item not in self)])
 
     def __and__(self, other):
         """
@@ -0,0 +1,171 @@
+"""TBA"""
+from collections import deque
+import threading
+import logging
+import json
+import time
+
+from aplustools.io import ActLogger
+from utils.singleton import singleton
+
+# Standard typing imports for aps
+import collections.abc as _a
+import abc as _abc
+import typing as _ty
+import types as _ts
+
+TRACE: int = 5  # Finer than logging.DEBUG, used for events emitted on every simulation step
+DISABLED: int = logging.CRITICAL + 10  # Level of a tracer without sinks, no event reaches it
+logging.addLevelName(TRACE, "TRACE")
+
+TraceEventT = _ty.Tuple[float, str, int, _ty.Dict[str, _ty.Any]]  # timestamp, event, level, fields
+
+
+class TraceSink(_abc.ABC):
+    """Receives the events of the Tracer"""
+
+    @_abc.abstractmethod
+    def write(self, timestamp: float, event: str, level: int, fields: _ty.Dict[str, _ty.Any]) -> None:
+        """Writes one event
+
+        :param timestamp: The time the event was emitted at, in seconds since the epoch
+        :param event: The name of the event, e.g. "dfa.transition"
+        :param level: The level of the event
+        :param fields: The data of the event
+        :return: None
+        """
+        raise NotImplementedError("write must be implemented in a subclass.")
+
+    def close(self) -> None:
+        """Releases the resources of the sink, called when it is removed from the tracer
+
+        :return: None
+        """
+        return None
+
+
+class RingBufferSink(TraceSink):
+    """Keeps the last events in memory"""
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        self._events: _ty.Deque[TraceEventT] = deque(maxlen=max(1, capacity))
+
+    def write(self, timestamp: float, event: str, level: int, fields: _ty.Dict[str, _ty.Any]) -> None:
+        self._events.append((timestamp, event, level, fields))
+
+    def get_events(self) -> _ty.List[TraceEventT]:
+        """Returns the kept events, oldest first
+
+        :return: The events as (timestamp, event, level, fields)
+        """
+        return list(self._events)
+
+    def clear(self) -> None:
+        """Removes all kept events
+
+        :return: None
+        """
+        self._events.clear()
+
+
+class JsonLinesSink(TraceSink):
+    """Appends every event as one JSON object per line to a file"""
+
+    def __init__(self, file_path: str) -> None:
+        self._file: _ty.TextIO = open(file_path, "a", encoding="utf-8")
+        self._lock: threading.Lock = threading.Lock()
+
+    def write(self, timestamp: float, event: str, level: int, fields: _ty.Dict[str, _ty.Any]) -> None:
+        line: str = json.dumps({"time": timestamp, "event": event, "level": logging.getLevelName(level), **fields},
+                               default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class LoggerSink(TraceSink):
+    """Forwards every event to the ActLogger, TRACE events are logged as DEBUG"""
+
+    def write(self, timestamp: float, event: str, level: int, fields: _ty.Dict[str, _ty.Any]) -> None:
+        ActLogger().log(max(level, logging.DEBUG),
+                        f"{event} " + " ".join(f"{key}={value!r}" for key, value in fields.items()))
+
+
+@singleton
+class Tracer:
+    """Level gated tracing of named events with exchangeable sinks.
+
+    The level of the tracer is the lowest level of its sinks, DISABLED without sinks. Call sites in hot paths check it
+    before building an event, so disabled tracing costs a single comparison:
+
+        if tracer.level <= TRACE:
+            tracer.emit("dfa.transition", TRACE, state=state.get_name())
+    """
+
+    def __init__(self) -> None:
+        self.level: int = DISABLED
+        self._sinks: _ty.Tuple[_ty.Tuple[TraceSink, int], ...] = ()  # Replaced as a whole, so emit needs no lock
+        self._lock: threading.Lock = threading.Lock()
+
+    def add_sink(self, sink: TraceSink, level: int = TRACE) -> None:
+        """Adds a sink receiving all events of at least the given level
+
+        :param sink: The sink
+        :param level: The lowest level written to the sink
+        :return: None
+        """
+        with self._lock:
+            self._sinks = (*self._sinks, (sink, level))
+            self.level = min(sink_level for _, sink_level in self._sinks)
+
+    def remove_sink(self, sink: TraceSink) -> None:
+        """Removes and closes a sink
+
+        :param sink: The sink
+        :return: None
+        """
+        with self._lock:
+            self._sinks = tuple((other, level) for other, level in self._sinks if other is not sink)
+            self.level = min((level for _, level in self._sinks), default=DISABLED)
+        sink.close()
+
+    def clear_sinks(self) -> None:
+        """Removes and closes all sinks, which disables tracing
+
+        :return: None
+        """
+        for sink, _ in self._sinks:
+            self.remove_sink(sink)
+
+    def get_sinks(self) -> _ty.List[TraceSink]:
+        """Returns the sinks
+
+        :return: The sinks
+        """
+        return [sink for sink, _ in self._sinks]
+
+    def is_enabled(self, level: int = TRACE) -> bool:
+        """Returns whether events of a level reach at least one sink
+
+        :param level: The level
+        :return: True if events of the level are written
+        """
+        return level >= self.level
+
+    def emit(self, event: str, level: int = TRACE, **fields: _ty.Any) -> None:
+        """Writes an event to all sinks accepting its level
+
+        :param event: The name of the event, e.g. "dfa.transition"
+        :param level: The level of the event
+        :param fields: The data of the event
+        :return: None
+        """
+        if level < self.level:
+            return
+        timestamp: float = time.time()
+        for sink, sink_level in self._sinks:
+            if level >= sink_level:
+                sink.write(timestamp, event, level, fields)
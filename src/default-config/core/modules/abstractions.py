@@ -1,12 +1,8 @@
 """Abstract api interfaces for everything"""
+from __future__ import annotations
 import threading
 
-from PySide6.QtWidgets import QWidget, QApplication, QMainWindow
-from PySide6.QtGui import QColor
-from PySide6.QtCore import Qt
-
 from utils.OrderedSet import OrderedSet
-from automaton.base.QAutomatonInputWidget import QAutomatonInputOutput
 
 # Standard typing imports for aps
 import abc as _abc
@@ -14,6 +10,13 @@ import collections.abc as _a
 import typing as _ty
 import types as _ts
 
+if _ty.TYPE_CHECKING:  # Qt is only needed for annotations, this keeps the backend importable without PySide6
+    from PySide6.QtWidgets import QWidget, QApplication, QMainWindow
+    from PySide6.QtGui import QColor
+    from PySide6.QtCore import Qt
+
+    from automaton.base.QAutomatonInputWidget import QAutomatonInputOutput
+
 T = _ty.TypeVar("T")
 
 
@@ -186,6 +189,12 @@ class IBackend(_abc.ABC):
         """
         ...
 
+    def wake_up(self) -> None:
+        """
+        Wakes up the backend if it is waiting, so that it notices a set stop event at once.
+        """
+        ...
+
 
 class IUiState(_abc.ABC):
 
@@ -437,6 +446,31 @@ class IUiAutomaton(_abc.ABC):
         """Deletes a transition from the automaton."""
         raise NotImplementedError("This method must be implemented by subclasses.")
 
+    @_abc.abstractmethod
+    def get_outgoing_transitions(self, state: 'IUiState') -> OrderedSet['IUiTransition']:
+        """Returns the transitions starting in a state."""
+        raise NotImplementedError("This method must be implemented by subclasses.")
+
+    @_abc.abstractmethod
+    def get_incoming_transitions(self, state: 'IUiState') -> OrderedSet['IUiTransition']:
+        """Returns the transitions leading to a state."""
+        raise NotImplementedError("This method must be implemented by subclasses.")
+
+    @_abc.abstractmethod
+    def get_reachable_states(self, state: 'IUiState | None' = None) -> OrderedSet['IUiState']:
+        """Returns the states reachable from a state (the start state if None)."""
+        raise NotImplementedError("This method must be implemented by subclasses.")
+
+    @_abc.abstractmethod
+    def minimize(self) -> '_result.Result':
+        """Replaces a deterministic automaton by its minimal equivalent, returns the mapping of the states."""
+        raise NotImplementedError("This method must be implemented by subclasses.")
+
+    @_abc.abstractmethod
+    def get_version(self) -> int:
+        """Returns the version of the structure, which changes whenever it is edited."""
+        raise NotImplementedError("This method must be implemented by subclasses.")
+
     @_abc.abstractmethod
     def get_automaton_type(self) -> str:
         """Returns the type of the automaton."""
@@ -6,6 +6,10 @@ from returns import result as _result
 
 # Bridge Import
 from automaton.UiBridge import UiBridge
+from automaton.automatonBridge import AutomatonBridge
+from automaton.automatonSimulator import AutomatonSimulator
+from automaton.compiledAutomaton import CompiledDFA
+from automaton.minimization import MinimizedDFA, minimize
 from automaton.UiSettingsProvider import UiSettingsProvider
 from automaton.base.QAutomatonInputWidget import QAutomatonInputOutput
 
@@ -17,12 +21,19 @@ from aplustools.io import ActLogger
 from utils.OrderedSet import OrderedSet
 from utils.IOManager import IOManager
 from utils.staticSignal import Signal
+from utils.tracer import Tracer
 
 # Standard typing imports for aps
+import collections.abc as _a
 import typing as _ty
+import itertools
+import weakref
+import logging
 
 # Docs generated with Github Copilot
 
+_uids: _a.Iterator[int] = itertools.count()  # Shared by states and transitions, so an uid is never issued twice
+
 
 class CardinalDirection:
     """Enum for cardinal directions"""
@@ -44,6 +55,8 @@ class UiState(IUiState):  # TODO: mypy does not like that IUiState is of type An
         self._display_text: str = display_text
         self._type: str = node_type
         self._is_active: bool = False
+        self._uid: int = next(_uids)
+        self._change_callback: weakref.WeakMethod | None = None  # Set by the automaton holding the state
 
     def set_colour(self, colour: QColor) -> None:
         """Sets the colour of the state.
@@ -67,10 +80,53 @@ class UiState(IUiState):  # TODO: mypy does not like that IUiState is of type An
         :param display_text: The display text of the state.
         :return: None
         """
+        if display_text == self._display_text:
+            return
         self._display_text = display_text
+        self._notify_change()
 
     def set_type(self, state_type: _ty.Literal['default', 'start', 'end']):
+        if state_type == self._type:
+            return
         self._type = state_type
+        self._notify_change()
+
+    def get_uid(self) -> int:
+        """Gets the unique id of the state, which stays the same while the state is edited.
+
+        :return: The unique id of the state.
+        """
+        return self._uid
+
+    def _set_change_callback(self, callback: _ty.Callable[['UiState'], None] | None) -> None:
+        """Sets the method notified when the name or the type of the state changes.
+
+        Only a weak reference is kept, so the state does not keep its automaton alive.
+
+        :param callback: The bound method, None to stop notifying
+        :return: None
+        """
+        self._change_callback = weakref.WeakMethod(callback) if callback is not None else None
+
+    def _notify_change(self) -> None:
+        """Notifies the change callback, if it is set and still alive.
+
+        :return: None
+        """
+        if self._change_callback is None:
+            return
+        callback: _ty.Callable[['UiState'], None] | None = self._change_callback()
+        if callback is not None:
+            callback(self)
+
+    def __getstate__(self) -> _ty.Dict[str, _ty.Any]:
+        """Drops the change callback when the state is copied, the automaton holding the copy sets a new one.
+
+        :return: The attributes of the state
+        """
+        attributes: _ty.Dict[str, _ty.Any] = self.__dict__.copy()
+        attributes["_change_callback"] = None
+        return attributes
 
     def set_active(self, value: bool) -> None:
         self._is_active = value
@@ -114,17 +170,24 @@ class UiState(IUiState):  # TODO: mypy does not like that IUiState is of type An
         """Deactivates the state."""
         self._is_active = False
 
-    def __eq__(self, other: _ty.Self):
-        if not isinstance(other, UiState):
-            return False
+    def has_same_values(self, other: 'UiState') -> bool:
+        """Checks if another state looks and behaves the same, regardless of its uid.
+
+        :param other: The other state.
+        :return: True if colour, position, display text, type and activation are equal, False otherwise."""
         return (self._colour == other.get_colour()
                 and self._position == other.get_position()
                 and self._display_text == other.get_display_text()
                 and self._type == other.get_type()
                 and self._is_active == other.is_active())
 
+    def __eq__(self, other: _ty.Self):
+        if not isinstance(other, UiState):
+            return False
+        return self._uid == other.get_uid()
+
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self._uid)  # Stays the same when the state is moved, renamed or activated
 
 
 @auto_repr_with_privates
@@ -139,6 +202,8 @@ class UiTransition(IUiTransition):
         self._to_state_connecting_point: _ty.Literal['n', 's', 'e', 'w'] = to_state_connecting_point
 
         self._is_active: bool = False
+        self._uid: int = next(_uids)
+        self._change_callback: weakref.WeakMethod | None = None  # Set by the automaton holding the transition
 
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
@@ -225,6 +290,44 @@ class UiTransition(IUiTransition):
         :return: None
         """
         self._condition = condition
+        self._notify_change()
+
+    def get_uid(self) -> int:
+        """Gets the unique id of the transition, which stays the same while the transition is edited.
+
+        :return: The unique id of the transition.
+        """
+        return self._uid
+
+    def _set_change_callback(self, callback: _ty.Callable[['UiTransition'], None] | None) -> None:
+        """Sets the method notified when the condition of the transition changes.
+
+        Only a weak reference is kept, so the transition does not keep its automaton alive.
+
+        :param callback: The bound method, None to stop notifying
+        :return: None
+        """
+        self._change_callback = weakref.WeakMethod(callback) if callback is not None else None
+
+    def _notify_change(self) -> None:
+        """Notifies the change callback, if it is set and still alive.
+
+        :return: None
+        """
+        if self._change_callback is None:
+            return
+        callback: _ty.Callable[['UiTransition'], None] | None = self._change_callback()
+        if callback is not None:
+            callback(self)
+
+    def __getstate__(self) -> _ty.Dict[str, _ty.Any]:
+        """Drops the change callback when the transition is copied, the automaton holding the copy sets a new one.
+
+        :return: The attributes of the transition
+        """
+        attributes: _ty.Dict[str, _ty.Any] = self.__dict__.copy()
+        attributes["_change_callback"] = None
+        return attributes
 
     def get_condition(self) -> _ty.List[str]:
         """Gets the condition of the transition.
@@ -233,7 +336,11 @@ class UiTransition(IUiTransition):
         """
         return self._condition
 
-    def __eq__(self, other: _ty.Self):
+    def has_same_values(self, other: 'UiTransition') -> bool:
+        """Checks if another transition connects the same states in the same way, regardless of its uid.
+
+        :param other: The other transition.
+        :return: True if states, connecting points, activation and condition are equal, False otherwise."""
         return (self._from_state == other.get_from_state()
                 and self._from_state_connecting_point == other.get_from_state_connecting_point()
                 and self._to_state == other.get_to_state()
@@ -241,12 +348,21 @@ class UiTransition(IUiTransition):
                 and self._is_active == other.is_active()
                 and self._condition == other.get_condition())
 
+    def __eq__(self, other: _ty.Self):
+        if not isinstance(other, UiTransition):
+            return False
+        return self._uid == other.get_uid()
+
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self._uid)  # Stays the same when the transition is edited or activated
 
 
 @auto_repr_with_privates
 class UiAutomaton(IUiAutomaton):
+    _versions: _a.Iterator[int] = itertools.count(1)  # Shared by all automata, so a version is never issued twice
+    # The changes are sent as a diff, as long as there are at most this many per state and transition
+    MAX_DIFF_RATIO: float = 0.5
+
     def __init__(self, automaton_type: str | None, author: str, state_types_with_design: _ty.Dict[str, _ty.Any],
                  token_lists: _ty.List[_ty.List[str]] = [], changeable_token_lists: _ty.List[bool] = [],
                  transition_pattern: _ty.List[int] = []):
@@ -258,6 +374,9 @@ class UiAutomaton(IUiAutomaton):
 
         self._states: OrderedSet[UiState] = OrderedSet()
         self._transitions: OrderedSet[UiTransition] = OrderedSet()
+        # Adjacency, every state maps to the transitions starting/ending in it
+        self._outgoing: _ty.Dict[UiState, OrderedSet[UiTransition]] = {}
+        self._incoming: _ty.Dict[UiState, OrderedSet[UiTransition]] = {}
 
         self._start_state: UiState | None = None
         self._input: _ty.List[_ty.Any] = []
@@ -266,6 +385,15 @@ class UiAutomaton(IUiAutomaton):
         self._bridge: UiBridge = UiBridge()
         self._input_widget: _ty.Type[QAutomatonInputOutput] | None = None
 
+        # Every change of the structure issues a new version. The journal holds the structural changes made since the
+        # version that was last sent to the backend, edited states and transitions are collected separately, as
+        # only their latest values matter.
+        self._version: int = next(UiAutomaton._versions)
+        self._sent_version: int | None = None
+        self._journal: _ty.List[_ty.Tuple[str, UiState | UiTransition]] = []
+        self._edited_states: OrderedSet[UiState] = OrderedSet()
+        self._edited_transitions: OrderedSet[UiTransition] = OrderedSet()
+
     def __new__(cls, *args, **kwargs):
         return object.__new__(cls)
 
@@ -296,15 +424,125 @@ class UiAutomaton(IUiAutomaton):
         :param state: The state to be added.
         :return: None
         """
+        if state in self._states:
+            return
         self._states.add(state)
+        self._outgoing.setdefault(state, OrderedSet())
+        self._incoming.setdefault(state, OrderedSet())
+        state._set_change_callback(self._state_edited)
+        self._record_change("ADD_STATE", state)
 
     def add_transition(self, transition: UiTransition) -> None:
         """Adds a transition to the automaton.
 
+        The states of a transition must not be changed while it is part of the automaton.
+
         :param transition: The transition to be added.
         :return: None
         """
+        if transition in self._transitions:
+            return
         self._transitions.add(transition)
+        self._outgoing.setdefault(transition.get_from_state(), OrderedSet()).add(transition)
+        self._incoming.setdefault(transition.get_to_state(), OrderedSet()).add(transition)
+        transition._set_change_callback(self._transition_edited)
+        self._record_change("ADD_TRANSITION", transition)
+
+    def __setstate__(self, attributes: _ty.Dict[str, _ty.Any]) -> None:
+        """Restores a copied automaton and notifies it of changes to its copied states and transitions.
+
+        :param attributes: The attributes of the automaton
+        :return: None
+        """
+        self.__dict__.update(attributes)
+        # Only the live states and transitions, deleted ones recorded in the journal stay detached
+        for state in self._states:
+            state._set_change_callback(self._state_edited)
+        for transition in self._transitions:
+            transition._set_change_callback(self._transition_edited)
+
+    def get_version(self) -> int:
+        """Gets the version of the structure, which changes whenever a state or transition is added, removed or
+        edited.
+
+        :return: The version of the structure.
+        """
+        return self._version
+
+    def _record_change(self, change_type: str, item: UiState | UiTransition) -> None:
+        """Issues a new version and adds a structural change to the journal.
+
+        :param change_type: The type of the change.
+        :param item: The added or removed state or transition.
+        :return: None
+        """
+        self._version = next(UiAutomaton._versions)
+        if self._sent_version is not None:
+            self._journal.append((change_type, item))
+
+    def _state_edited(self, state: UiState) -> None:
+        """Issues a new version after the name or the type of a state changed.
+
+        :param state: The edited state.
+        :return: None
+        """
+        self._version = next(UiAutomaton._versions)
+        if self._sent_version is not None:
+            self._edited_states.add(state)
+
+    def _transition_edited(self, transition: UiTransition) -> None:
+        """Issues a new version after the condition of a transition changed.
+
+        :param transition: The edited transition.
+        :return: None
+        """
+        self._version = next(UiAutomaton._versions)
+        if self._sent_version is not None:
+            self._edited_transitions.add(transition)
+
+    def _reset_journal(self) -> None:
+        """Forgets the version sent to the backend, so the next simulation sends the whole structure.
+
+        :return: None
+        """
+        self._sent_version = None
+        self._journal.clear()
+        self._edited_states.clear()
+        self._edited_transitions.clear()
+
+    def get_outgoing_transitions(self, state: UiState) -> OrderedSet[UiTransition]:
+        """Gets the transitions starting in a state, in the order they were added.
+
+        :param state: The state.
+        :return: The outgoing transitions, they must not be modified.
+        """
+        return self._outgoing.get(state) or OrderedSet()
+
+    def get_incoming_transitions(self, state: UiState) -> OrderedSet[UiTransition]:
+        """Gets the transitions leading to a state, in the order they were added.
+
+        :param state: The state.
+        :return: The incoming transitions, they must not be modified.
+        """
+        return self._incoming.get(state) or OrderedSet()
+
+    def get_reachable_states(self, state: UiState | None = None) -> OrderedSet[UiState]:
+        """Gets all states reachable from a state, in breadth first order.
+
+        :param state: The state to start from, the start state if None.
+        :return: The reachable states, including the state itself.
+        """
+        if state is None:
+            state = self._start_state
+        reachable: OrderedSet[UiState] = OrderedSet()
+        if state is None:
+            return reachable
+
+        reachable.add(state)
+        for current in reachable:  # Newly added states are visited too
+            for transition in self.get_outgoing_transitions(current):
+                reachable.add(transition.get_to_state())
+        return reachable
 
     def get_automaton_type(self) -> str:
         """Gets the automaton type of the automaton.
@@ -316,6 +554,7 @@ class UiAutomaton(IUiAutomaton):
     def set_automaton_type(self, automaton_type: str, load_settings: bool = True) -> None:
         """Sets the type of the Automaton"""
         self._type = automaton_type
+        self._reset_journal()  # The backend has to build an automaton of the new type
 
         if load_settings:
             settings_loader: UiSettingsProvider = UiSettingsProvider()
@@ -323,9 +562,8 @@ class UiAutomaton(IUiAutomaton):
             automaton_settings = settings_loader.get_settings(automaton_type)
             io_manager: IOManager = IOManager()
 
-            print(f'settings: {automaton_settings.token_lists}')
-
             if automaton_settings is not None:
+                Tracer().emit("ui.settings", logging.DEBUG, token_lists=automaton_settings.token_lists)
                 settings_loader.apply_to_automaton(self, None, automaton_settings)
 
                 io_manager.debug(f"Applied settings to {automaton_type}-automaton", "")
@@ -438,10 +676,7 @@ class UiAutomaton(IUiAutomaton):
 
             # Transitions
             transitions_list: _ty.List[_ty.Dict[str, _ty.Any]] = []
-            for transition in self._transitions:
-                if transition.get_from_state() != state:
-                    continue
-
+            for transition in self.get_outgoing_transitions(state):
                 transition_data: _ty.Dict[str, _ty.Any] = {}
                 transition_to_state: UiState = transition.get_to_state()
 
@@ -456,33 +691,80 @@ class UiAutomaton(IUiAutomaton):
 
         return serialised_structure
 
+    def _serialise_changes_for_simulation(self) -> _ty.List[_ty.Dict[str, _ty.Any]]:
+        """Serialises the changes made since the version last sent to the backend.
+
+        The structural changes come first, in the order they were made, the edits follow with the current values.
+        States and transitions are referred to by their uid.
+
+        :return: The serialised changes.
+        """
+        serialised_changes: _ty.List[_ty.Dict[str, _ty.Any]] = []
+
+        for change_type, item in self._journal:
+            change: _ty.Dict[str, _ty.Any] = {"change": change_type, "uid": item.get_uid()}
+            match change_type:
+                case "ADD_STATE":
+                    change["name"] = item.get_display_text()
+                    change["type"] = item.get_type()
+                case "ADD_TRANSITION":
+                    change["from"] = item.get_from_state().get_uid()
+                    change["to"] = item.get_to_state().get_uid()
+                    change["condition"] = item.get_condition()
+            serialised_changes.append(change)
+
+        for state in self._edited_states:
+            serialised_changes.append({"change": "EDIT_STATE", "uid": state.get_uid(),
+                                       "name": state.get_display_text(), "type": state.get_type()})
+        for transition in self._edited_transitions:
+            serialised_changes.append({"change": "EDIT_TRANSITION", "uid": transition.get_uid(),
+                                       "condition": transition.get_condition()})
+        return serialised_changes
+
     def simulate(self, input: _ty.List[_ty.Any], notification_callback: _ty.Callable or None) -> _result.Result:
         """Simulates the automaton with a given input.
 
         :param input: The input to the automaton.
-        :param notification_callback: The Function which should be executed if the simulation has ended
+        :param notification_callback: The Function which should be executed if the simulation has ended, it is called
+                                      from the backend thread as soon as the result is ready, so it has to be thread
+                                      safe (e.g. hand over to the gui thread through a queued Qt signal)
         :return _result.Result: Returns success, if the simulation request was successfully send to the backend"""
         structure: _ty.Dict[str, _ty.Any] = {}
         structure["action"] = "SIMULATION"
         structure["id"] = f"{self.get_author().lower()}:{self.get_automaton_type().lower()}"
+        structure["mode"] = "VISUAL"  # The ui animates every step
         structure["input"] = input
-        structure["content"] = self._serialise_structure_for_simulation()
 
-        if not structure["content"]:
+        if not self._states:
             log_message: str = "No structure found for simulation!"
             ActLogger().error(log_message)
             IOManager().info(log_message, "Can not simulate an automaton without any contents", True, False)
             return _result.Failure(log_message)
 
+        # The backend still holds the version last sent, so only the changes since then are sent
+        change_count: int = len(self._journal) + len(self._edited_states) + len(self._edited_transitions)
+        if (self._sent_version is not None and self._bridge.get_structure_version() == self._sent_version
+                and change_count <= self.MAX_DIFF_RATIO * (len(self._states) + len(self._transitions))):
+            structure["base_version"] = self._sent_version
+            structure["changes"] = self._serialise_changes_for_simulation()
+        else:
+            structure["content"] = self._serialise_structure_for_simulation()
+            structure["state_uids"] = [state.get_uid() for state in self._states]
+            structure["transition_uids"] = [transition.get_uid() for transition in self._transitions]
+        structure["structure_version"] = self._version
+        self._reset_journal()
+        self._sent_version = self._version
+
         # send to bridge
 
         self.stop_simulation()
         self._bridge.set_simulation_data_status(False)
         if notification_callback is not None:
-            signal: Signal[_ty.Callable] = Signal(notification_callback)
+            signal: Signal[_ty.Callable] = Signal(notification_callback, add_to_cache=False)
             self._bridge.set_signal(signal)
 
         self._bridge.clear_simulation_queue()
+        structure["job_id"] = self._bridge.new_job_id()
         self._bridge.add_backend_item(structure)
         return _result.Success("The simulation request was successfully send!")
 
@@ -495,12 +777,8 @@ class UiAutomaton(IUiAutomaton):
         if not self._bridge.has_simulation_items():
             return None
 
-        # Remove all other activations
-        for state in self.get_states():
-            state._deactivate()
-
-        for transition in self.get_transitions():
-            transition._deactivate()
+        # Remove the activations of the last update
+        self._clear_activations()
 
         # Handle bridge
         simulation_task: _ty.Dict[str, _ty.Any] = self._bridge.get_simulation_task()
@@ -548,8 +826,19 @@ class UiAutomaton(IUiAutomaton):
             transition._activate()
             self.set_active_transition(transition)
 
-        # Automaton data
-        self._input = automaton_data["input"]
+        # Automaton data, only the first packet carries the whole input, later ones carry the changed cells
+        if "input" in automaton_data:
+            self._input = list(automaton_data["input"])
+        else:
+            if automaton_data.get("input_shift", 0):  # Cells inserted in front, e.g. by a tape growing to the left
+                self._input[:0] = [None] * automaton_data["input_shift"]
+            for i, token in automaton_data["input_changes"]:
+                if i < len(self._input):
+                    self._input[i] = token
+                else:
+                    self._input.append(token)
+            del self._input[automaton_data["input_length"]:]
+            automaton_data["input"] = self._input
         self._pointer_index = automaton_data["pointer_index"]
 
         return _result.Success(automaton_data)
@@ -563,6 +852,7 @@ class UiAutomaton(IUiAutomaton):
 
     def set_author(self, author: str) -> None:
         self._author = author
+        self._reset_journal()  # The author is part of the automaton id
 
     def get_token_lists(self) -> _ty.List[_ty.List[str]]:
         """Gets the token lists of the automaton.
@@ -639,6 +929,11 @@ class UiAutomaton(IUiAutomaton):
         :return: None
         """
         self._transitions.remove(transition)
+        self._outgoing[transition.get_from_state()].discard(transition)
+        self._incoming[transition.get_to_state()].discard(transition)
+        transition._set_change_callback(None)
+        self._edited_transitions.discard(transition)
+        self._record_change("REMOVE_TRANSITION", transition)
 
     def delete_state(self, state: UiState) -> None:
         """ Deletes a state and all its transitions (inbound and outbound)
@@ -647,25 +942,85 @@ class UiAutomaton(IUiAutomaton):
         :return: None
         """
         # delete all transitions to/from this state
-        for transition in self.get_transitions():
-            if transition.get_from_state() == state or transition.get_to_state() == state:
+        for transition in [*self.get_outgoing_transitions(state), *self.get_incoming_transitions(state)]:
+            if transition in self._transitions:  # Self loops are outgoing and incoming
                 self.delete_transition(transition)
 
         # delete actual state
         self._states.remove(state)
+        self._outgoing.pop(state, None)
+        self._incoming.pop(state, None)
+        state._set_change_callback(None)
+        self._edited_states.discard(state)
+        self._record_change("REMOVE_STATE", state)
 
-    def stop_simulation(self) -> None:
-        for state in self._states:
-            state._deactivate()
+    def minimize(self) -> _result.Result:
+        """Replaces a deterministic automaton by its minimal equivalent.
 
-        for transition in self._transitions:
-            transition._deactivate()
+        The automaton is built and minimized in process. States not reachable from the start state are deleted,
+        equivalent states are merged into the one added first, the transitions leading into a merged state are
+        redirected to it. A running simulation is stopped.
+
+        :return: Success containing a dict mapping every original state to the state it was merged into (None if it
+                 was deleted as unreachable), Failure if the automaton could not be built or is not deterministic.
+        """
+        if not self._states:
+            return _result.Failure("Can not minimize an automaton without any contents")
+
+        request: _ty.Dict[str, _ty.Any] = {
+            "id": f"{self.get_author().lower()}:{self.get_automaton_type().lower()}",
+            "content": self._serialise_structure_for_simulation(), "input": []}
+        build_result: _result.Result = AutomatonSimulator(request, lambda _: None, lambda *_: None).build()
+        if not isinstance(build_result, _result.Success):
+            return build_result
+        automaton: AutomatonBridge = build_result.unwrap()
+        if not automaton.is_deterministic():
+            return _result.Failure(f"Can not minimize the non deterministic {self.get_automaton_type()}-automaton")
+
+        # The backend numbers the states by their index, the first state is the start state
+        minimized: MinimizedDFA = minimize(CompiledDFA.from_automaton(automaton.get_implementation()))
+        self.stop_simulation()
+        states: _ty.List[UiState] = list(self._states)
+        state_map: _ty.Dict[UiState, UiState | None] = {}
+        for i, state in enumerate(states):
+            minimal_state: int = minimized.map_state(i)
+            state_map[state] = (states[minimized.get_representative(minimal_state)]
+                                if minimal_state != CompiledDFA.DEAD_STATE else None)
+
+        for state, kept_state in state_map.items():
+            if kept_state is state:
+                continue
+            if kept_state is not None:
+                for transition in list(self.get_incoming_transitions(state)):
+                    if state_map[transition.get_from_state()] is transition.get_from_state():
+                        self.delete_transition(transition)
+                        transition.set_to_state(kept_state)
+                        self.add_transition(transition)
+            self.delete_state(state)
+
+        ActLogger().info(f"Minimized the {self.get_automaton_type()}-automaton from {len(states)} to "
+                         f"{len(self._states)} states")
+        return _result.Success(state_map)
+
+    def _clear_activations(self) -> None:
+        """Deactivates the state and transition activated by the last simulation update, only these can be active
+
+        :return: None
+        """
+        if self._active_state is not None:
+            self._active_state._deactivate()
+        if self._active_transition is not None:
+            self._active_transition._deactivate()
+
+    def stop_simulation(self) -> None:
+        self._clear_activations()
 
         self._input = None
         self._pointer_index = None
         self.set_active_state(None)
         self.set_active_transition(None)
 
+        self._bridge.cancel_jobs()  # Frees the backend from the running simulation
         self._bridge.set_simulation_data_status(False)
         self._bridge.clear_simulation_queue()
 
@@ -690,8 +1045,16 @@ class UiAutomaton(IUiAutomaton):
         :return: None
         """
         self._type = None
+        for state in self._states:
+            state._set_change_callback(None)
+        for transition in self._transitions:
+            transition._set_change_callback(None)
         self._states.clear()
         self._transitions.clear()
+        self._outgoing.clear()
+        self._incoming.clear()
+        self._version = next(UiAutomaton._versions)
+        self._reset_journal()
 
         self._start_state = None
         self._input = None
@@ -707,14 +1070,19 @@ class UiAutomaton(IUiAutomaton):
         self._input_widget = input_widget
 
     def __eq__(self, other: _ty.Self):
-        print(self._type)
         try:
-            print(other.get_automaton_type())
+            other_type: str = other.get_automaton_type()
         except:
             # print(other, 'has no attribute get_automaton_type')
             return
-        return (self._type == other.get_automaton_type()
+        other_states: _ty.Dict[int, UiState] = {state.get_uid(): state for state in other.get_states()}
+        other_transitions: _ty.Dict[int, UiTransition] = {transition.get_uid(): transition
+                                                          for transition in other.get_transitions()}
+        return (self._type == other_type
                 and self._states == other.get_states()
                 and self._transitions == other.get_transitions()
+                and all(state.has_same_values(other_states[state.get_uid()]) for state in self._states)
+                and all(transition.has_same_values(other_transitions[transition.get_uid()])
+                        for transition in self._transitions)
                 and self._start_state == other.get_start_state()
                 and self._state_types_with_design == other.get_state_types_with_design())
@@ -1,5 +1,6 @@
 import json
-from queue import Queue
+from queue import Queue, Empty
+from threading import Lock
 from utils.staticContainer import StaticContainer
 from utils.staticSignal import Signal
 
@@ -32,6 +33,14 @@ class UiBridge:
     _simulation_data_ready: StaticContainer[bool] = StaticContainer(False)
     _data_ready_signal: StaticContainer[Signal[_ty.Callable]] = StaticContainer(None)
 
+    # Simulation jobs, every job up to the cancelled job id is cancelled
+    _job_lock: Lock = Lock()
+    _last_job_id: StaticContainer[int] = StaticContainer(0)
+    _cancelled_job_id: StaticContainer[int] = StaticContainer(0)
+
+    # Version of the ui structure the backend holds a built automaton of, None if it holds none
+    _structure_version: StaticContainer[int | None] = StaticContainer(None)
+
     # data ready
     def set_signal(self, signal: Signal[_ty.Callable]) -> None:
         """  Sets a new signal
@@ -48,6 +57,58 @@ class UiBridge:
         """
         return self._data_ready_signal.get_value()
 
+    # job-related methods
+    def new_job_id(self) -> int:
+        """
+        Issue the id for a new simulation job. Ids are increasing, so a job is newer than all jobs with smaller ids.
+
+        Returns:
+            int: The id of the new job.
+        """
+        with self._job_lock:
+            job_id: int = self._last_job_id.get_value() + 1
+            self._last_job_id.set_value(job_id)
+            return job_id
+
+    def cancel_jobs(self) -> None:
+        """
+        Cancel all jobs issued so far. Running simulations check this regularly and stop.
+        """
+        with self._job_lock:
+            self._cancelled_job_id.set_value(self._last_job_id.get_value())
+
+    def is_job_cancelled(self, job_id: int | None) -> bool:
+        """
+        Check if a job was cancelled. Jobs without an id can not be cancelled.
+
+        Args:
+            job_id (int | None): The id of the job.
+
+        Returns:
+            bool: True if the job was cancelled, False otherwise.
+        """
+        return job_id is not None and job_id <= self._cancelled_job_id.get_value()
+
+    # structure-related methods
+    def set_structure_version(self, version: int | None) -> None:
+        """
+        Set the version of the ui structure the backend holds a built automaton of.
+
+        Args:
+            version (int | None): The structure version, None if the backend holds no automaton.
+        """
+        self._structure_version.set_value(version)
+
+    def get_structure_version(self) -> int | None:
+        """
+        Get the version of the ui structure the backend holds a built automaton of. Changes of the structure can
+        only be sent as a diff if the backend holds the version they are based on.
+
+        Returns:
+            int | None: The structure version, None if the backend holds no automaton.
+        """
+        return self._structure_version.get_value()
+
     # ui-related methods
     def get_ui_queue(self) -> Queue[_ty.Dict[str, str]]:
         """
@@ -186,6 +247,27 @@ class UiBridge:
         """
         return self._backend_queue.get_nowait()
 
+    def wait_for_backend_task(self, timeout: float | None = None) -> _ty.Dict[str, str] or None:
+        """
+        Retrieve the next task from the backend queue, blocking until one arrives.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait, None to wait forever.
+
+        Returns:
+            _ty.Dict[str, str] or None: The next task from the backend queue, or None if the timeout expired.
+        """
+        try:
+            return self._backend_queue.get(timeout=timeout)
+        except Empty:
+            return None
+
+    def wake_backend(self) -> None:
+        """
+        Wake up a backend waiting for a task, e.g. so it notices that it should stop.
+        """
+        self._backend_queue.put({"action": "WAKE_UP"})
+
     def add_backend_item(self, item: _ty.Dict[str, str]) -> None:
         """
         Add a new task to the backend queue.
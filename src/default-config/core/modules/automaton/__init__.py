@@ -1,13 +1,13 @@
 """TBA"""
 # Std Lib imports
 import threading
-import time
 
 # Third party imports
 
 # Internal imports
 from abstractions import IBackend, IAppSettings
 from automaton.simulationLoader import SimulationLoader
+from automaton.UiBridge import UiBridge
 
 # Standard typing imports for aps
 import typing as _ty
@@ -16,6 +16,8 @@ settings: IAppSettings
 
 
 class _Backend(IBackend):
+    STOP_CHECK_INTERVAL: float = 1.0  # Seconds, in case a stop is requested without waking the backend up
+
     def __init__(self) -> None:
         ...
 
@@ -27,8 +29,13 @@ class _Backend(IBackend):
             raise RuntimeError("Backend start function has not been called yet")
         simulation_loader: SimulationLoader = SimulationLoader(settings)
         while not backend_stop_event.is_set():
-            time.sleep(0.1)
-            simulation_loader.handle_bridge()
+            simulation_loader.handle_bridge(self.STOP_CHECK_INTERVAL)  # Blocks until a request arrives
+
+    def wake_up(self) -> None:
+        """
+        Wakes up the backend if it is waiting for a request, so that it notices a set stop event at once.
+        """
+        UiBridge().wake_backend()
 
     def __new__(cls, *args, **kwargs) -> _ty.Self:
         return object.__new__(cls)
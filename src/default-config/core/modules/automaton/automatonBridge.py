@@ -68,6 +68,82 @@ class AutomatonBridge:
         """
         return self.automaton_impl.get_transitions(scrape_transition)
 
+    def get_end_states(self) -> _ty.Set[State]:
+        """
+        Returns the set of all end states in the automaton.
+
+        Returns:
+            _ty.Set[State]: A set containing all accepting (end) states of the automaton.
+        """
+        return self.automaton_impl.get_end_states()
+
+    def is_deterministic(self) -> bool:
+        """
+        Returns whether the automaton can be compiled into a (state × symbol) transition table.
+
+        Returns:
+            bool: True if the automaton is a deterministic acceptor, False otherwise.
+        """
+        return self.automaton_impl.is_deterministic()
+
+    def is_transducer(self) -> bool:
+        """
+        Returns whether the automaton can be compiled into (state × symbol) transition and output tables.
+
+        Returns:
+            bool: True if the automaton is a deterministic transducer, False otherwise.
+        """
+        return self.automaton_impl.is_transducer()
+
+    def pop_input_changes(self) -> _ty.Tuple[int, _ty.List[int]] | None:
+        """
+        Returns the cells of the input written since the last call and forgets them.
+
+        Returns:
+            _ty.Tuple[int, _ty.List[int]] | None: The number of cells inserted in front of the input and the indices
+                of the written cells, None if the automaton does not track its writes.
+        """
+        return self.automaton_impl.pop_input_changes()
+
+    def is_nondeterministic(self) -> bool:
+        """
+        Returns whether the automaton can be compiled into (state × symbol) successor sets.
+
+        Returns:
+            bool: True if the automaton is a nondeterministic acceptor, False otherwise.
+        """
+        return self.automaton_impl.is_nondeterministic()
+
+    def get_configuration(self, max_cells: int) -> _a.Hashable | None:
+        """
+        Returns a hashable snapshot of the simulation, two equal snapshots mean the simulation loops forever.
+
+        Args:
+            max_cells (int): The maximum number of memory cells the snapshot may contain.
+
+        Returns:
+            _a.Hashable | None: The configuration, None if it is not supported or would exceed max_cells.
+        """
+        return self.automaton_impl.get_configuration(max_cells)
+
+    def get_active_states(self) -> _ty.List[State]:
+        """
+        Returns the states activated during the last step.
+
+        Returns:
+            _ty.List[State]: The active states, in the order they were activated.
+        """
+        return self.automaton_impl.get_active_states()
+
+    def get_active_transitions(self) -> _ty.List[Transition]:
+        """
+        Returns the transitions activated during the last step.
+
+        Returns:
+            _ty.List[Transition]: The active transitions, in the order they were activated.
+        """
+        return self.automaton_impl.get_active_transitions()
+
     def get_current_state(self) -> State:
         """
         Returns the current state of the automaton.
@@ -159,6 +235,12 @@ class AutomatonBridge:
         """
         return self.automaton_impl.simulate_one_step()
 
+    def reset(self) -> None:
+        """
+        Resets the simulation state, so that the automaton can simulate another input.
+        """
+        self.automaton_impl.reset()
+
     def set_input(self, automaton_input: _ty.Any) -> None:
         """
         Sets the input for the automaton.
@@ -236,6 +318,27 @@ class AutomatonBridge:
         """
         self.automaton_impl.delete_transition(transition)
 
+    def add_transition(self, transition: Transition) -> None:
+        """
+        Add a transition to the automaton and to the adjacency of its start and target state.
+
+        Args:
+            transition (Transition): The transition to be added.
+        """
+        self.automaton_impl.add_transition(transition)
+
+    def get_reachable_states(self, state: State | None = None) -> OrderedSet:
+        """
+        Get all states reachable from a state.
+
+        Args:
+            state (State | None): The state to start from, the start state if None.
+
+        Returns:
+            OrderedSet: The reachable states, including the state itself.
+        """
+        return self.automaton_impl.get_reachable_states(state)
+
     def add_state(self, state: State, state_type: str) -> None:
         """
         Add a state to the automaton.
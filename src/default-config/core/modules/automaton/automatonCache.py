@@ -0,0 +1,156 @@
+"""TBA"""
+from collections import OrderedDict
+from hashlib import sha256
+import json
+
+# Abstract Machine related imports
+from automaton.automatonBridge import AutomatonBridge
+from automaton.compiledAutomaton import CompiledDFA, CompiledMealy, CompiledNFA
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+def structure_hash(simulation_request: _ty.Dict[str, _ty.Any]) -> str:
+    """Returns a canonical hash of the automaton described by a simulation request
+
+    Only the automaton type ("id") and the structure ("content") are hashed, so requests which only differ in their
+    input, mode or limits have the same hash.
+
+    :param simulation_request: The simulation request
+    :return: The hex digest of the structure
+    """
+    canonical: str = json.dumps([simulation_request["id"], simulation_request["content"]], sort_keys=True,
+                                separators=(",", ":"), default=str)
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AutomatonCache:
+    """A least recently used cache of built (and compiled) automata, keyed by their structure hash.
+
+    The memory used by an entry is estimated from the number of its states, transitions and compiled table cells.
+    Entries are evicted, least recently used first, as soon as the estimated total exceeds the cap. An entry which
+    alone exceeds the cap is not cached at all.
+    """
+    STATE_BYTES: int = 1024  # Estimated size of a built state, including its transition sets
+    TRANSITION_BYTES: int = 768  # Estimated size of a built transition, including its condition
+    TABLE_CELL_BYTES: int = 8  # A next state and a transition index per compiled table cell
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._max_bytes: int = max_bytes
+        self._size: int = 0
+        # Structure hash -> [automaton, compiled automaton or None, estimated size]
+        self._entries: OrderedDict[str, _ty.List[_ty.Any]] = OrderedDict()
+
+    def get_max_bytes(self) -> int:
+        """Returns the memory cap
+
+        :return: The memory cap in bytes
+        """
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Sets the memory cap and evicts entries until the cache fits into it
+
+        :param max_bytes: The memory cap in bytes, 0 disables the cache
+        :return: None
+        """
+        self._max_bytes = max(0, max_bytes)
+        self._evict()
+
+    def get_size(self) -> int:
+        """Returns the estimated memory used by all entries
+
+        :return: The estimated size in bytes
+        """
+        return self._size
+
+    def get(self, key: str) -> AutomatonBridge | None:
+        """Returns the built automaton for a structure hash and marks it as recently used
+
+        :param key: The structure hash
+        :return: The automaton, None if it is not cached
+        """
+        entry: _ty.List[_ty.Any] | None = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, automaton: AutomatonBridge) -> None:
+        """Caches a built automaton
+
+        :param key: The structure hash
+        :param automaton: The built automaton
+        :return: None
+        """
+        self.discard(key)
+        size: int = (len(automaton.get_states()) * self.STATE_BYTES
+                     + len(automaton.get_transitions(False)) * self.TRANSITION_BYTES)
+        if size > self._max_bytes:
+            return
+        self._entries[key] = [automaton, None, size]
+        self._size += size
+        self._evict()
+
+    def get_compiled(self, key: str) -> CompiledDFA | CompiledMealy | CompiledNFA | None:
+        """Returns the compiled automaton for a structure hash
+
+        :param key: The structure hash
+        :return: The compiled automaton, None if the automaton or its compiled form is not cached
+        """
+        entry: _ty.List[_ty.Any] | None = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set_compiled(self, key: str, compiled: CompiledDFA | CompiledMealy | CompiledNFA) -> None:
+        """Adds the compiled form to a cached automaton
+
+        :param key: The structure hash
+        :param compiled: The compiled automaton
+        :return: None
+        """
+        entry: _ty.List[_ty.Any] | None = self._entries.get(key)
+        if entry is None or entry[1] is not None:
+            return
+        size: int = compiled.get_state_count() * compiled.get_width() * self.TABLE_CELL_BYTES
+        if entry[2] + size > self._max_bytes:  # Would evict the automaton it belongs to
+            return
+        entry[1] = compiled
+        entry[2] += size
+        self._size += size
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def discard(self, key: str) -> None:
+        """Removes an entry, if it is cached
+
+        :param key: The structure hash
+        :return: None
+        """
+        entry: _ty.List[_ty.Any] | None = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[2]
+
+    def clear(self) -> None:
+        """Removes all entries
+
+        :return: None
+        """
+        self._entries.clear()
+        self._size = 0
+
+    def _evict(self) -> None:
+        """Evicts the least recently used entries until the cache fits into the memory cap
+
+        :return: None
+        """
+        while self._entries and self._size > self._max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
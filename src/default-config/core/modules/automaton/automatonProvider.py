@@ -12,6 +12,7 @@ from automaton.base.automaton import Automaton as BaseAutomaton
 from automaton.base.state import State as BaseState
 from automaton.base.transition import Transition as BaseTransition
 from automaton.base.settings import Settings as BaseSettings
+from automaton.compiledAutomaton import CompiledNFA, BitParallelNFA
 
 # from extensions.dfa import DFAState, DFATransition, DFAAutomaton, DFASettings
 
@@ -25,6 +26,10 @@ from automaton.base.settings import Settings as BaseSettings
 
 class AutomatonProvider:
     registered_automatons: _ty.Dict[str, _ty.Dict[str, _ty.Callable]] = {}
+    # Capability -> [(max states, engine)], the most specialised engine first
+    registered_engines: _ty.Dict[str, _ty.List[_ty.Tuple[int, _ty.Callable]]] = {
+        "is_nondeterministic": [(BitParallelNFA.MAX_STATES, BitParallelNFA), (0, CompiledNFA)]
+    }
 
     def __init__(self, automaton_type: str, test_mode: bool = False) -> None:
         if automaton_type is not None:
@@ -121,6 +126,37 @@ class AutomatonProvider:
         self.registered_automatons[name.lower()] = automaton_data
         ActLogger().info(f"Registered new {name.lower()}-Automaton")
 
+    def register_engine(self, capability: str, engine: _ty.Callable, max_states: int = 0) -> None:
+        """Register an engine compiled automata are simulated on
+
+        :param capability: The name of the method of the automaton which has to return True for the engine to be
+                           used, e.g. "is_nondeterministic"
+        :param engine: The engine class, it is compiled through `engine.from_automaton(automaton)`
+        :param max_states: The maximum number of states the engine supports, 0 for any number
+        :return: None
+        """
+        engines: _ty.List[_ty.Tuple[int, _ty.Callable]] = self.registered_engines.setdefault(capability, [])
+        if (max_states, engine) in engines:
+            return
+        engines.append((max_states, engine))
+        engines.sort(key=lambda entry: entry[0] or float("inf"))  # Engines for fewer states are more specialised
+        ActLogger().info(f"Registered new {capability}-Engine {engine.__name__}")
+
+    def get_engine(self, automaton: BaseAutomaton) -> _ty.Callable | None:
+        """Get the most specialised engine for a built automaton, chosen by its capabilities and number of states
+
+        :param automaton: The built automaton
+        :return: The engine class, None if no engine supports the automaton
+        """
+        state_count: int = len(automaton.get_states())
+        for capability, engines in self.registered_engines.items():
+            if not getattr(automaton, capability)():
+                continue
+            for max_states, engine in engines:
+                if not max_states or state_count <= max_states:
+                    return engine
+        return None
+
     def get_automaton_base(self) -> _ty.Callable:
         """Get the base class of the automaton
         
@@ -1,11 +1,14 @@
-from pprint import pprint
-
 from returns import result as _result
 from aplustools.io import ActLogger
 
 from automaton.automatonBridge import AutomatonBridge
+from automaton.automatonCache import AutomatonCache, structure_hash
 from automaton.base.automaton import Automaton as BaseAutomaton
+from automaton.base.state import State as BaseState
+from automaton.base.transition import Transition as BaseTransition
 from automaton.automatonProvider import AutomatonProvider
+from automaton.compiledAutomaton import CompiledDFA, CompiledMealy, CompiledNFA
+from automaton.inputSource import MappedInput
 
 from utils.IOManager import IOManager
 
@@ -14,42 +17,185 @@ import collections.abc as _a
 import abc as _abc
 import typing as _ty
 import types as _ts
+from itertools import islice
 import traceback
+import time
 
 # Docs generated with Github Copilot
 
 
 class AutomatonSimulator:
+    # Simulation modes, selected by the "mode" field of the simulation request
+    VISUAL_MODE: str = "VISUAL"  # A SIMULATION_UPDATE packet per step
+    RESULT_ONLY_MODE: str = "RESULT_ONLY"  # Only the SIMULATION_RESULT packet with the metrics of the run
+
+    # The "status" of a SIMULATION_RESULT packet
+    HALTED_STATUS: str = "HALTED"  # The automaton halted by itself
+    STEP_LIMIT_STATUS: str = "STEP_LIMIT"  # The automaton did not halt within "max_steps" steps
+    TIME_LIMIT_STATUS: str = "TIME_LIMIT"  # The automaton did not halt within "max_duration" seconds
+    CYCLE_STATUS: str = "CYCLE"  # A configuration repeated, so the automaton would never halt
+    CANCELLED_STATUS: str = "CANCELLED"  # The job was cancelled, no SIMULATION_RESULT packet is sent
+
+    # Defaults for requests without "max_steps", "max_duration" or "cycle_detection" (0 means unlimited). The step
+    # budget is opt-in, by default a non-halting automaton is stopped by the wall clock budget or the cycle detection
+    DEFAULT_MAX_STEPS: int = 0
+    DEFAULT_MAX_DURATION: float = 10.0
+    DEFAULT_CYCLE_DETECTION: bool = True
+    CYCLE_DETECTION_MAX_CELLS: int = 64  # Larger configurations are not remembered
+    CYCLE_DETECTION_CAPACITY: int = 10_000  # The remembered configurations are dropped once there are more
+    CHECK_INTERVAL: int = 256  # Steps between two checks of the wall clock budget and the cancellation
+    RUN_CHUNK_SIZE: int = 64 * CHECK_INTERVAL  # Symbols fed to a compiled automaton between two cancellation checks
+
     def __init__(self, simulation_request: _ty.Dict[str, _ty.Any],
                  simulation_result_callback: _ty.Callable,
-                 error_callable: _ty.Callable):
+                 error_callable: _ty.Callable,
+                 cancellation_callable: _ty.Callable[[], bool] | None = None,
+                 automaton_cache: AutomatonCache | None = None,
+                 automaton: AutomatonBridge | None = None):
         super().__init__()
-        pprint(simulation_request)
 
         self._simulation_request: _ty.Dict[str, _ty.Any] = simulation_request
         self._simulation_result_callback: _ty.Callable = simulation_result_callback
         self._error_callable: _ty.Callable = error_callable
+        self._cancellation_callable: _ty.Callable[[], bool] = cancellation_callable or (lambda: False)
+        self._automaton_cache: AutomatonCache | None = automaton_cache
+        self._structure_hash: str | None = None
+
+        # An already built automaton, the "content" of the request is not used then
+        self.automaton: AutomatonBridge | None = automaton
+        self._steps: int = 0
+        self._sent_length: int | None = None  # The length of the input as the ui knows it, None before the first packet
+        self._sent_input: _ty.List[_ty.Any] | None = None  # Copy of the sent input, for automata not reporting writes
+        self._input_source: MappedInput | None = None  # A file backed input streamed into the compiled automaton
+
+        self._status: str = self.HALTED_STATUS
+        self._max_steps: int = 0
+        self._deadline: float = 0.0
+        self._configurations: _ty.Dict[_a.Hashable, int] | None = None  # Configuration -> step it was seen at
+
+    def is_visual(self) -> bool:
+        """Returns whether the simulation sends a packet per step. Requests without a mode are run result only.
+
+        :return: True if the simulation request selected the visual mode
+        """
+        return str(self._simulation_request.get("mode", self.RESULT_ONLY_MODE)).upper() == self.VISUAL_MODE
+
+    def get_steps(self) -> int:
+        """Returns the number of steps executed by the last simulation
+
+        :return: The number of steps
+        """
+        return self._steps
+
+    def get_structure_hash(self) -> str | None:
+        """Returns the key the automaton is cached under
+
+        :return: The structure hash, None if no cache is used
+        """
+        return self._structure_hash
+
+    def get_status(self) -> str:
+        """Returns the status of the last simulation, one of the *_STATUS constants
+
+        :return: The status
+        """
+        return self._status
+
+    def _start_watchdog(self, start_time: float) -> None:
+        """Reads the step and time budgets and the cycle detection flag from the simulation request
+
+        :param start_time: The perf_counter time the simulation started at
+        :return: None
+        """
+        self._status = self.HALTED_STATUS
+        self._max_steps = int(self._simulation_request.get("max_steps", self.DEFAULT_MAX_STEPS) or 0)
 
-        self.automaton: AutomatonBridge | None = None
+        max_duration: float = float(self._simulation_request.get("max_duration", self.DEFAULT_MAX_DURATION) or 0)
+        self._deadline = start_time + max_duration if max_duration > 0 else 0.0
+
+        self._configurations = None
+        if self._simulation_request.get("cycle_detection", self.DEFAULT_CYCLE_DETECTION):
+            self._configurations = {}
+
+    def _check_watchdog(self) -> _result.Result | None:
+        """Checks the budgets and looks for a repeated configuration after a step that did not end the simulation
+
+        :return: Failure if the simulation has to be stopped, None otherwise
+        """
+        steps: int = self._steps
+        if 0 < self._max_steps <= steps:
+            self._status = self.STEP_LIMIT_STATUS
+            return _result.Failure(f"Automaton did not halt within {self._max_steps} steps!")
+
+        if steps % self.CHECK_INTERVAL == 0:
+            if self._cancellation_callable():
+                self._status = self.CANCELLED_STATUS
+                return _result.Failure(f"Simulation was cancelled at step {steps}!")
+            if self._deadline and time.perf_counter() > self._deadline:
+                self._status = self.TIME_LIMIT_STATUS
+                return _result.Failure(f"Automaton did not halt within "
+                                       f"{self._simulation_request.get('max_duration', self.DEFAULT_MAX_DURATION)} "
+                                       f"seconds ({steps} steps)!")
+
+        if self._configurations is not None:
+            configuration: _a.Hashable | None = self.automaton.get_configuration(self.CYCLE_DETECTION_MAX_CELLS)
+            if configuration is not None:
+                seen_at: int | None = self._configurations.get(configuration)
+                if seen_at is not None:
+                    self._status = self.CYCLE_STATUS
+                    return _result.Failure(f"Cycle detected at step {steps}, the automaton repeats the "
+                                           f"configuration of step {seen_at} and will never halt!")
+                if len(self._configurations) >= self.CYCLE_DETECTION_CAPACITY:
+                    self._configurations.clear()
+                self._configurations[configuration] = steps
+        return None
 
     def run(self) -> _result.Result:
         """Run the automaton simulation
-        
+
+        The input is either given as a list of tokens in "input", or as the path of a file in "input_file" whose
+        tokens are separated by "input_separator". Compiled automata simulated without packets read a file lazily,
+        all others read it into a list first.
+
         :return: The result of the simulation"""
         self._build_automaton()
 
-        automaton_input: _ty.List[_ty.Any] = self._simulation_request["input"]
+        automaton_input: _ty.List[_ty.Any] = self._simulation_request.get("input", [])
 
         if self.automaton.automaton_impl is None:
             log_message: str = "Failed to simulate automaton due to a failed initialisation"
             IOManager().error(log_message, "", True)
             return _result.Failure(log_message)
 
+        self._input_source = None
+        if "input_file" in self._simulation_request:
+            input_source: MappedInput = MappedInput(self._simulation_request["input_file"],
+                                                    self._simulation_request.get("input_separator",
+                                                                                 MappedInput.DEFAULT_SEPARATOR))
+            if not self.is_visual() and (self.automaton.is_deterministic() or self.automaton.is_transducer()
+                                         or self.automaton.is_nondeterministic()):
+                self._input_source = input_source
+                automaton_input = []
+            else:
+                automaton_input = list(input_source)
+
+        self.automaton.reset()  # A cached automaton may still hold the state of its last simulation
         self.automaton.set_input(automaton_input)
-        print(self.automaton.get_input())
 
         return self._simulate()
 
+    def build(self) -> _result.Result:
+        """Build the automaton without simulating it
+
+        :return: Success containing the built automaton, Failure if it could not be built"""
+        build_result: _result.Result | None = self._build_automaton()
+        if isinstance(build_result, _result.Failure):
+            return build_result
+
+        if self.automaton is None or self.automaton.automaton_impl is None:
+            return _result.Failure("Failed to build automaton due to a failed initialisation")
+        return _result.Success(self.automaton)
+
     def _init_automaton(self, automaton_type: str) -> bool:
         """Initialise the automaton
         
@@ -73,6 +219,32 @@ class AutomatonSimulator:
         """
         serialised_automaton: _ty.Dict[str, _ty.Any] = self._simulation_request
 
+        if self.automaton is not None:  # Built (and changed) by the caller
+            self._structure_hash = serialised_automaton.get("structure_hash")
+            if (self._automaton_cache is not None and self._structure_hash is not None
+                    and self._structure_hash not in self._automaton_cache):
+                self._automaton_cache.put(self._structure_hash, self.automaton)
+            return _result.Success(self.automaton)
+
+        if self._automaton_cache is not None:
+            self._structure_hash = serialised_automaton.get("structure_hash") or structure_hash(serialised_automaton)
+            cached_automaton: AutomatonBridge | None = self._automaton_cache.get(self._structure_hash)
+            if cached_automaton is not None:
+                self.automaton = cached_automaton
+                return _result.Success(cached_automaton)
+
+        build_result: _result.Result = self._construct_automaton()
+        if isinstance(build_result, _result.Success) and self._automaton_cache is not None:
+            self._automaton_cache.put(self._structure_hash, self.automaton)
+        return build_result
+
+    def _construct_automaton(self) -> _result.Result:
+        """Construct the states and transitions of the automaton from the simulation request
+
+        :return: The result of the construction
+        """
+        serialised_automaton: _ty.Dict[str, _ty.Any] = self._simulation_request
+
         # Accepts format, displayed in automaten.json
         id_string: str = serialised_automaton['id']  # author:automaton_type
         split_id_string: _ty.List[str] = id_string.split(':')
@@ -80,7 +252,6 @@ class AutomatonSimulator:
 
         # does the requested automaton exist?
         success: bool = self._init_automaton(automaton_type)
-        print(success)
         if not success:
             log_message: str = f"Could not recognise automaton of type '{automaton_type}'"
             ActLogger().error(log_message)
@@ -114,9 +285,7 @@ class AutomatonSimulator:
             transition_data: _ty.List[_ty.Any] = state['transitions']
             for transition in transition_data:
                 # Copy the transition and add a field "from" which is the id of the current node
-                modified: _ty.Dict[str, _ty.Any] = transition
-                modified["from"] = i
-                transitions.append((modified["id"], modified.copy()))
+                transitions.append((transition["id"], {**transition, "from": i}))
 
         # Create transitions
         raw_transition = automaton_provider.get_automaton_transition()
@@ -131,11 +300,9 @@ class AutomatonSimulator:
             start_state = temp_states[from_state]
             end_state = temp_states[to_state]
             specific_transition = raw_transition(start_state, end_state, condition)
+            self.automaton.add_transition(specific_transition)  # In id order, so the indices match the ids
 
-            start_state.add_transition(specific_transition)
-            automaton_transition_set: _ty.Set = self.automaton.get_transitions(True)
-            automaton_transition_set.add(specific_transition)
-            self.automaton.set_transitions(automaton_transition_set)
+        return _result.Success(self.automaton)
 
     def _serialise_automaton_to_bridge(self) -> None:
         """Serialise the automaton to the bridge
@@ -144,8 +311,17 @@ class AutomatonSimulator:
         """
         serialised_update: _ty.Dict[str, _ty.Any] = {}
 
+        # Automata which do not track their activations are searched for active states and transitions
+        active_states: _ty.List[BaseState] = self.automaton.get_active_states()
+        if not active_states:
+            active_states = [state for state in self.automaton.get_states() if state.is_active()]
+        active_transitions: _ty.List[BaseTransition] = self.automaton.get_active_transitions()
+        if not active_transitions:
+            active_transitions = [transition for transition in self.automaton.get_transitions()
+                                  if transition.is_active()]
+
         # serialisation
-        for state in self.automaton.get_states():
+        for state in active_states:
             if not state.is_active():
                 continue
 
@@ -153,7 +329,7 @@ class AutomatonSimulator:
             serialised_update["state"]["id"] = self.automaton.get_state_index(state)
             serialised_update["state"]["is_active"] = state.is_active()
 
-        for transition in self.automaton.get_transitions():
+        for transition in active_transitions:
             if not transition.is_active():
                 continue
 
@@ -162,7 +338,8 @@ class AutomatonSimulator:
             serialised_update["transition"]["is_active"] = transition.is_active()
 
         serialised_update["automaton"] = {}
-        serialised_update["automaton"]["input"] = list(self.automaton.get_input())
+        self._serialise_input_delta(serialised_update["automaton"], self.automaton.get_input(),
+                                    self.automaton.pop_input_changes())
         serialised_update["automaton"]["pointer_index"] = self.automaton.get_current_index()
         serialised_update["automaton"]["output"] = self.automaton.get_current_return_value()
         serialised_update["type"] = "SIMULATION_UPDATE"
@@ -176,10 +353,88 @@ class AutomatonSimulator:
         # push to bridge
         self._simulation_result_callback(serialised_update)
 
-    def _serialise_simulation_result(self, automaton_result: _result.Result) -> None:
+    def _serialise_input_delta(self, automaton_data: _ty.Dict[str, _ty.Any], automaton_input: _ty.Sequence[_ty.Any],
+                               input_changes: _ty.Tuple[int, _ty.Iterable[int]] | None) -> None:
+        """Serialise the input (or tape) of the automaton as a delta to the previously sent one
+
+        The first packet of a simulation carries the whole input in "input". Later packets only carry the
+        "input_changes" as [index, token] pairs, the "input_length" and, if cells were inserted in front of the input,
+        the "input_shift", so the queue grows linearly with the run. The written cells are reported by the automaton,
+        so a step costs O(changed cells). Only for automata which do not report them the whole input is compared with
+        a copy of the sent one.
+
+        :param automaton_data: The "automaton" part of the packet
+        :param automaton_input: The current input of the automaton
+        :param input_changes: The cells inserted in front of the input and the written cells since the last packet,
+                              see `Automaton.pop_input_changes`. None compares the whole input
+        :return: None
+        """
+        length: int = len(automaton_input)
+        if self._sent_length is None:
+            automaton_data["input"] = list(automaton_input)
+            self._sent_length = length
+            self._sent_input = list(automaton_input) if input_changes is None else None
+            return
+
+        changes: _ty.List[_ty.List[_ty.Any]]
+        if input_changes is not None:
+            shift, written = input_changes
+            indices: _ty.Set[int] = set(range(shift))  # The inserted cells
+            indices.update(written)
+            indices.update(range(self._sent_length + shift, length))  # The appended cells
+            changes = [[i, automaton_input[i]] for i in sorted(indices) if i < length]
+            if shift:
+                automaton_data["input_shift"] = shift
+        else:
+            sent_input: _ty.List[_ty.Any] = self._sent_input
+            changes = [[i, token] for i, (token, sent_token)
+                       in enumerate(zip(automaton_input, sent_input)) if token != sent_token]
+            changes.extend([i, automaton_input[i]] for i in range(len(sent_input), length))
+            for i, token in changes:
+                if i < len(sent_input):
+                    sent_input[i] = token
+                else:
+                    sent_input.append(token)
+            del sent_input[length:]
+
+        self._sent_length = length
+        automaton_data["input_changes"] = changes
+        automaton_data["input_length"] = length
+
+    def _serialise_compiled_step_to_bridge(self, state_id: int, transition_id: int, pointer_index: int,
+                                           automaton_input: _ty.List[_ty.Any]) -> None:
+        """Serialise one step of a compiled automaton to the bridge
+
+        :param state_id: The index of the active state
+        :param transition_id: The index of the active transition, -1 if no transition is active
+        :param pointer_index: The current index on the input sequence
+        :param automaton_input: The input of the automaton
+        :return: None
+        """
+        serialised_update: _ty.Dict[str, _ty.Any] = {}
+        serialised_update["state"] = {}
+        serialised_update["state"]["id"] = state_id
+        serialised_update["state"]["is_active"] = True
+
+        if transition_id >= 0:
+            serialised_update["transition"] = {}
+            serialised_update["transition"]["id"] = transition_id
+            serialised_update["transition"]["is_active"] = True
+
+        serialised_update["automaton"] = {}
+        self._serialise_input_delta(serialised_update["automaton"], automaton_input, (0, ()))  # Never written
+        serialised_update["automaton"]["pointer_index"] = pointer_index
+        serialised_update["automaton"]["output"] = None
+        serialised_update["type"] = "SIMULATION_UPDATE"
+
+        # push to bridge
+        self._simulation_result_callback(serialised_update)
+
+    def _serialise_simulation_result(self, automaton_result: _result.Result, duration: float) -> None:
         """Serialise the simulation result
         
         :param automaton_result: The result of the simulation
+        :param duration: The time the simulation took in seconds
         :return: None
         """
         serialisation_update: _ty.Dict[str, _ty.Any] = {}
@@ -190,23 +445,162 @@ class AutomatonSimulator:
         serialisation_update["type"] = "SIMULATION_RESULT"
         serialisation_update["success"] = isinstance(automaton_result, _result.Success)
         serialisation_update["message"] = automaton_result._inner_value or "No message provided!"
+        serialisation_update["status"] = self._status
+
+        serialisation_update["metrics"] = {}
+        serialisation_update["metrics"]["steps"] = self._steps
+        serialisation_update["metrics"]["duration"] = duration
         self._simulation_result_callback(serialisation_update)
 
+    def _run_in_chunks(self, run: _ty.Callable[[_ty.List[_ty.Any], int], _ty.Tuple[int, int]], state: int,
+                       word: _ty.Iterable[_ty.Any]) -> int | None:
+        """Feeds a word to the run loop of a compiled automaton in chunks and checks the cancellation after each one
+
+        :param run: Runs the compiled automaton over a chunk, starting in the given state
+        :param state: The state to start in
+        :param word: The input symbols, e.g. a file backed input
+        :return: The final state, None if the simulation was cancelled
+        """
+        iterator: _a.Iterator[_ty.Any] = iter(word)
+        chunk: _ty.List[_ty.Any] = list(islice(iterator, self.RUN_CHUNK_SIZE))
+        while chunk:
+            state, consumed = run(chunk, state)
+            self._steps += consumed
+            if consumed < len(chunk):  # Got stuck
+                return state
+            if self._cancellation_callable():
+                self._status = self.CANCELLED_STATUS
+                return None
+            chunk = list(islice(iterator, self.RUN_CHUNK_SIZE))
+        return state
+
+    def _simulate_compiled(self) -> _result.Result:
+        """Simulate a deterministic automaton on its compiled transition table
+
+        :return: The result of the simulation
+        """
+        compiled: CompiledDFA | None = None
+        if self._automaton_cache is not None:
+            compiled = self._automaton_cache.get_compiled(self._structure_hash)
+        if compiled is None:
+            compiled = CompiledDFA.from_automaton(self.automaton.get_implementation())
+            if self._automaton_cache is not None:
+                self._automaton_cache.set_compiled(self._structure_hash, compiled)
+
+        state: int = compiled.get_start_state()
+        if state == CompiledDFA.DEAD_STATE:
+            return compiled.get_result(state)
+
+        if not self.is_visual():
+            state = self._run_in_chunks(compiled.run, state, self._input_source if self._input_source is not None
+                                        else self.automaton.get_input())
+            if state is None:
+                return _result.Failure(f"Simulation was cancelled at step {self._steps}!")
+            return compiled.get_result(state)
+
+        automaton_input: _ty.List[_ty.Any] = list(self.automaton.get_input())
+
+        self._serialise_compiled_step_to_bridge(state, -1, 0, automaton_input)
+        for i, symbol in enumerate(automaton_input):
+            state, transition = compiled.step(state, symbol)
+            if state == CompiledDFA.DEAD_STATE:
+                break
+            self._steps += 1
+            if self._steps % self.CHECK_INTERVAL == 0 and self._cancellation_callable():
+                self._status = self.CANCELLED_STATUS
+                return _result.Failure(f"Simulation was cancelled at step {self._steps}!")
+            self._serialise_compiled_step_to_bridge(state, transition, i + 1, automaton_input)
+
+        return compiled.get_result(state)
+
+    def _simulate_transducer(self) -> _result.Result:
+        """Simulate a deterministic transducer on its compiled tables, without sending any packets
+
+        Like in a simulation step by step, the outputs replace the consumed input symbols. The outputs of a file
+        backed input are dropped, so it is transduced in constant memory.
+
+        :return: The result of the simulation
+        """
+        compiled: CompiledMealy | None = None
+        if self._automaton_cache is not None:
+            compiled = self._automaton_cache.get_compiled(self._structure_hash)
+        if compiled is None:
+            compiled = CompiledMealy.from_automaton(self.automaton.get_implementation())
+            if self._automaton_cache is not None:
+                self._automaton_cache.set_compiled(self._structure_hash, compiled)
+
+        outputs: _ty.List[_ty.Any] = []
+        output_callback: _ty.Callable[[_ty.List[_ty.Any]], _ty.Any] = (outputs.extend if self._input_source is None
+                                                                       else lambda _: None)
+        state: int | None = self._run_in_chunks(
+            lambda chunk, chunk_state: compiled.run(chunk, output_callback, state=chunk_state),
+            compiled.get_start_state(), self._input_source if self._input_source is not None
+            else self.automaton.get_input())
+        if self._input_source is None:
+            self.automaton.get_input()[:len(outputs)] = outputs  # Also the outputs of a cancelled run
+        if state is None:
+            return _result.Failure(f"Simulation was cancelled at step {self._steps}!")
+        return compiled.get_result(state)
+
+    def _simulate_nondeterministic(self) -> _result.Result:
+        """Simulate a nondeterministic automaton on the engine registered for it, without sending any packets
+
+        :return: The result of the simulation
+        """
+        compiled: CompiledNFA | None = None
+        if self._automaton_cache is not None:
+            compiled = self._automaton_cache.get_compiled(self._structure_hash)
+        if compiled is None:
+            engine: _ty.Type[CompiledNFA] = AutomatonProvider(None).get_engine(self.automaton.get_implementation())
+            compiled = engine.from_automaton(self.automaton.get_implementation())
+            if self._automaton_cache is not None:
+                self._automaton_cache.set_compiled(self._structure_hash, compiled)
+
+        state: int | None = self._run_in_chunks(compiled.run, compiled.get_start_state(),
+                                                self._input_source if self._input_source is not None
+                                                else self.automaton.get_input())
+        if state is None:
+            return _result.Failure(f"Simulation was cancelled at step {self._steps}!")
+        return compiled.get_result(state)
+
     def _simulate(self) -> _result.Result:
         """Simulate the automaton
         
         :return: The result of the simulation
         """
         try:
-
-            return_result = None
-            i = 0
-            while return_result is None:
-                self._serialise_automaton_to_bridge()
-                return_result = self.automaton.simulate_one_step()
-                i += 1
-
-            self._serialise_simulation_result(return_result)
+            self._steps = 0
+            self._sent_length = None
+            self._sent_input = None
+            start_time: float = time.perf_counter()
+            self._start_watchdog(start_time)
+
+            if self.automaton.is_deterministic():  # Always halts after the input
+                return_result = self._simulate_compiled()
+            elif self.automaton.is_transducer() and not self.is_visual():  # Always halts after the input
+                return_result = self._simulate_transducer()
+            elif self.automaton.is_nondeterministic() and not self.is_visual():  # Always halts after the input
+                return_result = self._simulate_nondeterministic()
+            elif self.is_visual():
+                return_result = None
+                while return_result is None:
+                    self._serialise_automaton_to_bridge()
+                    return_result = self.automaton.simulate_one_step()
+                    if return_result is None:  # The step that ends the simulation does not move
+                        self._steps += 1
+                        return_result = self._check_watchdog()
+            else:
+                simulate_one_step: _ty.Callable[[], _result.Result | None] = self.automaton.simulate_one_step
+                check_watchdog: _ty.Callable[[], _result.Result | None] = self._check_watchdog
+                return_result = None
+                while return_result is None:
+                    return_result = simulate_one_step()
+                    if return_result is None:
+                        self._steps += 1
+                        return_result = check_watchdog()
+
+            if self._status != self.CANCELLED_STATUS:  # Nobody waits for the result of a cancelled job
+                self._serialise_simulation_result(return_result, time.perf_counter() - start_time)
             return return_result
 
         except Exception as e:
@@ -5,6 +5,9 @@ from PySide6.QtGui import QShowEvent, QTextCursor, QTextCharFormat, QColor
 
 from aplustools.io.qtquick import QQuickBoxLayout, QBoxDirection, QNoSpacingBoxLayout
 
+from utils.tracer import Tracer
+import logging
+
 
 
 class QFlowLayout(QLayout):  # Not by me
@@ -409,7 +412,7 @@ class QAutomatonTokenIO(QAutomatonInputOutput):
         # Remove the latest token where the cursor is
         self._check_for_errors()
 
-        print(f"removed token at {self.input_edit.textCursor().position()}")
+        Tracer().emit("input.remove_token", logging.DEBUG, position=self.input_edit.textCursor().position())
         cursor = self.input_edit.textCursor()
         text = self.input_edit.toPlainText()
         if not text:
@@ -444,8 +447,6 @@ class QAutomatonTokenIO(QAutomatonInputOutput):
             self.input_edit.setText(self.input_edit.text() + self.get_separator() + token)
 
     def _check_for_errors(self) -> None:
-        print("error check")
-
         for token in self._input_tokens:
             for seperator in self._regulated_separators:
                 if seperator in token:
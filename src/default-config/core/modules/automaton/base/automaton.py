@@ -4,6 +4,7 @@ import json
 # Abstract Machine related imports
 from automaton.base.state import State
 from automaton.base.transition import Transition
+from automaton.base.symbols import SymbolTable
 
 from utils.OrderedSet import OrderedSet
 
@@ -40,6 +41,15 @@ class Automaton(_abc.ABC):
         start_state (State):
             The start state from which the automaton begins its execution.
 
+        _symbols (SymbolTable):
+            Interns the tokens of the transition conditions (and the input), so engines compare symbol ids.
+
+        _active_states (_ty.List[State]):
+            The states activated through `activate_state` since the last `clear_activations`.
+
+        _active_transitions (_ty.List[Transition]):
+            The transitions activated through `activate_transition` since the last `clear_activations`.
+
     Methods:
         __init__() -> None:
             Initializes an automaton with no states, transitions, or current state.
@@ -50,6 +60,21 @@ class Automaton(_abc.ABC):
         set_end_states(new_end_states: _ty.Set) -> None:
             Sets a new set of end states for the automaton.
 
+        is_deterministic() -> bool:
+            Returns whether the automaton can be compiled into a (state × symbol) transition table.
+
+        is_transducer() -> bool:
+            Returns whether the automaton can be compiled into (state × symbol) transition and output tables.
+
+        is_nondeterministic() -> bool:
+            Returns whether the automaton can be compiled into (state × symbol) successor sets.
+
+        get_configuration(max_cells: int) -> _a.Hashable | None:
+            Returns a hashable snapshot of the simulation, used to detect simulations that never halt.
+
+        get_symbols() -> SymbolTable:
+            Returns the symbol table the condition tokens of all transitions are interned into.
+
         get_states() -> _ty.Set[State]:
             Returns the set of all states in the automaton.
 
@@ -60,6 +85,30 @@ class Automaton(_abc.ABC):
         __scrape_all_transitions() -> None:
             Scrapes all transitions from the states and stores them in the automaton's transitions set.
 
+        add_transition(transition: Transition) -> None:
+            Adds a transition to the automaton and to the adjacency of its start and target state.
+
+        get_reachable_states(state: State | None = None) -> OrderedSet[State]:
+            Returns all states reachable from a state (the start state if None).
+
+        reset() -> None:
+            Resets the simulation state, so that the automaton can simulate another input.
+
+        activate_state(state: State) -> None:
+            Activates a state and remembers it, so it can be deactivated without visiting all other states.
+
+        activate_transition(transition: Transition) -> None:
+            Activates a transition and remembers it, so it can be deactivated without visiting all others.
+
+        clear_activations() -> None:
+            Deactivates the remembered states and transitions, engines call this before every step.
+
+        get_active_states() -> _ty.List[State]:
+            Returns the remembered states, in the order they were activated.
+
+        get_active_transitions() -> _ty.List[Transition]:
+            Returns the remembered transitions, in the order they were activated.
+
         get_current_state() -> State:
             Returns the current state of the automaton.
 
@@ -116,6 +165,162 @@ class Automaton(_abc.ABC):
         self.start_state: State | None = None
         self.end_states: _ty.Set[State] = set()
 
+        self._symbols: SymbolTable = SymbolTable()
+
+        self._active_states: _ty.List[State] = []
+        self._active_transitions: _ty.List[Transition] = []
+
+    def get_end_states(self) -> _ty.Set[State]:
+        """
+        Returns the set of all end states in the automaton.
+
+        Returns:
+            _ty.Set[State]: A set containing all accepting (end) states of the automaton.
+        """
+        return self.end_states
+
+    def set_end_states(self, new_end_states: _ty.Set[State]) -> None:
+        """
+        Sets a new set of end states for the automaton.
+
+        Args:
+            new_end_states (_ty.Set[State]): A set of states to mark as accepting states.
+        """
+        self.end_states = new_end_states
+
+    def is_deterministic(self) -> bool:
+        """
+        Returns whether the automaton is a deterministic acceptor.
+
+        A deterministic acceptor consumes exactly one input symbol per step, has at most one transition per
+        (state, symbol) pair and accepts if it ends in an end state. Automata returning True can be compiled
+        into a transition table (see `automaton.compiledAutomaton.CompiledDFA`) instead of being simulated
+        through `simulate_one_step`.
+
+        Returns:
+            bool: True if the automaton can be compiled into a transition table, False otherwise.
+        """
+        return False
+
+    def is_transducer(self) -> bool:
+        """
+        Returns whether the automaton is a deterministic transducer.
+
+        A deterministic transducer consumes exactly one input symbol per step and produces exactly one output per
+        step, the effect of the taken transition. Its first valid transition per (state, symbol) pair is taken.
+        Automata returning True can be compiled into transition and output tables (see
+        `automaton.compiledAutomaton.CompiledMealy`) instead of being simulated through `simulate_one_step`.
+
+        Returns:
+            bool: True if the automaton can be compiled into transition and output tables, False otherwise.
+        """
+        return False
+
+    def is_nondeterministic(self) -> bool:
+        """
+        Returns whether the automaton is a nondeterministic acceptor.
+
+        A nondeterministic acceptor consumes exactly one input symbol per step along every transition that matches
+        it, follows its ε-transitions (see `Transition.is_epsilon`) without consuming input and accepts if one of the
+        states it ends in is an end state. Automata returning True can be compiled into successor sets (see
+        `automaton.compiledAutomaton.CompiledNFA`) instead of being simulated through `simulate_one_step`.
+
+        Returns:
+            bool: True if the automaton can be compiled into successor sets, False otherwise.
+        """
+        return False
+
+    def get_configuration(self, max_cells: int) -> _a.Hashable | None:
+        """
+        Returns a hashable snapshot of everything the next steps of the simulation depend on.
+
+        If the same configuration is seen twice during one simulation, the simulation will repeat itself forever.
+        Automata that always halt (like those consuming one input symbol per step) do not need to implement this.
+
+        Args:
+            max_cells (int): The maximum number of memory cells (e.g. tape cells) the snapshot may contain.
+
+        Returns:
+            _a.Hashable | None: The configuration, None if it is not supported or would exceed max_cells.
+        """
+        return None
+
+    def reset(self) -> None:
+        """
+        Resets the simulation state, so that a built automaton can simulate another input.
+
+        The current state is cleared and all states and transitions are deactivated, the input is reset by
+        `set_input`. Subclasses keeping further simulation state must extend this.
+        """
+        self.current_state = None
+        for state in self.states:
+            state.deactivate()
+        for transition in self.transitions:
+            transition.deactivate()
+        self._active_states.clear()
+        self._active_transitions.clear()
+
+    def activate_state(self, state: State) -> None:
+        """
+        Activates a state and remembers it until the next `clear_activations`.
+
+        Args:
+            state (State): The state to activate.
+        """
+        state.activate()
+        self._active_states.append(state)
+
+    def activate_transition(self, transition: Transition) -> None:
+        """
+        Activates a transition and remembers it until the next `clear_activations`.
+
+        Args:
+            transition (Transition): The transition to activate.
+        """
+        transition.activate()
+        self._active_transitions.append(transition)
+
+    def clear_activations(self) -> None:
+        """
+        Deactivates the states and transitions activated since the last call, so the cost of a step does not depend
+        on the size of the automaton.
+        """
+        for state in self._active_states:
+            state.deactivate()
+        for transition in self._active_transitions:
+            transition.deactivate()
+        self._active_states.clear()
+        self._active_transitions.clear()
+
+    def get_active_states(self) -> _ty.List[State]:
+        """
+        Returns the states activated through `activate_state` since the last `clear_activations`.
+
+        Returns:
+            _ty.List[State]: The states, in the order they were activated.
+        """
+        return self._active_states
+
+    def get_active_transitions(self) -> _ty.List[Transition]:
+        """
+        Returns the transitions activated through `activate_transition` since the last `clear_activations`.
+
+        Returns:
+            _ty.List[Transition]: The transitions, in the order they were activated.
+        """
+        return self._active_transitions
+
+    def get_symbols(self) -> SymbolTable:
+        """
+        Returns the symbol table the condition tokens of all transitions are interned into.
+
+        Engines encode their input with it once per `set_input`, unknown input symbols get the id -1.
+
+        Returns:
+            SymbolTable: The symbol table of the automaton.
+        """
+        return self._symbols
+
     def get_states(self) -> OrderedSet[State]:
         """
         Returns the set of all states in the automaton.
@@ -143,13 +348,59 @@ class Automaton(_abc.ABC):
     def __scrape_all_transitions(self) -> None:
         """
         Scrapes all transitions from the states and stores them in the automaton's transitions set.
-        """
-        transition_set: OrderedSet[Transition] = OrderedSet()
 
+        Transitions which are already known keep their position (and with it their index), new ones are appended and
+        transitions no state holds anymore are dropped.
+        """
+        transitions: OrderedSet[Transition] = self.transitions
+        attached: int = 0
         for state in self.get_states():
-            for transition in state.get_transitions():
-                transition_set.add(transition)
-        self.set_transitions(transition_set)
+            state_transitions: OrderedSet[Transition] = state.get_transitions()
+            attached += len(state_transitions)
+            for transition in state_transitions:
+                if transition not in transitions:
+                    transition.intern_condition(self._symbols)
+                    transitions.add(transition)
+
+        if len(transitions) != attached:  # Some were removed from their state
+            for transition in [t for t in transitions if t not in t.get_start_state().get_transitions()
+                                                         or t.get_start_state() not in self.states]:
+                transitions.discard(transition)
+
+    def add_transition(self, transition: Transition) -> None:
+        """
+        Adds a transition to the automaton and to the adjacency of its start and target state and interns its
+        condition.
+
+        Args:
+            transition (Transition): The transition to add.
+        """
+        transition.get_start_state().add_transition(transition)
+        transition.get_transition_target().add_incoming_transition(transition)
+        transition.intern_condition(self._symbols)
+        self.transitions.add(transition)
+
+    def get_reachable_states(self, state: State | None = None) -> OrderedSet[State]:
+        """
+        Returns all states reachable from a state, in breadth first order.
+
+        Args:
+            state (State | None): The state to start from, the start state if None.
+
+        Returns:
+            OrderedSet[State]: The reachable states, including the state itself.
+        """
+        if state is None:
+            state = self.start_state
+        reachable: OrderedSet[State] = OrderedSet()
+        if state is None:
+            return reachable
+
+        reachable.add(state)
+        for current in reachable:  # Newly added states are visited too
+            for transition in current.get_transitions():
+                reachable.add(transition.get_transition_target())
+        return reachable
 
     def get_current_state(self) -> State:
         """
@@ -211,11 +462,9 @@ class Automaton(_abc.ABC):
         Returns:
             State: The state with the given ID.
         """
-        for i, state in enumerate(iter(self.states)):
-            if i != state_id:
-                continue
-
-            return state
+        if 0 <= state_id < len(self.states):
+            return self.states.get_by_index(state_id)
+        return None
 
     def get_transition_by_id(self, transition_id: int) -> Transition:
         """
@@ -227,11 +476,9 @@ class Automaton(_abc.ABC):
         Returns:
             Transition: The transition with the given ID.
         """
-        for i, transition in enumerate(iter(self.transitions)):
-            if i != transition_id:
-                continue
-
-            return transition
+        if 0 <= transition_id < len(self.transitions):
+            return self.transitions.get_by_index(transition_id)
+        return None
 
     def set_transitions(self, new_transitions: OrderedSet[Transition]) -> None:
         """
@@ -242,6 +489,8 @@ class Automaton(_abc.ABC):
             moves between states.
         """
         self.transitions = new_transitions
+        for transition in new_transitions:
+            transition.intern_condition(self._symbols)
 
     @_abc.abstractmethod
     def simulate_one_step(self) -> _result.Result:
@@ -282,6 +531,21 @@ class Automaton(_abc.ABC):
         """
         raise NotImplementedError("get_input must be implemented in a subclass.")
 
+    def pop_input_changes(self) -> _ty.Tuple[int, _ty.List[int]] | None:
+        """
+        Returns the cells of the input written since the last call and forgets them.
+
+        Visual simulations send only these cells to the ui instead of comparing the whole input after every step.
+        Automata may start tracking their writes with the first call, so its result only enables the tracking.
+        Cells appended at the end of the input do not need to be reported.
+
+        Returns:
+            _ty.Tuple[int, _ty.List[int]] | None: The number of cells inserted in front of the input and the indices
+                (into the current input) of the written cells. None if the automaton does not track its writes, the
+                whole input is compared with the last sent one then.
+        """
+        return None
+
     def get_state_index(self, state: State) -> int:
         """
         Returns the index of the state in the automaton.
@@ -292,11 +556,9 @@ class Automaton(_abc.ABC):
         Returns:
             int: The index of the state in the automaton.
         """
-        for i, s in enumerate(self.get_states()):
-            if s is not state:
-                continue
-            return i
-        return 0
+        if state not in self.states:
+            return 0
+        return self.states.get_index(state)
 
     def get_transition_index(self, transition: Transition) -> int:
         """
@@ -308,11 +570,11 @@ class Automaton(_abc.ABC):
         Returns:
             int: The index of the transition in the automaton.
         """
-        for i, t in enumerate(self.get_transitions()):
-            if t is not transition:
-                continue
-            return i
-        return 0
+        if transition not in self.transitions:
+            self.__scrape_all_transitions()  # It may only be known to its start state yet
+            if transition not in self.transitions:
+                return 0
+        return self.transitions.get_index(transition)
 
     @_abc.abstractmethod
     def get_current_index(self) -> int:
@@ -344,15 +606,10 @@ class Automaton(_abc.ABC):
         if state not in self.states:
             return
         self.states.remove(state)
+        self.end_states.discard(state)
 
-        _transition_copy: OrderedSet[Transition] = self.get_transitions()
-        for transition in _transition_copy:
-            if not transition.get_start_state() == state and not transition.get_transition_target() == state:
-                continue
-            self.transitions.remove(transition)
-            del transition
-
-        self.get_transitions(True)  # Update the Transitions set
+        for transition in [*state.get_transitions(), *state.get_incoming_transitions()]:
+            self.delete_transition(transition)
 
     def delete_transition(self, transition: "Transition") -> None:
         """
@@ -361,13 +618,10 @@ class Automaton(_abc.ABC):
         Args:
             transition (Transition): The transition to delete.
         """
-        if transition not in self.get_transitions():
+        transition_start_state: State = transition.get_start_state()
+        if transition not in transition_start_state.get_transitions():
             return
 
-        transition_start_state: State = transition.get_start_state()
         transition_start_state.remove_transition(transition)
-
-        self.transitions.remove(transition)
-        del transition
-
-        self.get_transitions(True)  # Update the Transitions set
+        transition.get_transition_target().remove_incoming_transition(transition)
+        self.transitions.discard(transition)
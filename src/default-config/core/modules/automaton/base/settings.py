@@ -1,11 +1,12 @@
-from automaton.base.QAutomatonInputWidget import QAutomatonInputOutput, QAutomatonTokenIO
-
 # Standard typing imports for aps
 import collections.abc as _a
 import abc as _abc
 import typing as _ty
 import types as _ts
 
+if _ty.TYPE_CHECKING:
+    from automaton.base.QAutomatonInputWidget import QAutomatonInputOutput
+
 
 class Settings(_abc.ABC):
     def __init__(self, module_name: str,
@@ -15,7 +16,7 @@ class Settings(_abc.ABC):
                  customisable_token_list: _ty.List[bool],
                  transition_description_layout: _ty.List[int],
                  state_types_with_design: _ty.Dict[str, str],
-                 input_widget: _ty.Type[QAutomatonInputOutput] = QAutomatonTokenIO):
+                 input_widget: _ty.Type["QAutomatonInputOutput"] | None = None):
         """ Constructor of the automaton settings file.
         This file serves as a settings-provider to make basic automaton settings (like the transition content)
         :param module_name: The short name of the automaton module (e.g. for a Deterministic Finite Automaton -> dfa)
@@ -26,6 +27,8 @@ class Settings(_abc.ABC):
         :param transition_description_layout: This parameter defines which format the transition description has (format [0, 1] if the transition should have two parameters, and if the first transition attribute should be an element of the first token_list and the second attribute an element out of the second list)
         :param state_types_with_design: The different possible state types (like end or default) are the keys and the value is the design
         :param input_widget: the _ty.Type[QAutomatonInputOutput] which should handle the input of the automaton
+                             (None for the default QAutomatonTokenIO, which is only imported once it is needed, so that
+                             the settings can be loaded without PySide6)
         """
         self._module_name: str = module_name
         self._full_automaton_name: str = full_automaton_name
@@ -34,7 +37,7 @@ class Settings(_abc.ABC):
         self._customisable_token_list: _ty.List[bool] = customisable_token_list
         self._transition_description_layout: _ty.List[int] = transition_description_layout
         self._state_types_with_design: _ty.Dict[str, str] = state_types_with_design
-        self._input_widget: _ty.Type[QAutomatonInputOutput] = input_widget
+        self._input_widget: _ty.Type["QAutomatonInputOutput"] | None = input_widget
 
     @property
     def module_name(self) -> str:
@@ -65,7 +68,10 @@ class Settings(_abc.ABC):
         return self._state_types_with_design
 
     @property
-    def input_widget(self) -> _ty.Type[QAutomatonInputOutput]:
+    def input_widget(self) -> _ty.Type["QAutomatonInputOutput"]:
+        if self._input_widget is None:
+            from automaton.base.QAutomatonInputWidget import QAutomatonTokenIO
+            self._input_widget = QAutomatonTokenIO
         return self._input_widget
 
     def __iter__(self):
@@ -76,5 +82,5 @@ class Settings(_abc.ABC):
                                       self._customisable_token_list,
                                       self._transition_description_layout,
                                       self._state_types_with_design,
-                                      self._input_widget]
+                                      self.input_widget]
         return iter(content)
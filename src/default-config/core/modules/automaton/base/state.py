@@ -29,6 +29,9 @@ class State(_abc.ABC):
             A set of transitions associated with this state. These define how the
             automaton moves to other states based on input.
 
+        _incoming_transitions (OrderedSet[Transition]):
+            The transitions leading to this state.
+
         _state_name (str):
             The name of the state. This is typically used for identification.
 
@@ -47,6 +50,12 @@ class State(_abc.ABC):
         get_transitions() -> _ty.Set[Transition]:
             Returns the set of transitions associated with this state.
 
+        get_incoming_transitions() -> OrderedSet[Transition]:
+            Returns the transitions leading to this state.
+
+        match_transition(current_input: _ty.Any) -> Transition | None:
+            Returns the first transition valid for the input, preferring the allocation free protocol.
+
         find_transition(current_input_char: str) -> _result.Result:
             Abstract method to find a transition based on the current input character.
             Must be implemented by subclasses.
@@ -80,6 +89,7 @@ class State(_abc.ABC):
             - `activation_callback`: Set to `None` initially.
         """
         self._transitions: OrderedSet[Transition] = OrderedSet()
+        self._incoming_transitions: OrderedSet[Transition] = OrderedSet()
         self._state_name: str = name
         self._activation_callback: _ty.Callable or None = None
 
@@ -130,6 +140,54 @@ class State(_abc.ABC):
         """
         self._transitions.remove(old_transition)
 
+    def get_incoming_transitions(self) -> OrderedSet["Transition"]:
+        """
+        Returns the transitions leading to this state.
+
+        Returns:
+            OrderedSet[Transition]: The incoming transitions.
+        """
+        return self._incoming_transitions
+
+    def add_incoming_transition(self, new_transition: "Transition") -> None:
+        """
+        Adds a transition leading to this state.
+
+        Args:
+            new_transition (Transition): The incoming transition to add.
+        """
+        self._incoming_transitions.add(new_transition)
+
+    def remove_incoming_transition(self, old_transition: "Transition") -> None:
+        """
+        Removes a transition leading to this state, if it is present.
+
+        Args:
+            old_transition (Transition): The incoming transition to remove.
+        """
+        self._incoming_transitions.discard(old_transition)
+
+    def match_transition(self, current_input: _ty.Any) -> Transition | None:
+        """
+        Returns the first transition which is valid for the input.
+
+        Transitions with a fast path are checked through `Transition.matches`, which does not allocate, all others
+        through `Transition.canTransition`.
+
+        Args:
+            current_input (_ty.Any): The current input, the symbol id for the built-in automata.
+
+        Returns:
+            Transition | None: The valid transition, None if there is none.
+        """
+        for transition in self._transitions:
+            if transition.has_fast_path():
+                if transition.matches(current_input):
+                    return transition
+            elif isinstance(transition.canTransition(current_input), _result.Success):
+                return transition
+        return None
+
     @_abc.abstractmethod
     def find_transition(self, current_input_char: str) -> _result.Result:
         """
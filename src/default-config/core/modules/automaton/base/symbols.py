@@ -0,0 +1,80 @@
+"""TBA"""
+from array import array
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+class SymbolTable:
+    """Interns symbols (the tokens of an automaton) to small, dense integer ids.
+
+    The first interned symbol gets the id 0, the second one the id 1 and so on. This allows engines to index arrays
+    with symbols instead of hashing and comparing the (possibly multi character) tokens on every step.
+    """
+
+    def __init__(self, symbols: _ty.Iterable[_ty.Any] = ()) -> None:
+        self._ids: _ty.Dict[_ty.Any, int] = {}
+        self._symbols: _ty.List[_ty.Any] = []
+
+        for symbol in symbols:
+            self.intern(symbol)
+
+    def intern(self, symbol: _ty.Any) -> int:
+        """Returns the id of a symbol, assigning the next free id if the symbol is not known yet
+
+        :param symbol: The symbol to intern
+        :return: The id of the symbol
+        """
+        symbol_id: int | None = self._ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbols)
+            self._ids[symbol] = symbol_id
+            self._symbols.append(symbol)
+        return symbol_id
+
+    def get_id(self, symbol: _ty.Any, default: int = -1) -> int:
+        """Returns the id of a symbol without interning it
+
+        :param symbol: The symbol to look up
+        :param default: The value returned for unknown symbols
+        :return: The id of the symbol or default
+        """
+        return self._ids.get(symbol, default)
+
+    def get_symbol(self, symbol_id: int) -> _ty.Any:
+        """Returns the symbol with the given id
+
+        :param symbol_id: The id of the symbol
+        :return: The symbol
+        """
+        return self._symbols[symbol_id]
+
+    def get_id_map(self) -> _ty.Dict[_ty.Any, int]:
+        """Returns the internal symbol -> id mapping. The mapping must not be modified.
+
+        :return: The symbol -> id mapping
+        """
+        return self._ids
+
+    def encode(self, symbols: _ty.Iterable[_ty.Any], default: int = -1) -> array:
+        """Encodes a sequence of symbols into an array of symbol ids
+
+        :param symbols: The symbols to encode
+        :param default: The id used for unknown symbols
+        :return: An array of symbol ids
+        """
+        lookup: _ty.Callable[[_ty.Any, int], int] = self._ids.get
+        return array("i", [lookup(symbol, default) for symbol in symbols])
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: _ty.Any) -> bool:
+        return symbol in self._ids
+
+    def __iter__(self) -> _a.Iterator[_ty.Any]:
+        return iter(self._symbols)
+
+    def __repr__(self) -> str:
+        return f"SymbolTable({self._symbols})"
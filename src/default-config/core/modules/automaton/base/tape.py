@@ -0,0 +1,278 @@
+"""TBA"""
+from array import array
+from itertools import chain as _chain, islice as _islice
+
+# Abstract Machine related imports
+from automaton.base.symbols import SymbolTable
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+class TapeView(_a.Sequence):
+    """
+    A read only window onto a tape, which does not copy any cells.
+
+    The view addresses cells relative to its start, so `view[0]` is the cell `start` of the tape. Changes on the tape
+    are visible through the view.
+
+    Attributes:
+        _tape (Tape): The viewed tape.
+        _start (int): The tape index of the first cell of the view.
+        _stop (int): The tape index after the last cell of the view.
+    """
+
+    def __init__(self, tape: "Tape", start: int, stop: int) -> None:
+        """
+        Initializes a view onto the cells start to stop (exclusive) of a tape.
+
+        Args:
+            tape (Tape): The tape to view.
+            start (int): The tape index of the first cell.
+            stop (int): The tape index after the last cell.
+        """
+        self._tape: Tape = tape
+        self._start: int = start
+        self._stop: int = max(start, stop)
+
+    def get_start(self) -> int:
+        """
+        Returns the tape index of the first cell of the view.
+
+        Returns:
+            int: The tape index.
+        """
+        return self._start
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: int | slice) -> _ty.Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TapeView index out of range")
+        return self._tape.get_cell(self._start + index)
+
+    def __iter__(self) -> _a.Iterator[_ty.Any]:
+        return map(self._tape.get_symbols().get_symbol, self._tape.iter_ids(self._start, self._stop))
+
+    def __repr__(self) -> str:
+        return f"TapeView({list(self)})"
+
+
+class Tape:
+    """
+    A two-way infinite tape for Turing machines.
+
+    The cells are stored as interned symbol ids in two growable integer arrays: one half for the indices 0, 1, 2, ...
+    and one for -1, -2, -3, ... . Reading, writing and moving the head are O(1) (amortized when the tape grows), the
+    bounds are the visited cells and are tracked through the lengths of the halves.
+
+    Attributes:
+        _symbols (SymbolTable): Interns the (possibly multi character) tokens.
+        _blank (int): The id of the blank symbol.
+        _right (array): The cells 0, 1, 2, ...
+        _left (array): The cells -1, -2, -3, ...
+        _head (int): The index of the cell under the head.
+    """
+
+    def __init__(self, blank: _ty.Any = "B", symbols: SymbolTable | None = None) -> None:
+        """
+        Initializes an empty tape, which only consists of a blank cell at index 0.
+
+        Args:
+            blank (_ty.Any): The blank symbol written to newly visited cells.
+            symbols (SymbolTable | None): The symbol table to intern the tokens with, a new one if None.
+        """
+        self._symbols: SymbolTable = symbols if symbols is not None else SymbolTable()
+        self._blank: int = self._symbols.intern(blank)
+        self._right: array = array("i", [self._blank])
+        self._left: array = array("i")
+        self._head: int = 0
+
+    def load(self, word: _ty.Iterable[_ty.Any]) -> None:
+        """
+        Replaces the content of the tape with a word, starting at index 0, and moves the head to index 0.
+
+        Args:
+            word (_ty.Iterable[_ty.Any]): The tokens to write onto the tape.
+        """
+        intern: _ty.Callable[[_ty.Any], int] = self._symbols.intern
+        self._right = array("i", [intern(symbol) for symbol in word]) or array("i", [self._blank])
+        self._left = array("i")
+        self._head = 0
+
+    def get_symbols(self) -> SymbolTable:
+        """
+        Returns the symbol table used to intern the tokens.
+
+        Returns:
+            SymbolTable: The symbol table.
+        """
+        return self._symbols
+
+    def get_blank(self) -> _ty.Any:
+        """
+        Returns the blank symbol.
+
+        Returns:
+            _ty.Any: The blank symbol.
+        """
+        return self._symbols.get_symbol(self._blank)
+
+    def get_head(self) -> int:
+        """
+        Returns the index of the cell under the head.
+
+        Returns:
+            int: The head index.
+        """
+        return self._head
+
+    def get_bounds(self) -> _ty.Tuple[int, int]:
+        """
+        Returns the lowest and the highest index of the visited cells.
+
+        Returns:
+            _ty.Tuple[int, int]: The lowest and the highest index (inclusive).
+        """
+        return -len(self._left), len(self._right) - 1
+
+    def get_cell_id(self, index: int) -> int:
+        """
+        Returns the symbol id of a cell, cells that were never visited are blank.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            int: The symbol id.
+        """
+        if index >= 0:
+            return self._right[index] if index < len(self._right) else self._blank
+        index = -index - 1
+        return self._left[index] if index < len(self._left) else self._blank
+
+    def get_cell(self, index: int) -> _ty.Any:
+        """
+        Returns the symbol of a cell, cells that were never visited are blank.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            _ty.Any: The symbol.
+        """
+        return self._symbols.get_symbol(self.get_cell_id(index))
+
+    def read_id(self) -> int:
+        """
+        Returns the symbol id under the head.
+
+        Returns:
+            int: The symbol id.
+        """
+        if self._head >= 0:
+            return self._right[self._head]
+        return self._left[-self._head - 1]
+
+    def read(self) -> _ty.Any:
+        """
+        Returns the symbol under the head.
+
+        Returns:
+            _ty.Any: The symbol.
+        """
+        return self._symbols.get_symbol(self.read_id())
+
+    def write_id(self, symbol_id: int) -> None:
+        """
+        Writes a symbol id into the cell under the head.
+
+        Args:
+            symbol_id (int): The symbol id to write.
+        """
+        if self._head >= 0:
+            self._right[self._head] = symbol_id
+        else:
+            self._left[-self._head - 1] = symbol_id
+
+    def write(self, symbol: _ty.Any) -> None:
+        """
+        Writes a symbol into the cell under the head.
+
+        Args:
+            symbol (_ty.Any): The symbol to write.
+        """
+        self.write_id(self._symbols.intern(symbol))
+
+    def move_left(self) -> None:
+        """
+        Moves the head one cell to the left, a blank cell is added if the cell was not visited yet.
+        """
+        self._head -= 1
+        if self._head < 0 and -self._head > len(self._left):
+            self._left.append(self._blank)
+
+    def move_right(self) -> None:
+        """
+        Moves the head one cell to the right, a blank cell is added if the cell was not visited yet.
+        """
+        self._head += 1
+        if self._head >= len(self._right):
+            self._right.append(self._blank)
+
+    def iter_ids(self, start: int, stop: int) -> _a.Iterator[int]:
+        """
+        Iterates over the symbol ids of the cells start to stop (exclusive).
+
+        Args:
+            start (int): The index of the first cell.
+            stop (int): The index after the last cell.
+
+        Returns:
+            _a.Iterator[int]: An iterator over the symbol ids.
+        """
+        low, high = self.get_bounds()
+        if start >= stop:
+            return iter(())
+        if start < low or stop > high + 1:  # Parts outside the visited cells are blank
+            return (self.get_cell_id(i) for i in range(start, stop))
+
+        # reversed(self._left) yields the cells from the lowest index upwards, the cell i is at position i - low
+        left_part: _a.Iterator[int] = _islice(reversed(self._left), max(0, start - low), max(0, min(stop, 0) - low))
+        right_part: _a.Iterator[int] = _islice(self._right, max(0, start), max(0, stop))
+        return _chain(left_part, right_part)
+
+    def window(self, start: int | None = None, stop: int | None = None) -> TapeView:
+        """
+        Returns a view onto the cells start to stop (exclusive) without copying them.
+
+        Args:
+            start (int | None): The index of the first cell, the lowest visited index if None.
+            stop (int | None): The index after the last cell, the index after the highest visited one if None.
+
+        Returns:
+            TapeView: The view.
+        """
+        low, high = self.get_bounds()
+        return TapeView(self, low if start is None else start, high + 1 if stop is None else stop)
+
+    def get_content(self) -> _ty.List[_ty.Any]:
+        """
+        Returns the symbols of all visited cells, from the lowest to the highest index.
+
+        Returns:
+            _ty.List[_ty.Any]: The symbols.
+        """
+        return list(self.window())
+
+    def __len__(self) -> int:
+        return len(self._left) + len(self._right)
+
+    def __repr__(self) -> str:
+        return f"Tape({self.get_content()}, head={self._head})"
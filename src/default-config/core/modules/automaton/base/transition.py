@@ -12,6 +12,7 @@ import types as _ts
 
 # Abstract Machine related imports
 from automaton.base.state import State
+from automaton.base.symbols import SymbolTable
 
 
 # Docs generated with Chat-GPT
@@ -25,6 +26,10 @@ class Transition(_abc.ABC):
         start_state (State): The state where the transition originates.
         transition_target_state (State): The state to which the transition leads.
         activation_callback (_ty.Callable or None): An optional callback triggered when the transition is activated.
+
+    Note:
+        Once the transition is added to an automaton, the tokens of its condition are interned into the symbol table
+        of the automaton (see `intern_condition`), so engines can compare symbol ids instead of tokens.
     """
 
     def __init__(self, start_state: State,
@@ -44,8 +49,13 @@ class Transition(_abc.ABC):
         self._condition: _ty.List[_ty.Any] = condition
         self._is_active: bool = False
 
-        # Automatically adds this transition to the start state's set of transitions.
+        self._symbols: SymbolTable | None = None  # The symbol table of the automaton, once it was added to one
+        self._condition_ids: _ty.Tuple[int, ...] = ()
+
+        # Automatically adds this transition to the start state's set of transitions and the target state's set of
+        # incoming transitions.
         self.start_state.add_transition(self)
+        self.transition_target_state.add_incoming_transition(self)
 
     @_abc.abstractmethod
     def canTransition(self, current_input: _ty.Any) -> _result.Result:
@@ -68,6 +78,70 @@ class Transition(_abc.ABC):
         """
         raise NotImplementedError("canTransition must be implemented in a subclass.")
 
+    def has_fast_path(self) -> bool:
+        """
+        Returns whether the transition implements the allocation free protocol (`matches` and `effect`).
+
+        States prefer it over `canTransition` when looking for a transition, transitions without it are checked
+        through `canTransition`.
+
+        Returns:
+            bool: True if `matches` and `effect` are implemented, False otherwise.
+        """
+        return False
+
+    def matches(self, current_input: _ty.Any) -> bool:
+        """
+        Determines if the transition is valid for the given input, without allocating a result.
+
+        Subclasses returning True from `has_fast_path` must override this and `effect`. The default falls back to
+        `canTransition`.
+
+        Args:
+            current_input (_ty.Any): The input to evaluate for this transition.
+
+        Returns:
+            bool: True if the transition is valid, False otherwise.
+        """
+        return isinstance(self.canTransition(current_input), _result.Success)
+
+    def effect(self) -> _ty.Any:
+        """
+        Returns the value `canTransition` carries on success (e.g. the output of a Mealy transition).
+
+        It is only called for inputs `matches` returned True for, so it should return a preallocated value.
+
+        Returns:
+            _ty.Any: The effect of taking the transition, None by default.
+        """
+        return None
+
+    def get_effect(self, current_input: _ty.Any) -> _ty.Any:
+        """
+        Returns the effect of taking the transition for an input it is valid for, through `effect` if the
+        transition has a fast path and through `canTransition` otherwise.
+
+        Args:
+            current_input (_ty.Any): The input the transition is valid for.
+
+        Returns:
+            _ty.Any: The effect of taking the transition.
+        """
+        if self.has_fast_path():
+            return self.effect()
+        return self.canTransition(current_input).unwrap()
+
+    def is_epsilon(self) -> bool:
+        """
+        Returns whether the transition is taken without consuming any input (an ε-transition).
+
+        Only nondeterministic automata have ε-transitions, engines follow them before every step.
+
+        Returns:
+            bool: True if the transition is an ε-transition, False by default.
+        """
+        return False
+
     def get_transition_target(self) -> State:
         """
         Retrieves the state this transition leads to.
@@ -103,6 +177,27 @@ class Transition(_abc.ABC):
             new_condition (_ty.Any): The new condition for the transition.
         """
         self._condition = new_condition
+        if self._symbols is not None:
+            self.intern_condition(self._symbols)
+
+    def intern_condition(self, symbols: SymbolTable) -> None:
+        """
+        Interns the tokens of the condition into a symbol table. The condition is interned again whenever it changes.
+
+        Args:
+            symbols (SymbolTable): The symbol table of the automaton the transition belongs to.
+        """
+        self._symbols = symbols
+        self._condition_ids = tuple(symbols.intern(token) for token in self._condition)
+
+    def get_condition_ids(self) -> _ty.Tuple[int, ...]:
+        """
+        Retrieves the interned condition, one symbol id per token.
+
+        Returns:
+            _ty.Tuple[int, ...]: The ids of the condition tokens, empty if the condition was not interned yet.
+        """
+        return self._condition_ids
 
     def set_activation_callback(self, callback: _ty.Callable) -> None:
         """
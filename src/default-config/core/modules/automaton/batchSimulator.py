@@ -0,0 +1,138 @@
+"""TBA"""
+from itertools import chain as _chain, repeat as _repeat
+
+import numpy as _np
+from returns import result as _result
+
+# Abstract Machine related imports
+from automaton.automatonSimulator import AutomatonSimulator
+from automaton.compiledAutomaton import CompiledDFA
+from automaton.base.automaton import Automaton
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+class BatchSimulator:
+    """Decides acceptance of many words at once on a compiled deterministic automaton.
+
+    All words are encoded into one (word × position) symbol matrix and advanced in lock-step, one fancy-indexing
+    lookup into the transition table per column. The table used here extends the compiled table by
+    - a sink row for the dead state, so that stuck words keep a valid (non-negative) state id and
+    - a padding column, which leaves every state unchanged, so that shorter words simply stop moving.
+    """
+
+    def __init__(self, compiled: CompiledDFA) -> None:
+        self._compiled: CompiledDFA = compiled
+
+        state_count: int = compiled.get_state_count()
+        width: int = compiled.get_width()
+        self._dead_state: int = state_count  # Sink row
+        self._padding_id: int = width  # Column after the unknown symbol column
+
+        table: _np.ndarray = _np.frombuffer(compiled.get_table(), dtype=_np.int32).reshape(state_count, width)
+        table = _np.where(table == CompiledDFA.DEAD_STATE, self._dead_state, table)
+
+        self._table: _np.ndarray = _np.full((state_count + 1, width + 1), self._dead_state, dtype=_np.int32)
+        self._table[:state_count, :width] = table
+        self._table[:, self._padding_id] = _np.arange(state_count + 1, dtype=_np.int32)
+
+        self._accepting: _np.ndarray = _np.zeros(state_count + 1, dtype=_np.bool_)
+        self._accepting[:state_count] = _np.frombuffer(compiled.get_accepting(), dtype=_np.uint8).astype(_np.bool_)
+
+    @classmethod
+    def from_automaton(cls, automaton: Automaton) -> _ty.Self:
+        """Creates a batch simulator for a built, deterministic automaton
+
+        :param automaton: The automaton, e.g. a loaded DFAAutomaton
+        :return: The batch simulator
+        """
+        return cls(CompiledDFA.from_automaton(automaton))
+
+    @classmethod
+    def from_request(cls, simulation_request: _ty.Dict[str, _ty.Any]) -> _ty.Self:
+        """Creates a batch simulator from a serialised automaton, as it is sent to the backend
+
+        The automaton classes are looked up through the AutomatonProvider, so every loaded deterministic
+        extension can be used.
+
+        :param simulation_request: The serialised automaton (only "id" and "content" are used)
+        :return: The batch simulator
+        """
+        simulator: AutomatonSimulator = AutomatonSimulator(simulation_request, lambda _: None, lambda *_: None)
+        build_result: _result.Result = simulator.build()
+        if not isinstance(build_result, _result.Success):
+            raise ValueError(build_result.failure())
+        return cls.from_automaton(build_result.unwrap().get_implementation())
+
+    def get_compiled(self) -> CompiledDFA:
+        """Returns the compiled automaton the batch simulator runs on
+
+        :return: The compiled automaton
+        """
+        return self._compiled
+
+    def encode(self, words: _ty.Sequence[_ty.Sequence[_ty.Any]], padding: _ty.Any = None) -> _np.ndarray:
+        """Encodes words into a (word × position) symbol id matrix
+
+        Words shorter than the longest word are padded. Symbols equal to `padding` are treated as padding too, so
+        words which were already padded by the caller keep their original length.
+
+        :param words: The words to encode
+        :param padding: The padding symbol used by the caller, None if the words are not padded
+        :return: The symbol id matrix
+        """
+        symbol_ids: _ty.Dict[_ty.Any, int] = self._compiled.get_symbols().get_id_map()
+        if padding is not None:
+            symbol_ids = {**symbol_ids, padding: self._padding_id}
+        unknown: int = self._compiled.get_width() - 1
+
+        lengths: _np.ndarray = _np.fromiter((len(word) for word in words), dtype=_np.int64, count=len(words))
+        length: int = int(lengths.max()) if len(words) else 0
+        flat_ids: _np.ndarray = _np.fromiter(map(symbol_ids.get, _chain.from_iterable(words), _repeat(unknown)),
+                                             dtype=_np.int32, count=int(lengths.sum()))
+
+        if (lengths == length).all():  # No padding needed
+            return flat_ids.reshape(len(words), length)
+
+        matrix: _np.ndarray = _np.full((len(words), length), self._padding_id, dtype=_np.int32)
+        matrix[_np.arange(length) < lengths[:, None]] = flat_ids
+        return matrix
+
+    def run_encoded(self, matrix: _np.ndarray) -> _ty.Tuple[_np.ndarray, _np.ndarray]:
+        """Runs all encoded words in lock-step
+
+        :param matrix: A symbol id matrix as returned by `encode`
+        :return: A bool vector which is True for accepted words and, per word, the index of the symbol it got stuck
+                 on (-1 if the word did not get stuck)
+        """
+        word_count: int = matrix.shape[0]
+        first_failures: _np.ndarray = _np.full(word_count, -1, dtype=_np.int64)
+
+        start_state: int = self._compiled.get_start_state()
+        if start_state == CompiledDFA.DEAD_STATE:
+            return _np.zeros(word_count, dtype=_np.bool_), first_failures
+
+        states: _np.ndarray = _np.full(word_count, start_state, dtype=_np.int32)
+        alive: _np.ndarray = _np.ones(word_count, dtype=_np.bool_)
+        for column in range(matrix.shape[1]):
+            states = self._table[states, matrix[:, column]]
+
+            stuck: _np.ndarray = alive & (states == self._dead_state)
+            if stuck.any():
+                first_failures[stuck] = column
+                alive &= ~stuck
+
+        return self._accepting[states], first_failures
+
+    def run(self, words: _ty.Sequence[_ty.Sequence[_ty.Any]],
+            padding: _ty.Any = None) -> _ty.Tuple[_np.ndarray, _np.ndarray]:
+        """Decides acceptance for all words
+
+        :param words: The words to check
+        :param padding: The padding symbol used by the caller, None if the words are not padded
+        :return: A bool vector which is True for accepted words and, per word, the index of the symbol it got stuck
+                 on (-1 if the word did not get stuck)
+        """
+        return self.run_encoded(self.encode(words, padding))
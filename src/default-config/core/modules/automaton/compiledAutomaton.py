@@ -0,0 +1,796 @@
+"""TBA"""
+from collections import OrderedDict
+from array import array
+from itertools import islice
+
+from returns import result as _result
+
+# Abstract Machine related imports
+from automaton.base.automaton import Automaton
+from automaton.base.state import State
+from automaton.base.transition import Transition
+from automaton.base.symbols import SymbolTable
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+class CompiledDFA:
+    """A deterministic automaton compiled into a dense (state × symbol) transition table.
+
+    States are numbered by their index in the automaton's state set and symbols by their id in the symbol table.
+    The row of a state `s` occupies `table[s * width:(s + 1) * width]`. The last column of every row is reserved for
+    symbols which are not part of the automaton's alphabet and always leads to the dead state.
+    """
+    DEAD_STATE: int = -1
+
+    def __init__(self, symbols: SymbolTable, state_count: int, table: array, transition_table: array,
+                 start_state: int, accepting: bytearray) -> None:
+        self._symbols: SymbolTable = symbols
+        self._state_count: int = state_count
+        self._width: int = len(symbols) + 1  # +1 for the unknown symbol column
+        self._table: array = table
+        self._transition_table: array = transition_table
+        self._start_state: int = start_state
+        self._accepting: bytearray = accepting
+
+    @classmethod
+    def from_automaton(cls, automaton: Automaton) -> _ty.Self:
+        """Compiles a built, deterministic automaton into a transition table
+
+        If a state has multiple transitions for the same symbol, the first one wins, just like in
+        `find_transition`. Transitions leading to states that are not part of the automaton are ignored.
+
+        :param automaton: The automaton to compile
+        :return: The compiled automaton
+        """
+        if not automaton.is_deterministic():
+            raise ValueError(f"Can not compile the non deterministic automaton {type(automaton).__name__}")
+
+        states: _ty.List[State] = list(automaton.get_states())
+        state_ids: _ty.Dict[State, int] = {state: i for i, state in enumerate(states)}
+        transition_ids: _ty.Dict[Transition, int] = {transition: i for i, transition
+                                                     in enumerate(automaton.get_transitions())}
+
+        symbols: SymbolTable = SymbolTable()
+        for state in states:
+            for transition in state.get_transitions():
+                condition: _ty.List[_ty.Any] = transition.get_condition()
+                if condition:
+                    symbols.intern(condition[0])
+
+        width: int = len(symbols) + 1
+        table: array = array("i", [cls.DEAD_STATE]) * (len(states) * width)
+        transition_table: array = array("i", [-1]) * (len(states) * width)
+
+        for state_id, state in enumerate(states):
+            row: int = state_id * width
+            for transition in state.get_transitions():
+                condition = transition.get_condition()
+                target_id: int | None = state_ids.get(transition.get_transition_target())
+                if not condition or target_id is None:
+                    continue
+
+                cell: int = row + symbols.get_id(condition[0])
+                if table[cell] != cls.DEAD_STATE:
+                    continue  # The first matching transition wins
+                table[cell] = target_id
+                transition_table[cell] = transition_ids.get(transition, -1)
+
+        accepting: bytearray = bytearray(len(states))
+        for state in automaton.get_end_states():
+            if state in state_ids:
+                accepting[state_ids[state]] = 1
+
+        start_state: int = state_ids.get(automaton.get_start_state(), cls.DEAD_STATE)
+        return cls(symbols, len(states), table, transition_table, start_state, accepting)
+
+    def get_symbols(self) -> SymbolTable:
+        """Returns the symbol table used to intern the input symbols
+
+        :return: The symbol table
+        """
+        return self._symbols
+
+    def get_state_count(self) -> int:
+        """Returns the number of states
+
+        :return: The number of states
+        """
+        return self._state_count
+
+    def get_width(self) -> int:
+        """Returns the width of a table row (number of symbols + the unknown symbol column)
+
+        :return: The row width
+        """
+        return self._width
+
+    def get_table(self) -> array:
+        """Returns the flat (state × symbol) -> next state table
+
+        :return: The transition table
+        """
+        return self._table
+
+    def get_transition_table(self) -> array:
+        """Returns the flat (state × symbol) -> transition index table
+
+        :return: The transition index table
+        """
+        return self._transition_table
+
+    def get_start_state(self) -> int:
+        """Returns the id of the start state, or DEAD_STATE if the automaton has none
+
+        :return: The id of the start state
+        """
+        return self._start_state
+
+    def get_accepting(self) -> bytearray:
+        """Returns a flag per state, which is 1 for end states
+
+        :return: The accepting flags
+        """
+        return self._accepting
+
+    def is_accepting(self, state: int) -> bool:
+        """Returns whether a state is an end state
+
+        :param state: The id of the state
+        :return: True if the state is an end state
+        """
+        return state != self.DEAD_STATE and self._accepting[state] == 1
+
+    def step(self, state: int, symbol: _ty.Any) -> _ty.Tuple[int, int]:
+        """Executes a single step
+
+        :param state: The id of the current state
+        :param symbol: The input symbol
+        :return: The id of the next state (DEAD_STATE if there is none) and the index of the used transition
+        """
+        cell: int = state * self._width + self._symbols.get_id(symbol, self._width - 1)
+        return self._table[cell], self._transition_table[cell]
+
+    def run(self, word: _ty.Iterable[_ty.Any], state: int | None = None) -> _ty.Tuple[int, int]:
+        """Runs the automaton over a whole word
+
+        :param word: The input symbols
+        :param state: The id of the state to start in, the start state if None. Continues a run over the next part
+                      of a word.
+        :return: The id of the final state and the number of consumed symbols. If the automaton got stuck the state
+                 is DEAD_STATE and the number of consumed symbols is the index of the symbol it got stuck on.
+        """
+        if state is None:
+            state = self._start_state
+        if state == self.DEAD_STATE:
+            return state, 0
+
+        table: array = self._table
+        width: int = self._width
+        unknown: int = width - 1
+        lookup: _ty.Callable[[_ty.Any, int], int] = self._symbols.get_id_map().get
+
+        consumed: int = 0
+        for symbol in word:
+            state = table[state * width + lookup(symbol, unknown)]
+            if state < 0:
+                return state, consumed
+            consumed += 1
+        return state, consumed
+
+    def accepts(self, word: _ty.Iterable[_ty.Any]) -> bool:
+        """Returns whether the automaton accepts a word
+
+        :param word: The input symbols
+        :return: True if the word is accepted
+        """
+        return self.is_accepting(self.run(word)[0])
+
+    def get_result(self, state: int) -> _result.Result:
+        """Converts a final state into the simulation result
+
+        :param state: The id of the final state
+        :return: Success if the state is an end state, Failure otherwise
+        """
+        if self._start_state == self.DEAD_STATE:
+            return _result.Failure("No start state found")
+        if state == self.DEAD_STATE:
+            return _result.Failure("No valid transition found!")
+        if self._accepting[state]:
+            return _result.Success("Automaton terminated in an end state!")
+        return _result.Failure("Automaton failed to terminate in an end state!")
+
+    def simulate(self, word: _ty.Iterable[_ty.Any]) -> _result.Result:
+        """Runs the automaton over a whole word and returns the simulation result
+
+        :param word: The input symbols
+        :return: The result of the simulation
+        """
+        return self.get_result(self.run(word)[0])
+
+
+class CompiledMealy:
+    """A deterministic transducer compiled into dense (state × symbol) next state and output tables.
+
+    States and input symbols are numbered like in `CompiledDFA`, the last column of every row is used for symbols
+    which are not part of the automaton's alphabet (only a wildcard transition can take them). The outputs are
+    interned into their own symbol table, the output table holds their ids.
+    The input is read lazily and the outputs are handed out in chunks, so words of any length are transduced in bounded
+    memory.
+    """
+    DEAD_STATE: int = -1
+    CHUNK_SIZE: int = 64 * 1024  # Input symbols transduced before their outputs are handed out
+
+    def __init__(self, symbols: SymbolTable, outputs: SymbolTable, state_count: int, table: array,
+                 output_table: array, transition_table: array, start_state: int) -> None:
+        self._symbols: SymbolTable = symbols
+        self._outputs: SymbolTable = outputs
+        self._state_count: int = state_count
+        self._width: int = len(symbols) + 1  # +1 for the unknown symbol column
+        self._table: array = table
+        self._output_table: array = output_table
+        self._transition_table: array = transition_table
+        self._start_state: int = start_state
+
+    @classmethod
+    def from_automaton(cls, automaton: Automaton) -> _ty.Self:
+        """Compiles a built transducer into transition and output tables
+
+        Every (state, symbol) cell is filled by asking the state for its first valid transition, exactly like a
+        simulation step does, so wildcards and the order of the transitions are kept. Transitions leading to states
+        that are not part of the automaton are ignored.
+
+        :param automaton: The transducer to compile
+        :return: The compiled transducer
+        """
+        if not automaton.is_transducer():
+            raise ValueError(f"Can not compile {type(automaton).__name__}, it is not a deterministic transducer")
+
+        states: _ty.List[State] = list(automaton.get_states())
+        state_ids: _ty.Dict[State, int] = {state: i for i, state in enumerate(states)}
+        transition_ids: _ty.Dict[Transition, int] = {transition: i for i, transition
+                                                     in enumerate(automaton.get_transitions())}
+
+        symbols: SymbolTable = SymbolTable(automaton.get_symbols())  # A copy, so the ids match the interned ones
+        outputs: SymbolTable = SymbolTable()
+        width: int = len(symbols) + 1
+        table: array = array("i", [cls.DEAD_STATE]) * (len(states) * width)
+        output_table: array = array("i", [-1]) * (len(states) * width)
+        transition_table: array = array("i", [-1]) * (len(states) * width)
+
+        for state_id, state in enumerate(states):
+            row: int = state_id * width
+            for symbol_id in range(width):
+                transition: Transition | None = state.match_transition(symbol_id if symbol_id < width - 1 else -1)
+                if transition is None:
+                    continue
+                target_id: int | None = state_ids.get(transition.get_transition_target())
+                if target_id is None:
+                    continue
+
+                cell: int = row + symbol_id
+                table[cell] = target_id
+                output_table[cell] = outputs.intern(transition.get_effect(symbol_id))
+                transition_table[cell] = transition_ids.get(transition, -1)
+
+        start_state: int = state_ids.get(automaton.get_start_state(), cls.DEAD_STATE)
+        return cls(symbols, outputs, len(states), table, output_table, transition_table, start_state)
+
+    def get_symbols(self) -> SymbolTable:
+        """Returns the symbol table used to intern the input symbols
+
+        :return: The input symbol table
+        """
+        return self._symbols
+
+    def get_outputs(self) -> SymbolTable:
+        """Returns the symbol table the outputs are interned in
+
+        :return: The output symbol table
+        """
+        return self._outputs
+
+    def get_state_count(self) -> int:
+        """Returns the number of states
+
+        :return: The number of states
+        """
+        return self._state_count
+
+    def get_width(self) -> int:
+        """Returns the width of a table row (number of symbols + the unknown symbol column)
+
+        :return: The row width
+        """
+        return self._width
+
+    def get_table(self) -> array:
+        """Returns the flat (state × symbol) -> next state table
+
+        :return: The transition table
+        """
+        return self._table
+
+    def get_output_table(self) -> array:
+        """Returns the flat (state × symbol) -> output id table
+
+        :return: The output table
+        """
+        return self._output_table
+
+    def get_transition_table(self) -> array:
+        """Returns the flat (state × symbol) -> transition index table
+
+        :return: The transition index table
+        """
+        return self._transition_table
+
+    def get_start_state(self) -> int:
+        """Returns the id of the start state, or DEAD_STATE if the transducer has none
+
+        :return: The id of the start state
+        """
+        return self._start_state
+
+    def step(self, state: int, symbol: _ty.Any) -> _ty.Tuple[int, _ty.Any]:
+        """Executes a single step
+
+        :param state: The id of the current state
+        :param symbol: The input symbol
+        :return: The id of the next state (DEAD_STATE if there is none) and the output, None if there is none
+        """
+        cell: int = state * self._width + self._symbols.get_id(symbol, self._width - 1)
+        if self._table[cell] == self.DEAD_STATE:
+            return self.DEAD_STATE, None
+        return self._table[cell], self._outputs.get_symbol(self._output_table[cell])
+
+    def run(self, word: _ty.Iterable[_ty.Any], output_callback: _ty.Callable[[_ty.List[_ty.Any]], _ty.Any],
+            chunk_size: int = CHUNK_SIZE, state: int | None = None) -> _ty.Tuple[int, int]:
+        """Runs the transducer over a whole word, the input is read lazily
+
+        The input is read in chunks of chunk_size symbols, the outputs of every chunk are handed to the callback
+        before the next chunk is read.
+
+        :param word: The input symbols
+        :param output_callback: Called with the outputs of every chunk, in order
+        :param chunk_size: The number of input symbols transduced at once
+        :param state: The id of the state to start in, the start state if None. Continues a run over the next part
+                      of a word.
+        :return: The id of the final state and the number of consumed symbols. If the transducer got stuck the state
+                 is DEAD_STATE and the number of consumed symbols is the index of the symbol it got stuck on.
+        """
+        if state is None:
+            state = self._start_state
+        consumed: int = 0
+        for outputs, state in self._run_chunks(word, chunk_size, state):
+            consumed += len(outputs)  # Every consumed symbol has exactly one output
+            output_callback(outputs)
+        return state, consumed
+
+    def transduce(self, word: _ty.Iterable[_ty.Any], chunk_size: int = CHUNK_SIZE) -> _a.Iterator[_ty.Any]:
+        """Lazily yields the outputs of a word, stops early if the transducer gets stuck
+
+        :param word: The input symbols
+        :param chunk_size: The number of input symbols transduced at once
+        :return: An iterator over the outputs
+        """
+        for outputs, _ in self._run_chunks(word, chunk_size):
+            yield from outputs
+
+    def _run_chunks(self, word: _ty.Iterable[_ty.Any], chunk_size: int,
+                    state: int | None = None) -> _a.Iterator[_ty.Tuple[_ty.List[_ty.Any], int]]:
+        """Runs the transducer over a word chunk by chunk
+
+        :param word: The input symbols
+        :param chunk_size: The number of input symbols transduced at once
+        :param state: The id of the state to start in, the start state if None
+        :return: An iterator over the outputs of every chunk and the state reached after it, the last state is
+                 DEAD_STATE if the transducer got stuck
+        """
+        if state is None:
+            state = self._start_state
+        if state == self.DEAD_STATE:
+            return
+
+        table: array = self._table
+        output_table: array = self._output_table
+        width: int = self._width
+        unknown: int = width - 1
+        lookup: _ty.Callable[[_ty.Any, int], int] = self._symbols.get_id_map().get
+        output_symbols: _ty.List[_ty.Any] = list(self._outputs)
+
+        iterator: _a.Iterator[_ty.Any] = iter(word)
+        chunk: _ty.List[_ty.Any] = list(islice(iterator, max(1, chunk_size)))
+        while chunk:
+            outputs: _ty.List[_ty.Any] = []
+            append: _ty.Callable[[_ty.Any], None] = outputs.append
+            for symbol in chunk:
+                cell: int = state * width + lookup(symbol, unknown)
+                state = table[cell]
+                if state < 0:
+                    break
+                append(output_symbols[output_table[cell]])
+            yield outputs, state
+            if state < 0:
+                return
+            chunk = list(islice(iterator, max(1, chunk_size)))
+
+    def write(self, word: _ty.Iterable[_ty.Any], stream: _ty.TextIO, separator: str = "",
+              chunk_size: int = CHUNK_SIZE) -> _ty.Tuple[int, int]:
+        """Transduces a word straight into a text stream
+
+        :param word: The input symbols
+        :param stream: The stream the outputs are written to
+        :param separator: The separator written between two outputs
+        :param chunk_size: The number of input symbols transduced at once
+        :return: The id of the final state and the number of consumed symbols, see `run`
+        """
+        state: int = self._start_state
+        consumed: int = 0
+        for outputs, state in self._run_chunks(word, chunk_size):
+            if outputs:
+                stream.write((separator if consumed else "") + separator.join(map(str, outputs)))
+            consumed += len(outputs)
+        return state, consumed
+
+    def get_result(self, state: int) -> _result.Result:
+        """Converts a final state into the simulation result
+
+        :param state: The id of the final state
+        :return: Success if the whole input was transduced, Failure otherwise
+        """
+        if self._start_state == self.DEAD_STATE:
+            return _result.Failure("No start state found")
+        if state == self.DEAD_STATE:
+            return _result.Failure("No valid transition found!")
+        return _result.Success("End of input sequence reached :)")
+
+
+class CompiledNFA:
+    """A nondeterministic automaton compiled into (state × symbol) successor sets.
+
+    A set of states is an int used as a bitset, bit `i` stands for the state with the index `i`. The ε-transitions
+    are resolved once: the successor sets and the start set are ε-closed. The successor set of a whole set of states
+    is determinised when it is first needed and kept in a least recently used cache, so repeated workloads run at
+    almost the speed of a DFA without building the (possibly exponentially large) DFA up front.
+    The last column of every row is reserved for symbols which are not part of the automaton's alphabet and always
+    leads to the empty set.
+    """
+    DEAD_STATE: int = 0  # The empty set
+    CACHE_SIZE: int = 4096  # Determinised (set, symbol) pairs kept
+
+    def __init__(self, symbols: SymbolTable, state_count: int, successors: _ty.List[int], start_state: int,
+                 accepting: int, cache_size: int = CACHE_SIZE) -> None:
+        self._symbols: SymbolTable = symbols
+        self._state_count: int = state_count
+        self._width: int = len(symbols) + 1  # +1 for the unknown symbol column
+        self._successors: _ty.List[int] = successors
+        self._start_state: int = start_state
+        self._accepting: int = accepting
+        self._cache_size: int = max(1, cache_size)
+        self._cache: OrderedDict[_ty.Tuple[int, int], int] = OrderedDict()
+
+    @classmethod
+    def from_automaton(cls, automaton: Automaton, cache_size: int = CACHE_SIZE) -> _ty.Self:
+        """Compiles a built, nondeterministic automaton into successor sets
+
+        Transitions leading to states that are not part of the automaton are ignored.
+
+        :param automaton: The automaton to compile
+        :param cache_size: The number of determinised (set, symbol) pairs kept
+        :return: The compiled automaton
+        """
+        if not automaton.is_nondeterministic():
+            raise ValueError(f"Can not compile {type(automaton).__name__}, it is not a nondeterministic acceptor")
+
+        states: _ty.List[State] = list(automaton.get_states())
+        state_ids: _ty.Dict[State, int] = {state: i for i, state in enumerate(states)}
+        symbols: SymbolTable = SymbolTable(automaton.get_symbols())  # A copy, so the ids match the interned ones
+        width: int = len(symbols) + 1
+
+        direct: _ty.List[int] = [0] * (len(states) * width)
+        epsilon: _ty.List[int] = [0] * len(states)
+        for state_id, state in enumerate(states):
+            row: int = state_id * width
+            for transition in state.get_transitions():
+                target_id: int | None = state_ids.get(transition.get_transition_target())
+                if target_id is None:
+                    continue
+                if transition.is_epsilon():
+                    epsilon[state_id] |= 1 << target_id
+                    continue
+                for symbol_id in range(width - 1):
+                    if transition.matches(symbol_id):
+                        direct[row + symbol_id] |= 1 << target_id
+
+        closures: _ty.List[int] = cls._get_closures(epsilon)
+        successors: _ty.List[int] = [cls._union(closures, targets) for targets in direct]
+
+        start_state: int = cls.DEAD_STATE
+        if automaton.get_start_state() in state_ids:
+            start_state = closures[state_ids[automaton.get_start_state()]]
+        accepting: int = 0
+        for state in automaton.get_end_states():
+            if state in state_ids:
+                accepting |= 1 << state_ids[state]
+        return cls(symbols, len(states), successors, start_state, accepting, cache_size)
+
+    @staticmethod
+    def _get_closures(epsilon: _ty.List[int]) -> _ty.List[int]:
+        """Returns the ε-closure of every state
+
+        :param epsilon: The targets of the ε-transitions of every state, as bitsets
+        :return: The states reachable through ε-transitions (including the state itself) of every state, as bitsets
+        """
+        closures: _ty.List[int] = []
+        for state_id in range(len(epsilon)):
+            closure: int = 1 << state_id
+            pending: int = epsilon[state_id] & ~closure
+            while pending:
+                closure |= pending
+                new: int = 0
+                while pending:
+                    lowest: int = pending & -pending
+                    new |= epsilon[lowest.bit_length() - 1]
+                    pending ^= lowest
+                pending = new & ~closure
+            closures.append(closure)
+        return closures
+
+    @staticmethod
+    def _union(sets: _ty.List[int], members: int) -> int:
+        """Returns the union of the sets of all members of a bitset
+
+        :param sets: A set per state, as bitsets
+        :param members: The states whose sets are united, as a bitset
+        :return: The union, as a bitset
+        """
+        union: int = 0
+        while members:
+            lowest: int = members & -members
+            union |= sets[lowest.bit_length() - 1]
+            members ^= lowest
+        return union
+
+    def get_symbols(self) -> SymbolTable:
+        """Returns the symbol table used to intern the input symbols
+
+        :return: The symbol table
+        """
+        return self._symbols
+
+    def get_state_count(self) -> int:
+        """Returns the number of states
+
+        :return: The number of states
+        """
+        return self._state_count
+
+    def get_width(self) -> int:
+        """Returns the width of a table row (number of symbols + the unknown symbol column)
+
+        :return: The row width
+        """
+        return self._width
+
+    def get_successors(self) -> _ty.List[int]:
+        """Returns the flat (state × symbol) -> ε-closed successor set table
+
+        :return: The successor sets, as bitsets
+        """
+        return self._successors
+
+    def get_start_state(self) -> int:
+        """Returns the ε-closed start set, or DEAD_STATE if the automaton has no start state
+
+        :return: The start set, as a bitset
+        """
+        return self._start_state
+
+    def get_accepting(self) -> int:
+        """Returns the set of end states
+
+        :return: The end states, as a bitset
+        """
+        return self._accepting
+
+    def get_cache_size(self) -> int:
+        """Returns the number of determinised (set, symbol) pairs kept
+
+        :return: The maximum number of cached pairs
+        """
+        return self._cache_size
+
+    def is_accepting(self, state: int) -> bool:
+        """Returns whether a set of states contains an end state
+
+        :param state: The set of states, as a bitset
+        :return: True if one of the states is an end state
+        """
+        return bool(state & self._accepting)
+
+    def _determinise(self, state: int, symbol_id: int) -> int:
+        """Returns the successor set of a set of states, through the cache
+
+        :param state: The set of states, as a bitset
+        :param symbol_id: The id of the input symbol
+        :return: The ε-closed successor set, as a bitset
+        """
+        key: _ty.Tuple[int, int] = (state, symbol_id)
+        cache: OrderedDict[_ty.Tuple[int, int], int] = self._cache
+        successor: int | None = cache.get(key)
+        if successor is not None:
+            cache.move_to_end(key)
+            return successor
+
+        successors: _ty.List[int] = self._successors
+        width: int = self._width
+        successor = 0
+        members: int = state
+        while members:
+            lowest: int = members & -members
+            successor |= successors[(lowest.bit_length() - 1) * width + symbol_id]
+            members ^= lowest
+
+        cache[key] = successor
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return successor
+
+    def step(self, state: int, symbol: _ty.Any) -> int:
+        """Executes a single step
+
+        :param state: The current set of states, as a bitset
+        :param symbol: The input symbol
+        :return: The next set of states (DEAD_STATE if it is empty), as a bitset
+        """
+        return self._determinise(state, self._symbols.get_id(symbol, self._width - 1))
+
+    def run(self, word: _ty.Iterable[_ty.Any], state: int | None = None) -> _ty.Tuple[int, int]:
+        """Runs the automaton over a whole word
+
+        :param word: The input symbols
+        :param state: The set of states to start in, the start set if None. Continues a run over the next part of a
+                      word.
+        :return: The final set of states and the number of consumed symbols. If the automaton got stuck the set is
+                 DEAD_STATE and the number of consumed symbols is the index of the symbol it got stuck on.
+        """
+        if state is None:
+            state = self._start_state
+        if state == self.DEAD_STATE:
+            return state, 0
+
+        unknown: int = self._width - 1
+        lookup: _ty.Callable[[_ty.Any, int], int] = self._symbols.get_id_map().get
+        cache: OrderedDict[_ty.Tuple[int, int], int] = self._cache
+        determinise: _ty.Callable[[int, int], int] = self._determinise
+
+        consumed: int = 0
+        for symbol in word:
+            key: _ty.Tuple[int, int] = (state, lookup(symbol, unknown))
+            successor: int | None = cache.get(key)
+            if successor is None:
+                successor = determinise(*key)
+            else:
+                cache.move_to_end(key)
+            state = successor
+            if state == self.DEAD_STATE:
+                return state, consumed
+            consumed += 1
+        return state, consumed
+
+    def accepts(self, word: _ty.Iterable[_ty.Any]) -> bool:
+        """Returns whether the automaton accepts a word
+
+        :param word: The input symbols
+        :return: True if the word is accepted
+        """
+        return self.is_accepting(self.run(word)[0])
+
+    def get_result(self, state: int) -> _result.Result:
+        """Converts a final set of states into the simulation result
+
+        :param state: The final set of states, as a bitset
+        :return: Success if the set contains an end state, Failure otherwise
+        """
+        if self._start_state == self.DEAD_STATE:
+            return _result.Failure("No start state found")
+        if state == self.DEAD_STATE:
+            return _result.Failure("No valid transition found!")
+        if state & self._accepting:
+            return _result.Success("Automaton terminated in an end state!")
+        return _result.Failure("Automaton failed to terminate in an end state!")
+
+    def simulate(self, word: _ty.Iterable[_ty.Any]) -> _result.Result:
+        """Runs the automaton over a whole word and returns the simulation result
+
+        :param word: The input symbols
+        :return: The result of the simulation
+        """
+        return self.get_result(self.run(word)[0])
+
+
+class BitParallelNFA(CompiledNFA):
+    """A nondeterministic automaton of at most MAX_STATES states, compiled into per symbol mask tables.
+
+    The set of states is split into bytes. For every symbol and byte position a table maps each of the 256 possible
+    bytes to the union of the ε-closed successor sets of the states in it, so a step costs one table lookup, a shift
+    and an OR per byte of the set. Unlike the cache of CompiledNFA the tables are built once, so the throughput does
+    not depend on how many different sets the input visits.
+    """
+    MAX_STATES: int = 64
+
+    def __init__(self, symbols: SymbolTable, state_count: int, successors: _ty.List[int], start_state: int,
+                 accepting: int, cache_size: int = CompiledNFA.CACHE_SIZE) -> None:
+        if state_count > self.MAX_STATES:
+            raise ValueError(f"Can not compile an automaton with {state_count} states into bit parallel tables, "
+                             f"at most {self.MAX_STATES} are supported")
+        super().__init__(symbols, state_count, successors, start_state, accepting, cache_size)
+        self._byte_count: int = max(1, -(-state_count // 8))
+        self._masks: _ty.List[_ty.List[_ty.List[int]]] = [self._build_masks(symbol_id)
+                                                          for symbol_id in range(self._width)]
+
+    def _build_masks(self, symbol_id: int) -> _ty.List[_ty.List[int]]:
+        """Builds the mask tables of a symbol
+
+        :param symbol_id: The id of the symbol
+        :return: For every byte position the successor set of each of the 256 bytes, as bitsets
+        """
+        masks: _ty.List[_ty.List[int]] = []
+        for byte_index in range(self._byte_count):
+            offset: int = byte_index * 8
+            table: _ty.List[int] = [0] * 256
+            for bit in range(min(8, self._state_count - offset)):
+                successor: int = self._successors[(offset + bit) * self._width + symbol_id]
+                step: int = 1 << bit
+                for byte in range(step, 2 * step):  # Every byte whose highest bit is this one
+                    table[byte] = table[byte - step] | successor
+            masks.append(table)
+        return masks
+
+    def get_masks(self) -> _ty.List[_ty.List[_ty.List[int]]]:
+        """Returns the mask tables, indexed by symbol id, byte position and byte
+
+        :return: The mask tables
+        """
+        return self._masks
+
+    def _determinise(self, state: int, symbol_id: int) -> int:
+        successor: int = 0
+        for table in self._masks[symbol_id]:
+            successor |= table[state & 0xFF]
+            state >>= 8
+        return successor
+
+    def run(self, word: _ty.Iterable[_ty.Any], state: int | None = None) -> _ty.Tuple[int, int]:
+        if state is None:
+            state = self._start_state
+        if state == self.DEAD_STATE:
+            return state, 0
+
+        unknown: int = self._width - 1
+        lookup: _ty.Callable[[_ty.Any, int], int] = self._symbols.get_id_map().get
+        masks: _ty.List[_ty.List[_ty.List[int]]] = self._masks
+
+        consumed: int = 0
+        if self._byte_count == 1:  # The common case of at most 8 states, a single lookup per symbol
+            first_masks: _ty.List[_ty.List[int]] = [tables[0] for tables in masks]
+            for symbol in word:
+                state = first_masks[lookup(symbol, unknown)][state]
+                if state == self.DEAD_STATE:
+                    return state, consumed
+                consumed += 1
+            return state, consumed
+
+        for symbol in word:
+            current: int = state
+            state = 0
+            for table in masks[lookup(symbol, unknown)]:
+                state |= table[current & 0xFF]
+                current >>= 8
+            if state == self.DEAD_STATE:
+                return state, consumed
+            consumed += 1
+        return state, consumed
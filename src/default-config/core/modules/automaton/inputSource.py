@@ -0,0 +1,82 @@
+"""TBA"""
+import codecs
+import mmap
+import os
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+def tokenise(chunks: _ty.Iterable[str], separator: str) -> _a.Iterator[str]:
+    """Lazily splits a text, given in chunks, into tokens. Line breaks separate tokens too
+
+    :param chunks: The text in chunks of any size
+    :param separator: The separator between the tokens, an empty separator splits into single characters
+    :return: An iterator over the tokens, empty tokens are skipped
+    """
+    if not separator:
+        for chunk in chunks:
+            yield from chunk.replace("\r", "").replace("\n", "")
+        return
+
+    rest: str = ""
+    for chunk in chunks:
+        tokens: _ty.List[str] = [token for line in (rest + chunk).replace("\r", "\n").split("\n")
+                                 for token in line.split(separator)]
+        rest = tokens.pop()  # May continue in the next chunk
+        yield from (token for token in tokens if token)
+    if rest:
+        yield rest
+
+
+class MappedInput:
+    """An input read from a file, which is memory mapped and tokenised lazily.
+
+    The tokens are never materialised, so an engine consuming them symbol by symbol (like the compiled automata) runs
+    in constant memory, however large the file is. The input can be iterated multiple times, every iteration maps the
+    file again.
+    """
+    DEFAULT_SEPARATOR: str = ","  # The first separator of the token input widget
+    CHUNK_SIZE: int = 1024 * 1024  # Bytes decoded at once
+
+    def __init__(self, file_path: str, separator: str = DEFAULT_SEPARATOR, encoding: str = "utf-8",
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        self._file_path: str = file_path
+        self._separator: str = separator
+        self._encoding: str = encoding
+        self._chunk_size: int = max(1, chunk_size)
+
+    def get_file_path(self) -> str:
+        """Returns the path of the file
+
+        :return: The file path
+        """
+        return self._file_path
+
+    def get_separator(self) -> str:
+        """Returns the separator between the tokens
+
+        :return: The separator, an empty string if every character is a token
+        """
+        return self._separator
+
+    def _read_chunks(self) -> _a.Iterator[str]:
+        """Decodes the mapped file chunk by chunk, characters spanning two chunks are kept whole
+
+        :return: An iterator over the decoded chunks
+        """
+        with open(self._file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:  # Empty files can not be mapped
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(self._encoding)()
+                for start in range(0, len(mapped), self._chunk_size):
+                    yield decoder.decode(mapped[start:start + self._chunk_size])
+                yield decoder.decode(b"", final=True)
+
+    def __iter__(self) -> _a.Iterator[str]:
+        return tokenise(self._read_chunks(), self._separator)
+
+    def __repr__(self) -> str:
+        return f"MappedInput({self._file_path!r}, separator={self._separator!r})"
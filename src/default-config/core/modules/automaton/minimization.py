@@ -0,0 +1,223 @@
+"""TBA"""
+from array import array
+from collections import deque
+
+# Abstract Machine related imports
+from automaton.compiledAutomaton import CompiledDFA
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+
+class MinimizedDFA:
+    """The minimal compiled automaton equivalent to another one, together with the mapping between their states.
+
+    Every state of the minimal automaton stands for a class of equivalent states of the original one. The
+    representative of a class is its original state with the lowest id, its row of the transition index table is
+    copied, so the transition ids of the minimal automaton still refer to transitions of the original one.
+    """
+
+    def __init__(self, compiled: CompiledDFA, state_map: array, representatives: array) -> None:
+        self._compiled: CompiledDFA = compiled
+        self._state_map: array = state_map
+        self._representatives: array = representatives
+
+    def get_compiled(self) -> CompiledDFA:
+        """Returns the minimal compiled automaton
+
+        :return: The minimal automaton
+        """
+        return self._compiled
+
+    def get_state_map(self) -> array:
+        """Returns the minimal state of every original state
+
+        :return: The minimal state ids indexed by original state id, DEAD_STATE for unreachable states
+        """
+        return self._state_map
+
+    def get_representatives(self) -> array:
+        """Returns the representative of every minimal state
+
+        :return: The original state ids indexed by minimal state id
+        """
+        return self._representatives
+
+    def map_state(self, state: int) -> int:
+        """Returns the minimal state an original state was merged into
+
+        :param state: The id of the original state
+        :return: The id of the minimal state, DEAD_STATE if the original state is unreachable or dead
+        """
+        return self._state_map[state] if state != CompiledDFA.DEAD_STATE else CompiledDFA.DEAD_STATE
+
+    def get_representative(self, state: int) -> int:
+        """Returns the original state standing for a minimal state
+
+        :param state: The id of the minimal state
+        :return: The id of the original state, DEAD_STATE for the dead state
+        """
+        return self._representatives[state] if state != CompiledDFA.DEAD_STATE else CompiledDFA.DEAD_STATE
+
+
+def _get_reachable_states(compiled: CompiledDFA) -> _ty.List[int]:
+    """Returns the states reachable from the start state, in breadth first order
+
+    :param compiled: The compiled automaton
+    :return: The ids of the reachable states, the start state first
+    """
+    start_state: int = compiled.get_start_state()
+    if start_state == CompiledDFA.DEAD_STATE:
+        return []
+
+    table: array = compiled.get_table()
+    width: int = compiled.get_width()
+    seen: bytearray = bytearray(compiled.get_state_count())
+    seen[start_state] = 1
+    reachable: _ty.List[int] = [start_state]
+    for state in reachable:  # Newly added states are visited too
+        for target in table[state * width:(state + 1) * width]:
+            if target != CompiledDFA.DEAD_STATE and not seen[target]:
+                seen[target] = 1
+                reachable.append(target)
+    return reachable
+
+
+def _refine(state_count: int, symbol_count: int, targets: _ty.List[int],
+            initial_blocks: _ty.List[_ty.Set[int]]) -> _ty.List[int]:
+    """Refines a partition of the states with Hopcroft's algorithm until it is stable under the transitions
+
+    :param state_count: The number of states
+    :param symbol_count: The number of symbols
+    :param targets: The flat (state × symbol) -> next state table, every state has a next state for every symbol
+    :param initial_blocks: The initial partition, without empty blocks
+    :return: The block of every state
+    """
+    # Inverse transitions, for every symbol the states leading into a state
+    inverse: _ty.List[_ty.Dict[int, _ty.List[int]]] = [{} for _ in range(symbol_count)]
+    for state in range(state_count):
+        row: int = state * symbol_count
+        for symbol in range(symbol_count):
+            inverse[symbol].setdefault(targets[row + symbol], []).append(state)
+
+    blocks: _ty.List[_ty.Set[int]] = [set(block) for block in initial_blocks]
+    block_of: _ty.List[int] = [0] * state_count
+    for block_id, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = block_id
+
+    # Splitting by all blocks but one is enough, the largest one is left out
+    largest: int = max(range(len(blocks)), key=lambda block_id: len(blocks[block_id]))
+    pending: _ty.Deque[_ty.Tuple[int, int]] = deque((block_id, symbol) for block_id in range(len(blocks))
+                                                    if block_id != largest for symbol in range(symbol_count))
+    waiting: _ty.Set[_ty.Tuple[int, int]] = set(pending)
+
+    while pending:
+        splitter = pending.popleft()
+        waiting.discard(splitter)
+        block_id, symbol = splitter
+        symbol_inverse: _ty.Dict[int, _ty.List[int]] = inverse[symbol]
+
+        # The predecessors of the splitter, grouped by their block
+        touched: _ty.Dict[int, _ty.List[int]] = {}
+        for target in blocks[block_id]:
+            for state in symbol_inverse.get(target, ()):
+                touched.setdefault(block_of[state], []).append(state)
+
+        for split_id, inside in touched.items():
+            split_block: _ty.Set[int] = blocks[split_id]
+            if len(inside) == len(split_block):
+                continue
+
+            # The smaller part becomes the new block, so the splitters of both parts are covered by adding it
+            moved: _ty.Set[int] = set(inside)
+            if len(moved) > len(split_block) - len(moved):
+                moved = split_block - moved
+            split_block -= moved
+            new_id: int = len(blocks)
+            blocks.append(moved)
+            for state in moved:
+                block_of[state] = new_id
+
+            for other_symbol in range(symbol_count):
+                new_splitter: _ty.Tuple[int, int] = (new_id, other_symbol)
+                waiting.add(new_splitter)
+                pending.append(new_splitter)
+    return block_of
+
+
+def minimize(compiled: CompiledDFA) -> MinimizedDFA:
+    """Minimizes a compiled automaton with Hopcroft's partition refinement in O(n·k·log n)
+
+    Unreachable states are removed and equivalent states are merged. The dead state is kept apart from states that
+    can never accept, so the minimal automaton gets stuck on the same symbol and gives the same result message as the
+    original one for every word.
+
+    :param compiled: The compiled automaton
+    :return: The minimal automaton and the mapping between the states
+    """
+    state_count: int = compiled.get_state_count()
+    reachable: _ty.List[int] = _get_reachable_states(compiled)
+    if not reachable:  # Without a start state nothing is simulated, the automaton is kept as it is
+        identity: array = array("i", range(state_count))
+        return MinimizedDFA(compiled, identity, array("i", identity))
+
+    table: array = compiled.get_table()
+    width: int = compiled.get_width()
+    symbol_count: int = width - 1  # The unknown symbol column always leads to the dead state
+    accepting: bytearray = compiled.get_accepting()
+
+    # The reachable states are renumbered densely, with an explicit dead state after them
+    local_ids: _ty.Dict[int, int] = {state: local_id for local_id, state in enumerate(reachable)}
+    dead: int = len(reachable)
+    targets: _ty.List[int] = []
+    for state in reachable:
+        row: int = state * width
+        targets.extend(local_ids[target] if target != CompiledDFA.DEAD_STATE else dead
+                       for target in table[row:row + symbol_count])
+    targets.extend([dead] * symbol_count)
+
+    accepting_block: _ty.Set[int] = {local_id for local_id, state in enumerate(reachable) if accepting[state]}
+    rejecting_block: _ty.Set[int] = set(range(dead)) - accepting_block
+    initial_blocks: _ty.List[_ty.Set[int]] = [block for block in (accepting_block, rejecting_block, {dead}) if block]
+    block_of: _ty.List[int] = _refine(dead + 1, symbol_count, targets, initial_blocks)
+
+    # Number the blocks in breadth first order, so the start state becomes 0
+    block_ids: _ty.Dict[int, int] = {block_of[dead]: CompiledDFA.DEAD_STATE}
+    representatives: array = array("i")
+    queue: _ty.List[int] = [0]
+    block_ids[block_of[0]] = 0
+    representatives.append(reachable[0])
+    for local_id in queue:  # Newly added states are visited too
+        row = local_id * symbol_count
+        for target in targets[row:row + symbol_count]:
+            if block_of[target] not in block_ids:
+                block_ids[block_of[target]] = len(representatives)
+                representatives.append(reachable[target])
+                queue.append(target)
+
+    state_map: array = array("i", [CompiledDFA.DEAD_STATE]) * state_count
+    for local_id, state in enumerate(reachable):
+        state_map[state] = block_ids[block_of[local_id]]
+        if state < representatives[state_map[state]]:
+            representatives[state_map[state]] = state
+
+    minimal_count: int = len(representatives)
+    transition_table: array = compiled.get_transition_table()
+    minimal_table: array = array("i", [CompiledDFA.DEAD_STATE]) * (minimal_count * width)
+    minimal_transition_table: array = array("i", [-1]) * (minimal_count * width)
+    minimal_accepting: bytearray = bytearray(minimal_count)
+    for minimal_state, state in enumerate(representatives):
+        row = state * width
+        minimal_row: int = minimal_state * width
+        for symbol in range(symbol_count):
+            target: int = table[row + symbol]
+            if target != CompiledDFA.DEAD_STATE:
+                minimal_table[minimal_row + symbol] = state_map[target]
+                minimal_transition_table[minimal_row + symbol] = transition_table[row + symbol]
+        minimal_accepting[minimal_state] = accepting[state]
+
+    return MinimizedDFA(CompiledDFA(compiled.get_symbols(), minimal_count, minimal_table, minimal_transition_table,
+                                    0, minimal_accepting),
+                        state_map, representatives)
@@ -0,0 +1,240 @@
+"""TBA"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+import multiprocessing
+import sys
+import os
+
+from returns import result as _result
+
+# Abstract Machine related imports
+from automaton.automatonBridge import AutomatonBridge
+from automaton.automatonCache import AutomatonCache, structure_hash
+from automaton.automatonProvider import AutomatonProvider
+from automaton.automatonSimulator import AutomatonSimulator
+from automaton.batchSimulator import BatchSimulator
+from automaton.compiledAutomaton import CompiledDFA, CompiledMealy, CompiledNFA
+from automaton.minimization import minimize
+from automaton.specialiser import Specialiser
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+
+WordResultT = _ty.Tuple[bool, str, _ty.Any]  # success, message, output (None for acceptors)
+
+
+class WordSimulator:
+    """Simulates single words on a serialised automaton without sending any packets.
+
+    Deterministic automata are compiled and minimized once and run on their transition table, nondeterministic automata
+    are compiled once and run on the engine registered for their number of states, deterministic transducers are
+    compiled once and run on their transition and output tables. All others are built once and reset before every
+    word.
+    Chunks of words on a deterministic automaton are run in lock-step by a `BatchSimulator`.
+    If the request has "specialise" set, the compiled automata run on Python source generated for them instead (see
+    `Specialiser`), which pays off when many words or long inputs are simulated.
+    """
+
+    def __init__(self, simulation_request: _ty.Dict[str, _ty.Any]) -> None:
+        self._simulation_request: _ty.Dict[str, _ty.Any] = {**simulation_request,
+                                                            "structure_hash": structure_hash(simulation_request)}
+        self._automaton_cache: AutomatonCache = AutomatonCache()
+
+        build_result: _result.Result = AutomatonSimulator(self._simulation_request, lambda _: None,
+                                                          lambda *_: None,
+                                                          automaton_cache=self._automaton_cache).build()
+        if not isinstance(build_result, _result.Success):
+            raise ValueError(build_result.failure())
+        automaton: AutomatonBridge = build_result.unwrap()
+
+        self._compiled: CompiledDFA | CompiledNFA | None = None
+        if automaton.is_deterministic():
+            self._compiled = minimize(CompiledDFA.from_automaton(automaton.get_implementation())).get_compiled()
+        elif automaton.is_nondeterministic():
+            engine: _ty.Type[CompiledNFA] = AutomatonProvider(None).get_engine(automaton.get_implementation())
+            self._compiled = engine.from_automaton(automaton.get_implementation())
+        self._transducer: CompiledMealy | None = None
+        if automaton.is_transducer():
+            self._transducer = CompiledMealy.from_automaton(automaton.get_implementation())
+
+        if self._simulation_request.get("specialise", False):
+            key: str = self._simulation_request["structure_hash"]
+            try:
+                if self._compiled is not None:
+                    self._compiled = Specialiser().specialise(self._compiled, key)
+                if self._transducer is not None:
+                    self._transducer = Specialiser().specialise(self._transducer, key)
+            except ValueError:  # Not supported for this automaton, it keeps running on its compiled tables
+                pass
+
+        self._batch_simulator: BatchSimulator | None = None
+        if isinstance(self._compiled, CompiledDFA):
+            self._batch_simulator = BatchSimulator(self._compiled)
+
+    def get_compiled(self) -> CompiledDFA | CompiledNFA | None:
+        """Returns the compiled automaton, None if the automaton is not a finite acceptor
+
+        :return: The compiled automaton or None
+        """
+        return self._compiled
+
+    def get_transducer(self) -> CompiledMealy | None:
+        """Returns the compiled transducer, None if the automaton is not a deterministic transducer
+
+        :return: The compiled transducer or None
+        """
+        return self._transducer
+
+    def simulate(self, word: _ty.List[_ty.Any]) -> WordResultT:
+        """Simulates a single word
+
+        :param word: The input word
+        :return: Whether the simulation succeeded, the result message and the output of the automaton (None for
+                 acceptors)
+        """
+        if self._compiled is not None:
+            result: _result.Result = self._compiled.simulate(word)
+            return isinstance(result, _result.Success), str(result._inner_value), None
+        if self._transducer is not None:
+            outputs: _ty.List[_ty.Any] = []
+            state, consumed = self._transducer.run(word, outputs.extend)
+            outputs.extend(word[consumed:])  # Like in a simulation step by step, the rest of the input is kept
+            result = self._transducer.get_result(state)
+            return isinstance(result, _result.Success), str(result._inner_value), outputs
+
+        simulator: AutomatonSimulator = AutomatonSimulator({**self._simulation_request, "input": list(word)},
+                                                           lambda _: None, lambda *_: None,
+                                                           automaton_cache=self._automaton_cache)
+        result = simulator.run()
+        return isinstance(result, _result.Success), str(result._inner_value), list(simulator.automaton.get_input())
+
+    def simulate_chunk(self, words: _ty.List[_ty.List[_ty.Any]]) -> _ty.List[WordResultT]:
+        """Simulates a chunk of words
+
+        :param words: The input words
+        :return: The results in input order
+        """
+        if self._batch_simulator is None or not words:
+            return [self.simulate(word) for word in words]
+
+        if self._compiled.get_start_state() == CompiledDFA.DEAD_STATE:
+            return [(False, "No start state found", None)] * len(words)
+        accepted, first_failures = self._batch_simulator.run(words)
+        results: _ty.List[WordResultT] = []
+        for is_accepted, first_failure in zip(accepted.tolist(), first_failures.tolist()):
+            if is_accepted:
+                results.append((True, "Automaton terminated in an end state!", None))
+            elif first_failure >= 0:
+                results.append((False, "No valid transition found!", None))
+            else:
+                results.append((False, "Automaton failed to terminate in an end state!", None))
+        return results
+
+
+_worker_simulator: WordSimulator | None = None
+
+
+def _init_worker(simulation_request: _ty.Dict[str, _ty.Any],
+                 registered_automatons: _ty.Dict[str, _ty.Dict[str, _ty.Callable]],
+                 registered_engines: _ty.Dict[str, _ty.List[_ty.Tuple[int, _ty.Callable]]]) -> None:
+    """Builds the automaton once per worker process
+
+    :param simulation_request: The serialised automaton
+    :param registered_automatons: The automaton registry of the AutomatonProvider of the parent process
+    :param registered_engines: The engine registry of the AutomatonProvider of the parent process
+    :return: None
+    """
+    global _worker_simulator
+    sys.stdout = sys.stderr  # Results are only returned through the pool, diagnostic prints must not mix with them
+    AutomatonProvider.registered_automatons.update(registered_automatons)
+    AutomatonProvider.registered_engines.update(registered_engines)
+    _worker_simulator = WordSimulator(simulation_request)
+
+
+def _simulate_chunk(words: _ty.List[_ty.List[_ty.Any]]) -> _ty.List[WordResultT]:
+    """Simulates a chunk of words in a worker process
+
+    :param words: The input words
+    :return: The results in input order
+    """
+    return _worker_simulator.simulate_chunk(words)
+
+
+class ParallelSimulator:
+    """Simulates many words on a pool of worker processes.
+
+    The serialised automaton is sent to every worker once, each worker builds (and if possible compiles) its own
+    automaton. Words are sent in chunks, at most `2 * workers` chunks are in flight at a time, so the input can be
+    streamed. The results are returned in input order.
+    Worker processes are spawned, the automaton classes of the extensions are looked up by their module path.
+    """
+
+    def __init__(self, simulation_request: _ty.Dict[str, _ty.Any], workers: int | None = None,
+                 chunk_size: int = 1024) -> None:
+        self._simulation_request: _ty.Dict[str, _ty.Any] = {**simulation_request, "input": []}
+        self._workers: int = max(1, workers or os.cpu_count() or 1)
+        self._chunk_size: int = max(1, chunk_size)
+
+        self._local_simulator: WordSimulator = WordSimulator(self._simulation_request)  # Fail early on build errors
+        self._executor: ProcessPoolExecutor | None = None
+
+    def get_workers(self) -> int:
+        """Returns the number of worker processes
+
+        :return: The number of worker processes
+        """
+        return self._workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Returns the process pool, starting it on first use
+
+        :return: The process pool
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._workers, multiprocessing.get_context("spawn"), _init_worker,
+                                                 (self._simulation_request,
+                                                  dict(AutomatonProvider.registered_automatons),
+                                                  dict(AutomatonProvider.registered_engines)))
+        return self._executor
+
+    def run(self, words: _a.Iterable[_ty.List[_ty.Any]]) -> _a.Iterator[WordResultT]:
+        """Simulates all words
+
+        With a single worker the words are simulated in the calling process.
+
+        :param words: The input words
+        :return: An iterator over the results in input order
+        """
+        words_iter: _a.Iterator[_ty.List[_ty.Any]] = iter(words)
+        chunks: _a.Iterator[_ty.List[_ty.List[_ty.Any]]] = iter(lambda: list(islice(words_iter, self._chunk_size)), [])
+
+        if self._workers == 1:
+            for chunk in chunks:
+                yield from self._local_simulator.simulate_chunk(chunk)
+            return
+
+        executor: ProcessPoolExecutor = self._get_executor()
+        pending: _ty.Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_simulate_chunk, chunk))
+            if len(pending) >= 2 * self._workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def close(self) -> None:
+        """Shuts down the worker processes
+
+        :return: None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> _ty.Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -2,7 +2,12 @@
 from returns import result as _result
 
 # Abstract Machine related imports
+from automaton.automatonBridge import AutomatonBridge
 from automaton.automatonSimulator import AutomatonSimulator
+from automaton.automatonCache import AutomatonCache
+from automaton.automatonProvider import AutomatonProvider
+from automaton.base.state import State as BaseState
+from automaton.base.transition import Transition as BaseTransition
 from automaton.UiBridge import UiBridge
 
 from abstractions import IAppSettings
@@ -25,6 +30,109 @@ class SimulationLoader:
         self._app_storage: IAppSettings = app_settings
 
         self._bridge: UiBridge = UiBridge()
+        self._automaton_cache: AutomatonCache = AutomatonCache()  # Built automata of previous simulations
+
+        # The automaton built for the last structure sent by the ui, later requests only send the changes to it. The
+        # ui refers to states and transitions by uid.
+        self._structure_automaton: AutomatonBridge | None = None
+        self._structure_states: _ty.Dict[int, BaseState] = {}
+        self._structure_transitions: _ty.Dict[int, BaseTransition] = {}
+        self._structure_id: str | None = None
+        self._structure_version: int | None = None
+        self._structure_key: str | None = None  # The key the automaton is cached under
+
+    def _apply_structure_changes(self, request: _ty.Dict[str, _ty.Any]) -> AutomatonBridge:
+        """Applies the changes of a request to the automaton built for its base version
+
+        The automaton is changed in place and in the same order as the ui structure, so the indices of the states and
+        transitions stay the same on both sides. It is removed from the cache under its old key and the request gets
+        a new key for it.
+
+        :param request: The simulation request carrying the changes
+        :return: The changed automaton
+        """
+        automaton: AutomatonBridge | None = self._structure_automaton
+        if (automaton is None or request.get("base_version") != self._structure_version
+                or request["id"] != self._structure_id):
+            raise RuntimeError(f"The backend does not hold version {request.get('base_version')} of the automaton, "
+                               f"please restart the simulation")
+
+        changes: _ty.List[_ty.Dict[str, _ty.Any]] = request["changes"]
+        if changes:
+            self._automaton_cache.discard(self._structure_key)
+            self._structure_key = f"{request['id']}@{request['structure_version']}"
+
+            automaton_provider: AutomatonProvider = AutomatonProvider(request["id"].split(":")[1])
+            raw_state = automaton_provider.get_automaton_state()
+            raw_transition = automaton_provider.get_automaton_transition()
+            states: _ty.Dict[int, BaseState] = self._structure_states
+            transitions: _ty.Dict[int, BaseTransition] = self._structure_transitions
+
+            for change in changes:
+                uid: int = change["uid"]
+                match change["change"]:
+                    case "ADD_STATE":
+                        states[uid] = raw_state(change["name"])
+                        automaton.add_state(states[uid], change["type"])
+                    case "EDIT_STATE":
+                        state: BaseState = states[uid]
+                        state.set_name(change["name"])
+                        automaton.get_end_states().discard(state)
+                        automaton.add_state(state, change["type"])  # Registers the type, the index does not change
+                    case "REMOVE_STATE":
+                        state = states.pop(uid)
+                        automaton.delete_state(state)
+                        automaton.get_end_states().discard(state)
+                    case "ADD_TRANSITION":
+                        transitions[uid] = raw_transition(states[change["from"]], states[change["to"]],
+                                                          change["condition"])
+                        automaton.add_transition(transitions[uid])
+                    case "EDIT_TRANSITION":
+                        transitions[uid].set_condition(change["condition"])
+                    case "REMOVE_TRANSITION":
+                        automaton.delete_transition(transitions.pop(uid))
+                    case _:
+                        raise ValueError(f"Could not recognise structure change {change['change']}")
+
+            automaton.set_start_state(automaton.get_state_by_id(0))  # The first state is the start state
+            ActLogger().info(f"Applied {len(changes)} structure changes to the {automaton.get_implementation_name()}")
+
+        request["structure_hash"] = self._structure_key
+        return automaton
+
+    def _set_structure_automaton(self, request: _ty.Dict[str, _ty.Any], automaton: AutomatonBridge | None,
+                                 key: str | None) -> None:
+        """Remembers the automaton built for a structure sent by the ui
+
+        :param request: The simulation request
+        :param automaton: The built automaton, None if it could not be built
+        :param key: The key the automaton is cached under
+        :return: None
+        """
+        if automaton is None or automaton.get_implementation() is None:
+            self._drop_structure_automaton()
+            return
+        if "content" in request:  # Built from the whole structure, the uids are sent in the order of the indices
+            self._structure_states = dict(zip(request["state_uids"], automaton.get_states()))
+            self._structure_transitions = dict(zip(request["transition_uids"], automaton.get_transitions(False)))
+        self._structure_automaton = automaton
+        self._structure_id = request["id"]
+        self._structure_version = request["structure_version"]
+        self._structure_key = key
+        self._bridge.set_structure_version(self._structure_version)
+
+    def _drop_structure_automaton(self) -> None:
+        """Forgets the automaton built for the last structure, the ui sends the whole structure again
+
+        :return: None
+        """
+        self._structure_automaton = None
+        self._structure_states = {}
+        self._structure_transitions = {}
+        self._structure_id = None
+        self._structure_version = None
+        self._structure_key = None
+        self._bridge.set_structure_version(None)
 
     def _push_simulation_to_bridge(self, item: _ty.Dict[str, _ty.Any]) -> None:
         """Push a simulation item to the bridge
@@ -45,6 +153,17 @@ class SimulationLoader:
             if self._bridge.get_signal() is not None:
                 self._bridge.get_signal().emit()
 
+    def _push_job_simulation_to_bridge(self, job_id: int | None, item: _ty.Dict[str, _ty.Any]) -> None:
+        """Push a simulation item of a job to the bridge, items of cancelled jobs are dropped
+
+        :param job_id: The id of the job the item belongs to
+        :param item: The item to push
+        :return: None
+        """
+        if self._bridge.is_job_cancelled(job_id):
+            return
+        self._push_simulation_to_bridge(item)
+
     def _push_error_to_bridge(self, error: _ty.Dict[str, _ty.Any],
                               error_queue: _ty.Literal["ui", "simulation"] = "ui",
                               clear_queues: _ty.List[_ty.Literal["ui", "simulation"]] | None = None) -> None:
@@ -79,27 +198,54 @@ class SimulationLoader:
 
         bridge_queue_callables[error_queue][0]()
 
-    def handle_bridge(self) -> None:
-        """Handle the bridge requests
-        
+    def handle_bridge(self, timeout: float = 0.0) -> None:
+        """Handle the next bridge request
+
+        :param timeout: The number of seconds to wait for a request, returns at once if there is none for 0
         :return: None
         """
         try:
-            if not self._bridge.has_backend_items():
+            if timeout > 0:
+                bridge_data: _ty.Dict[str, _ty.Any] | None = self._bridge.wait_for_backend_task(timeout)
+                if bridge_data is None:
+                    return
+            elif self._bridge.has_backend_items():
+                bridge_data = self._bridge.get_backend_task()
+            else:
                 return
 
-            bridge_data: _ty.Dict[str, _ty.Any] = self._bridge.get_backend_task()
-
             match (str(bridge_data["action"]).lower()):
+                case "wake_up":
+                    return
                 case "simulation":
+                    job_id: int | None = bridge_data.get("job_id")
+                    if self._bridge.is_job_cancelled(job_id):  # Stopped or restarted before it was started
+                        ActLogger().info(f"Skipped cancelled simulation job {job_id}.")
+                        return
+
+                    bridge_data.setdefault("max_steps", self._app_storage.get_simulation_max_steps())
+                    bridge_data.setdefault("max_duration", self._app_storage.get_simulation_max_duration())
+                    bridge_data.setdefault("cycle_detection", self._app_storage.get_simulation_cycle_detection())
+                    self._automaton_cache.set_max_bytes(self._app_storage.get_simulation_cache_size() * 1024 * 1024)
+
+                    structure_automaton: AutomatonBridge | None = None
+                    if "changes" in bridge_data:
+                        structure_automaton = self._apply_structure_changes(bridge_data)
                     automaton_simulator: AutomatonSimulator = AutomatonSimulator(simulation_request=bridge_data,
-                                                                                 simulation_result_callback=self._push_simulation_to_bridge,
-                                                                                 error_callable=self._push_error_to_bridge)
+                                                                                 simulation_result_callback=lambda item: self._push_job_simulation_to_bridge(job_id, item),
+                                                                                 error_callable=self._push_error_to_bridge,
+                                                                                 cancellation_callable=lambda: self._bridge.is_job_cancelled(job_id),
+                                                                                 automaton_cache=self._automaton_cache,
+                                                                                 automaton=structure_automaton)
                     result: _result.Result = automaton_simulator.run()
+                    if "structure_version" in bridge_data:
+                        self._set_structure_automaton(bridge_data, automaton_simulator.automaton,
+                                                      automaton_simulator.get_structure_hash())
                     ActLogger().info(f"Finished automaton simulation, result: " + (
                             result._inner_value or "Could not cache the simulation result."))
 
         except Exception as e:
+            self._drop_structure_automaton()  # It may have been left half changed
             error_packet: _ty.Dict[str, _ty.Any] = {}
             traceback_message: str = traceback.format_exc()
             ActLogger().error(f"An error occurred whilst handling bridge requests ({str(e)})\n{traceback_message}")
@@ -0,0 +1,247 @@
+"""TBA"""
+from collections import OrderedDict
+from itertools import islice
+import threading
+import copy
+import ast
+
+# Abstract Machine related imports
+from automaton.compiledAutomaton import CompiledDFA, CompiledMealy, BitParallelNFA
+
+from utils.singleton import singleton
+
+# Standard typing imports for aps
+import collections.abc as _a
+import typing as _ty
+import types as _ts
+
+SpecialisableT = _ty.TypeVar("SpecialisableT", CompiledDFA, CompiledMealy, BitParallelNFA)
+
+
+def _literal(value: _ty.Any) -> str:
+    """Returns the source of a value which can be written as a Python literal
+
+    :param value: The value, e.g. an input symbol or an output
+    :return: The source of the literal
+    """
+    source: str = repr(value)
+    try:
+        if ast.literal_eval(source) == value:
+            return source
+    except (ValueError, SyntaxError):
+        pass
+    raise ValueError(f"Can not specialise an automaton on {source}, it is not a Python literal")
+
+
+@singleton
+class Specialiser:
+    """Generates Python source specialised to a single compiled automaton and compiles it once.
+
+    The transitions of every state become a dict literal from input symbol to next state, so a step of the generated
+    run loop is a tuple index and a dict lookup without interning the symbol first. The mask tables of a bit parallel
+    automaton are bound as constants instead, its generated loop unrolls the lookups of all bytes into a single
+    expression. Code objects are cached by key (e.g. the structure hash of the automaton), least recently used first.
+
+    The specialised automaton is a copy of the compiled one with the run loop replaced, every other method behaves the
+    same.
+    """
+    CACHE_SIZE: int = 256  # Code objects kept
+
+    def __init__(self) -> None:
+        self._code_cache: OrderedDict[str, _ts.CodeType] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def generate_source(self, compiled: CompiledDFA | CompiledMealy | BitParallelNFA) -> str:
+        """Generates the source of the run loop of a compiled automaton
+
+        :param compiled: The compiled automaton
+        :return: The source, it defines `run` (`run_chunks` for transducers)
+        """
+        if isinstance(compiled, CompiledDFA):
+            return self._generate_dfa(compiled)
+        if isinstance(compiled, CompiledMealy):
+            return self._generate_mealy(compiled)
+        if isinstance(compiled, BitParallelNFA):
+            return self._generate_nfa(compiled)
+        raise ValueError(f"Can not specialise {type(compiled).__name__}, only deterministic automata, transducers and "
+                         f"nondeterministic automata of at most {BitParallelNFA.MAX_STATES} states are supported")
+
+    @staticmethod
+    def _generate_dfa(compiled: CompiledDFA) -> str:
+        """Generates the run loop of a deterministic automaton, see `CompiledDFA.run`
+
+        :param compiled: The compiled automaton
+        :return: The source
+        """
+        if compiled.get_start_state() == CompiledDFA.DEAD_STATE:
+            return f"def run(word, state=None):\n    return {CompiledDFA.DEAD_STATE}, 0\n"
+
+        table: _a.Sequence[int] = compiled.get_table()
+        width: int = compiled.get_width()
+        symbols: _ty.List[str] = [_literal(symbol) for symbol in compiled.get_symbols()]
+        rows: _ty.List[str] = []
+        for state in range(compiled.get_state_count()):
+            cells: _ty.List[str] = [f"{symbol}: {table[state * width + symbol_id]}"
+                                    for symbol_id, symbol in enumerate(symbols)
+                                    if table[state * width + symbol_id] != CompiledDFA.DEAD_STATE]
+            rows.append(f"    {{{', '.join(cells)}}},  # {state}\n")
+
+        return (f"ROWS = (\n{''.join(rows)})\n"
+                f"\n"
+                f"\n"
+                f"def run(word, state=None):\n"
+                f"    rows = ROWS\n"
+                f"    if state is None:\n"
+                f"        state = {compiled.get_start_state()}\n"
+                f"    if state == {CompiledDFA.DEAD_STATE}:\n"
+                f"        return state, 0\n"
+                f"    consumed = 0\n"
+                f"    for symbol in word:\n"
+                f"        state = rows[state].get(symbol, {CompiledDFA.DEAD_STATE})\n"
+                f"        if state == {CompiledDFA.DEAD_STATE}:\n"
+                f"            return state, consumed\n"
+                f"        consumed += 1\n"
+                f"    return state, consumed\n")
+
+    @staticmethod
+    def _generate_mealy(compiled: CompiledMealy) -> str:
+        """Generates the chunk loop of a transducer, see `CompiledMealy._run_chunks`
+
+        :param compiled: The compiled transducer
+        :return: The source
+        """
+        if compiled.get_start_state() == CompiledMealy.DEAD_STATE:
+            return "def run_chunks(word, chunk_size, state=None):\n    return iter(())\n"
+
+        table: _a.Sequence[int] = compiled.get_table()
+        output_table: _a.Sequence[int] = compiled.get_output_table()
+        width: int = compiled.get_width()
+        symbols: _ty.List[str] = [_literal(symbol) for symbol in compiled.get_symbols()]
+        outputs: _ty.List[str] = [_literal(output) for output in compiled.get_outputs()]
+        dead_cell: str = f"({CompiledMealy.DEAD_STATE}, None)"
+
+        def cell_source(cell: int) -> str:
+            if table[cell] == CompiledMealy.DEAD_STATE:
+                return dead_cell
+            return f"({table[cell]}, {outputs[output_table[cell]]})"
+
+        rows: _ty.List[str] = []
+        defaults: _ty.List[str] = []
+        for state in range(compiled.get_state_count()):
+            row: int = state * width
+            default: str = cell_source(row + width - 1)  # The unknown symbol column, e.g. a wildcard
+            cells: _ty.List[str] = [f"{symbol}: {cell_source(row + symbol_id)}"
+                                    for symbol_id, symbol in enumerate(symbols)
+                                    if cell_source(row + symbol_id) != default]
+            rows.append(f"    {{{', '.join(cells)}}},  # {state}\n")
+            defaults.append(f"    {default},  # {state}\n")
+
+        return (f"ROWS = (\n{''.join(rows)})\n"
+                f"DEFAULTS = (\n{''.join(defaults)})\n"
+                f"\n"
+                f"\n"
+                f"def run_chunks(word, chunk_size, state=None):\n"
+                f"    rows = ROWS\n"
+                f"    defaults = DEFAULTS\n"
+                f"    if state is None:\n"
+                f"        state = {compiled.get_start_state()}\n"
+                f"    if state < 0:\n"
+                f"        return\n"
+                f"    iterator = iter(word)\n"
+                f"    chunk = list(islice(iterator, max(1, chunk_size)))\n"
+                f"    while chunk:\n"
+                f"        outputs = []\n"
+                f"        append = outputs.append\n"
+                f"        for symbol in chunk:\n"
+                f"            state, output = rows[state].get(symbol, defaults[state])\n"
+                f"            if state < 0:\n"
+                f"                break\n"
+                f"            append(output)\n"
+                f"        yield outputs, state\n"
+                f"        if state < 0:\n"
+                f"            return\n"
+                f"        chunk = list(islice(iterator, max(1, chunk_size)))\n")
+
+    @staticmethod
+    def _generate_nfa(compiled: BitParallelNFA) -> str:
+        """Generates the run loop of a bit parallel automaton, see `BitParallelNFA.run`
+
+        The mask tables of every symbol are flattened into one list, which is bound as MASKS when the code is run.
+
+        :param compiled: The compiled automaton
+        :return: The source
+        """
+        if compiled.get_start_state() == BitParallelNFA.DEAD_STATE:
+            return f"def run(word, state=None):\n    return {BitParallelNFA.DEAD_STATE}, 0\n"
+
+        byte_count: int = len(compiled.get_masks()[0])
+        lookups: _ty.List[str] = ["table[state & 0xFF]"]
+        lookups.extend(f"table[{256 * byte_index} + (state >> {8 * byte_index} & 0xFF)]"
+                       for byte_index in range(1, byte_count))
+        return (f"def run(word, state=None):\n"
+                f"    masks = MASKS\n"
+                f"    if state is None:\n"
+                f"        state = {compiled.get_start_state()}\n"
+                f"    if state == {BitParallelNFA.DEAD_STATE}:\n"
+                f"        return state, 0\n"
+                f"    consumed = 0\n"
+                f"    for symbol in word:\n"
+                f"        table = masks.get(symbol)\n"
+                f"        if table is None:\n"
+                f"            return {BitParallelNFA.DEAD_STATE}, consumed\n"
+                f"        state = {' | '.join(lookups)}\n"
+                f"        if state == {BitParallelNFA.DEAD_STATE}:\n"
+                f"            return state, consumed\n"
+                f"        consumed += 1\n"
+                f"    return state, consumed\n")
+
+    def get_code(self, compiled: CompiledDFA | CompiledMealy | BitParallelNFA, key: str | None = None) -> _ts.CodeType:
+        """Returns the compiled specialised source of an automaton
+
+        :param compiled: The compiled automaton
+        :param key: The cache key, e.g. the structure hash of the automaton. None compiles without caching
+        :return: The code object
+        """
+        cache_key: str | None = f"{type(compiled).__name__}:{key}" if key is not None else None
+        if cache_key is not None:
+            with self._lock:
+                code: _ts.CodeType | None = self._code_cache.get(cache_key)
+                if code is not None:
+                    self._code_cache.move_to_end(cache_key)
+                    return code
+
+        code = compile(self.generate_source(compiled), f"<specialised {type(compiled).__name__}>", "exec")
+        if cache_key is not None:
+            with self._lock:
+                self._code_cache[cache_key] = code
+                if len(self._code_cache) > self.CACHE_SIZE:
+                    self._code_cache.popitem(last=False)
+        return code
+
+    def specialise(self, compiled: SpecialisableT, key: str | None = None) -> SpecialisableT:
+        """Returns a copy of a compiled automaton which runs on its specialised source
+
+        :param compiled: The compiled automaton
+        :param key: The cache key of the code, e.g. the structure hash of the automaton. None compiles without caching
+        :return: The specialised automaton
+        """
+        namespace: _ty.Dict[str, _ty.Any] = {"islice": islice}
+        if isinstance(compiled, BitParallelNFA):
+            namespace["MASKS"] = {symbol: [mask for table in compiled.get_masks()[symbol_id] for mask in table]
+                                  for symbol_id, symbol in enumerate(compiled.get_symbols())}
+        exec(self.get_code(compiled, key), namespace)
+
+        specialised: SpecialisableT = copy.copy(compiled)  # Shares the tables, only the run loop is replaced
+        if isinstance(compiled, CompiledMealy):
+            specialised._run_chunks = namespace["run_chunks"]
+        else:
+            specialised.run = namespace["run"]
+        return specialised
+
+    def clear(self) -> None:
+        """Removes all cached code objects
+
+        :return: None
+        """
+        with self._lock:
+            self._code_cache.clear()
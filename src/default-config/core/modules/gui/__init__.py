@@ -4,7 +4,7 @@ import os
 import re
 
 from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import Qt, QObject
+from PySide6.QtCore import Qt, QObject, Signal
 
 from aplustools.io.fileio import os_open
 
@@ -47,6 +47,30 @@ def assign_object_names_iterative(parent: QObject, prefix: str = "", exclude_pri
                 stack.append((child, object_name))
 
 
+class GuiThreadInvoker(QObject):
+    """Runs callables in the thread the invoker lives in (the gui thread), no matter which thread requests it.
+
+    The callables are delivered through a queued signal, so they are run by the Qt event loop as soon as it is idle.
+    """
+    _invoke = Signal(object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._invoke.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+    @staticmethod
+    def _run(func: _a.Callable[[], _ty.Any]) -> None:
+        func()
+
+    def invoke(self, func: _a.Callable[[], _ty.Any]) -> None:
+        """Runs func in the gui thread, can be called from any thread."""
+        self._invoke.emit(func)
+
+    def wrap(self, func: _a.Callable[[], _ty.Any]) -> _a.Callable[[], None]:
+        """Returns a callable, which runs func in the gui thread when it is called from any thread."""
+        return lambda: self.invoke(func)
+
+
 class Style:
     _loaded_styles: dict[str, _ty.Self] = {}
 
@@ -946,6 +946,24 @@ class SettingsPanel(Panel):
         preset_slider.set_preset("Low")
         preset_slider.preset_changed.connect(lambda v: print("Preset", v))
         rows.append(("", preset_slider))
+        simulation_max_steps_spinbox = QSpinBox(minimum=0, maximum=2_000_000_000, singleStep=10_000, value=self.settings.get_simulation_max_steps())
+        simulation_max_steps_spinbox.setSpecialValueText("Unlimited")
+        simulation_max_steps_spinbox.valueChanged.connect(lambda: self.settings.set_simulation_max_steps(simulation_max_steps_spinbox.value()))
+        rows.append(("Simulation step limit: ", simulation_max_steps_spinbox))
+        simulation_max_duration_spinbox = QDoubleSpinBox(decimals=1, minimum=0.0, maximum=3600.0, singleStep=1.0, value=self.settings.get_simulation_max_duration())
+        simulation_max_duration_spinbox.setSpecialValueText("Unlimited")
+        simulation_max_duration_spinbox.valueChanged.connect(lambda: self.settings.set_simulation_max_duration(simulation_max_duration_spinbox.value()))
+        rows.append(("Simulation time limit (s): ", simulation_max_duration_spinbox))
+        simulation_cycle_detection_checkbox = QCheckBox()
+        simulation_cycle_detection_checkbox.setChecked(self.settings.get_simulation_cycle_detection())
+        simulation_cycle_detection_checkbox.checkStateChanged.connect(lambda: self.settings.set_simulation_cycle_detection(simulation_cycle_detection_checkbox.isChecked()))
+        rows.append(("Detect simulation cycles: ", simulation_cycle_detection_checkbox))
+        simulation_playback_interval_spinbox = QSpinBox(minimum=16, maximum=5000, singleStep=50, suffix=" ms", value=self.settings.get_simulation_playback_interval())
+        simulation_playback_interval_spinbox.valueChanged.connect(lambda: self.settings.set_simulation_playback_interval(simulation_playback_interval_spinbox.value()))
+        rows.append(("Simulation playback interval: ", simulation_playback_interval_spinbox))
+        simulation_cache_size_spinbox = QSpinBox(minimum=0, maximum=4096, singleStep=16, suffix=" MiB", value=self.settings.get_simulation_cache_size())
+        simulation_cache_size_spinbox.valueChanged.connect(lambda: self.settings.set_simulation_cache_size(simulation_cache_size_spinbox.value()))
+        rows.append(("Built automaton cache size: ", simulation_cache_size_spinbox))
 
         for name, widget in rows:
             frame = QFrame()
@@ -1,23 +1,26 @@
 """TBA"""
-
-from abstractions import IUiState, IUiTransition, IUiAutomaton  # Many thanks :)
-from automaton.UIAutomaton import UiAutomaton, UiState, UiTransition  # Don't know how to do without this
+from __future__ import annotations
 
 from queue import Queue
 from io import BytesIO, StringIO
+import logging
 import json
 import yaml
 
-from PySide6.QtGui import QColor
-
 from aplustools.data import beautify_json
 from aplustools.data.bintools import (get_variable_bytes_like, encode_float, encode_integer, read_variable_bytes_like,
                                       decode_integer, decode_float)
 
+from utils.tracer import Tracer
+
 # Standard typing imports for aps
 import collections.abc as _a
 import typing as _ty
 
+if _ty.TYPE_CHECKING:  # The gui classes (and with them PySide6) are only imported once an UiAutomaton is (de)serialized
+    from abstractions import IUiState, IUiTransition, IUiAutomaton  # Many thanks :)
+    from automaton.UIAutomaton import UiState
+
 DCGDictT = dict[str, str  # name, author, custom_python
                      | list[list[str]]  # token_lsts
                      | list[bool]  # is_custom_lst
@@ -187,6 +190,8 @@ def serialize(
         format_: _ty.Literal["json", "yaml", "binary"] = "json"
     ) -> bytes:
     """TBA"""
+    from PySide6.QtGui import QColor
+
     dcg_dict: DCGDictT = {
         "name": automaton.get_automaton_type(),
         "author": automaton.get_author(),
@@ -216,6 +221,7 @@ def serialize(
         dcg_dict["token_lsts"][i]  # type: ignore
         for i in dcg_dict["abs_transition_idxs"]  # type: ignore
     ]
+    Tracer().emit("serializer.transition_tokens", logging.DEBUG, tokens=transition_tokens)
 
     while not stack.empty():
         current_node = stack.get()
@@ -241,7 +247,6 @@ def serialize(
                 })
                 stack.put(connected_node)  # Push the connected node onto the stack
             # Append the connection using the index of the connected node
-            print(f'{transition_tokens=}')
             dcg_dict["content_transitions"].append(  # type: ignore
                 (  # type: ignore
                     (current_idx, counted_nodes[connected_node]),
@@ -382,14 +387,23 @@ def _deserialize_from_binary(bytes_like: bytes) -> DCGDictT:
     }
 
 
-def deserialize(automaton: IUiAutomaton, bytes_like: bytes,
-                format_: _ty.Literal["json", "yaml", "binary"] = "json") -> str:
-    """TBA"""
+def load_dcg_dict(bytes_like: bytes, format_: _ty.Literal["json", "yaml", "binary"] = "json") -> DCGDictT:
+    """Decodes and verifies a serialized automaton without building an UiAutomaton, so PySide6 is not needed"""
     dcg_dict: DCGDictT = {"json": _deserialize_from_json,
                           "yaml": _deserialize_from_yaml,
                           "binary": _deserialize_from_binary}[format_](bytes_like)
     if not _verify_dcg_dict(dcg_dict, tuple_as_lists=True):
         raise RuntimeError("DCG Dict could not be verified")
+    return dcg_dict
+
+
+def deserialize(automaton: IUiAutomaton, bytes_like: bytes,
+                format_: _ty.Literal["json", "yaml", "binary"] = "json") -> str:
+    """TBA"""
+    from PySide6.QtGui import QColor
+    from automaton.UIAutomaton import UiState, UiTransition
+
+    dcg_dict: DCGDictT = load_dcg_dict(bytes_like, format_)
 
     name: str = dcg_dict["name"]  # type: ignore
     author: str = dcg_dict["author"]  # type: ignore
@@ -440,13 +454,52 @@ def deserialize(automaton: IUiAutomaton, bytes_like: bytes,
             node_lookup_dict[to_idx],
             clean_to_side,
             [transition_tokens[i][j]
-             for i, j in zip(abs_transition_idxs, transition_pattern)]
+             for i, j in enumerate(transition_pattern)]
         )
         automaton.add_transition(transition_obj)
     return custom_python
 
 
+def to_simulation_request(dcg_dict: DCGDictT, automaton_input: list[_ty.Any]) -> dict[str, _ty.Any]:
+    """Converts a loaded DCG dict into a simulation request, as UiAutomaton.simulate sends it to the backend
+
+    The backend treats the first state as the start state, so the content root is moved to the front.
+    """
+    content: list[dict[str, _ty.Any]] = dcg_dict["content"]  # type: ignore
+    content_root_idx: int = dcg_dict["content_root_idx"]  # type: ignore
+    abs_transition_idxs: list[int] = dcg_dict["abs_transition_idxs"]  # type: ignore
+    transition_tokens: list[list[str]] = [
+        dcg_dict["token_lsts"][i]  # type: ignore
+        for i in abs_transition_idxs
+    ]
+
+    order: list[int] = list(range(len(content)))
+    if 0 <= content_root_idx < len(content):
+        order.remove(content_root_idx)
+        order.insert(0, content_root_idx)
+    new_idxs: dict[int, int] = {old_idx: new_idx for new_idx, old_idx in enumerate(order)}
+
+    states: list[dict[str, _ty.Any]] = [
+        {"name": content[old_idx]["name"], "type": content[old_idx]["type"], "transitions": []}
+        for old_idx in order
+    ]
+    for i, ((from_idx, to_idx), _, transition_pattern) in enumerate(dcg_dict["content_transitions"]):  # type: ignore
+        states[new_idxs[from_idx]]["transitions"].append({
+            "to": new_idxs[to_idx],
+            "condition": [transition_tokens[j][k] for j, k in enumerate(transition_pattern)],
+            "id": i
+        })
+
+    return {
+        "action": "SIMULATION",
+        "id": f"{dcg_dict['author'].lower()}:{dcg_dict['name'].lower()}",  # type: ignore
+        "input": automaton_input,
+        "content": states
+    }
+
+
 if __name__ == "__main__":
+    from automaton.UIAutomaton import UiAutomaton, UiState, UiTransition
     auto = UiAutomaton("DFA", "Griesbert", {"default": "..."})
     auto.set_token_lists([["X", "y"], ["y"]])
     auto.set_is_changeable_token_list([False, False])
@@ -285,6 +285,11 @@ class AppSettings(QObject):
     hide_scrollbars_changed = Signal(str)
     # performance
     option_changed = Signal(bool)
+    simulation_max_steps_changed = Signal(int)
+    simulation_max_duration_changed = Signal(float)
+    simulation_cycle_detection_changed = Signal(bool)
+    simulation_playback_interval_changed = Signal(int)
+    simulation_cache_size_changed = Signal(int)
     # security
     warn_of_new_plugins_changed = Signal(bool)
     run_plugin_in_separate_process_changed = Signal(bool)
@@ -377,7 +382,12 @@ class AppSettings(QObject):
             "hide_scrollbars": "True"
         })
         self._settings.set_default_settings("performance", {
-            "option": "True"
+            "option": "True",
+            "simulation_max_steps": "0",
+            "simulation_max_duration": "10.0",
+            "simulation_cycle_detection": "True",
+            "simulation_playback_interval": "500",
+            "simulation_cache_size": "64"
         })
         self._settings.set_default_settings("security", {
             "warn_of_new_plugins": "True",
@@ -583,6 +593,31 @@ class AppSettings(QObject):
     def set_option(self, flag: bool) -> None:
         self._settings.store("performance", "option", flag, "bool")
         self.option_changed.emit(flag)
+    def get_simulation_max_steps(self) -> int:
+        return self._settings.retrieve("performance", "simulation_max_steps", "integer")
+    def set_simulation_max_steps(self, max_steps: int) -> None:
+        self._settings.store("performance", "simulation_max_steps", max_steps, "integer")
+        self.simulation_max_steps_changed.emit(max_steps)
+    def get_simulation_max_duration(self) -> float:
+        return self._settings.retrieve("performance", "simulation_max_duration", "float")
+    def set_simulation_max_duration(self, max_duration: float) -> None:
+        self._settings.store("performance", "simulation_max_duration", max_duration, "float")
+        self.simulation_max_duration_changed.emit(max_duration)
+    def get_simulation_cycle_detection(self) -> bool:
+        return self._settings.retrieve("performance", "simulation_cycle_detection", "bool")  # type: ignore
+    def set_simulation_cycle_detection(self, flag: bool) -> None:
+        self._settings.store("performance", "simulation_cycle_detection", flag, "bool")
+        self.simulation_cycle_detection_changed.emit(flag)
+    def get_simulation_playback_interval(self) -> int:
+        return self._settings.retrieve("performance", "simulation_playback_interval", "integer")
+    def set_simulation_playback_interval(self, interval_ms: int) -> None:
+        self._settings.store("performance", "simulation_playback_interval", interval_ms, "integer")
+        self.simulation_playback_interval_changed.emit(interval_ms)
+    def get_simulation_cache_size(self) -> int:
+        return self._settings.retrieve("performance", "simulation_cache_size", "integer")
+    def set_simulation_cache_size(self, size_mib: int) -> None:
+        self._settings.store("performance", "simulation_cache_size", size_mib, "integer")
+        self.simulation_cache_size_changed.emit(size_mib)
     # security
     def get_warn_of_new_plugins(self) -> bool:
         return self._settings.retrieve("security", "warn_of_new_plugins", "bool")  # type: ignore
@@ -1,4 +1,6 @@
 """TBA"""
+from array import array
+
 from returns import result as _result
 from aplustools.io import ActLogger
 
@@ -13,6 +15,10 @@ from automaton.base.settings import Settings as BaseSettings
 
 from automaton.base.state import State
 
+from utils.tracer import Tracer, TRACE
+
+_tracer: Tracer = Tracer()
+
 
 # Docs generated with Chat-GPT
 
@@ -49,7 +55,7 @@ class DFAState(BaseState):
         """
         super().__init__(name)
 
-    def find_transition(self, current_input_char: str) -> _result.Result:
+    def find_transition(self, current_input_char: int) -> _result.Result:
         """
         Finds a transition based on the current input character.
 
@@ -58,29 +64,27 @@ class DFAState(BaseState):
         exist, it uses the deterministic nature of the DFA to resolve to one.
 
         Args:
-            current_input_char (str): The current input character for the DFA.
+            current_input_char (int): The symbol id of the current input character for the DFA.
 
         Returns:
             _result.Result:
                 - Success: Contains the target state of the valid transition.
                 - Failure: If no valid transition exists for the given input character.
         """
-        transition_functions: _ty.Set[BaseTransition] = self.get_transitions()
+        function: BaseTransition | None = self.match_transition(current_input_char)
 
-        for function in transition_functions:
-            # Check if the transition is valid for the input character
-            if not isinstance(function.canTransition(current_input_char), _result.Success):
-                continue
-
-            # Activate the transition (optional behavior)
-            function.activate()
-            print(f"ACTIVE DFA {function.get_start_state().get_name()} - {function.get_transition_target().get_name()} -> {current_input_char}")
+        # If no valid transition is found, return a failure result
+        if function is None:
+            return _result.Failure(f"No transition found for state {self.get_name()}!")
 
-            # Return the target state of the valid transition
-            return _result.Success(function.get_transition_target())
+        # Activate the transition (optional behavior)
+        function.activate()
+        if _tracer.level <= TRACE:
+            _tracer.emit("dfa.transition", TRACE, start=function.get_start_state().get_name(),
+                         target=function.get_transition_target().get_name(), symbol=current_input_char)
 
-        # If no valid transition is found, return a failure result
-        return _result.Failure(f"No transition found for state {self.get_name()}!")
+        # Return the target state of the valid transition
+        return _result.Success(function.get_transition_target())
 
 
 class DFATransition(BaseTransition):
@@ -109,25 +113,40 @@ class DFATransition(BaseTransition):
         """
         super().__init__(start_state, transition_target_state, list(condition))
 
-    def canTransition(self, current_input: _ty.Any) -> _result.Result:
+    def canTransition(self, current_input: int) -> _result.Result:
         """
         Checks whether the transition is valid for the given input character.
 
-        This method compares the current input character with the condition character
-        to determine if the transition can occur.
+        This method wraps `matches` into the Result protocol.
 
         Args:
-            current_input (_ty.Any): The current input character to check.
+            current_input (int): The symbol id of the current input character to check.
 
         Returns:
             _result.Result:
                 - Success: If the transition can occur (the input matches the condition).
                 - Failure: If the transition cannot occur (the input does not match the condition).
         """
-        if self.get_condition()[0] == current_input:
+        if self.matches(current_input):
             return _result.Success(None)  # Transition can occur
         return _result.Failure(f"Can not transition with input {str(current_input)}!")  # Invalid transition
 
+    def has_fast_path(self) -> bool:
+        return True
+
+    def matches(self, current_input: int) -> bool:
+        """
+        Compares the symbol id of the current input character with the interned condition character.
+
+        Args:
+            current_input (int): The symbol id of the current input character to check.
+
+        Returns:
+            bool: True if the input matches the condition, False otherwise.
+        """
+        condition_ids: _ty.Tuple[int, ...] = self._condition_ids
+        return bool(condition_ids) and condition_ids[0] == current_input
+
 
 class DFAAutomaton(BaseAutomaton):
     """
@@ -149,6 +168,12 @@ class DFAAutomaton(BaseAutomaton):
         current_char (str):
             The current character being processed from the input word.
 
+        word_ids (array):
+            The input word encoded with the symbol table of the automaton.
+
+        current_char_id (int):
+            The symbol id of the current character, -1 if it is not part of the alphabet.
+
         end_states (_ty.Set[DFAState]):
             A set of accepting (end) states for the automaton.
 
@@ -203,6 +228,8 @@ class DFAAutomaton(BaseAutomaton):
         self.word: list = []
         self.char_index: int = 0
         self.current_char: str = ""
+        self.word_ids: array = array("i")
+        self.current_char_id: int = -1
 
         self._end_states: _ty.Set[State] = set()
 
@@ -216,10 +243,39 @@ class DFAAutomaton(BaseAutomaton):
         self.word = list(automaton_input)
         self.char_index = 0
         self.current_char = self.word[self.char_index] if self.word else ""
+        self.word_ids = self._symbols.encode(self.word)
+        self.current_char_id = self.word_ids[self.char_index] if self.word else -1
 
     def get_input(self) -> _ty.Any:
         return self.word
 
+    def set_end_states(self, new_end_states: _ty.Set[State]) -> None:
+        """
+        Sets the accepting (end) states for the DFA.
+
+        Args:
+            new_end_states (_ty.Set[DFAState]): A set of states to mark as accepting states.
+        """
+        self._end_states = new_end_states
+
+    def get_end_states(self) -> _ty.Set[State]:
+        """
+        Retrieves the set of accepting (end) states.
+
+        Returns:
+            _ty.Set[DFAState]: A set containing all accepting states of the DFA.
+        """
+        return self._end_states
+
+    def is_deterministic(self) -> bool:
+        """
+        A DFA is always deterministic and can therefore be compiled into a transition table.
+
+        Returns:
+            bool: True
+        """
+        return True
+
     def next_char(self) -> None:
         """
         Advances the DFA to the next character in the input word.
@@ -227,21 +283,26 @@ class DFAAutomaton(BaseAutomaton):
         If the end of the word is reached, the character index is clamped to the word's bounds.
         """
         self.char_index += 1
-        self.current_char = self.word[max(0, min(self.char_index, len(self.word) - 1))]
+        index: int = max(0, min(self.char_index, len(self.word) - 1))
+        self.current_char = self.word[index]
+        self.current_char_id = self.word_ids[index]
 
     def next_state(self) -> _result.Result:
         """
         Transitions the DFA to the next state based on the current state and input character.
 
-        Uses the `find_transition` method of the current state to determine the appropriate transition.
+        Uses the `match_transition` method of the current state to determine the appropriate transition.
         If no valid transition is found or the target state is invalid, the automaton halts.
         """
-        transition_result: _result.Result = self.current_state.find_transition(self.current_char)
-
-        if not isinstance(transition_result, _result.Success):
+        function: BaseTransition | None = self.current_state.match_transition(self.current_char_id)
+        if function is None:
             return _result.Failure("No valid transition found!")  # No valid transition found.
+        self.activate_transition(function)
+        if _tracer.level <= TRACE:
+            _tracer.emit("dfa.transition", TRACE, start=function.get_start_state().get_name(),
+                         target=function.get_transition_target().get_name(), symbol=self.current_char)
 
-        transition: DFAState = transition_result.value_or(None)
+        transition: DFAState = function.get_transition_target()
         if not transition or transition not in self.states:
             return _result.Failure("Invalid target state!")  # Invalid target state.
 
@@ -264,13 +325,9 @@ class DFAAutomaton(BaseAutomaton):
 
         Notes:
             If no start state is set or the start state is not part of the automaton's states,
-            an error is logged and the simulation returns a failure.
+            an error is logged and the simulation returns a failure. The empty word is accepted if the
+            start state is an accepting state.
         """
-        if self.char_index >= len(self.word):
-            if self.current_state in self._end_states:
-                return _result.Success("Automaton terminated in an end state!")
-            return _result.Failure("Automaton failed to terminate in an end state!")
-
         if not self.start_state:
             ActLogger().error("Tried to start simulation of DFA-Automaton without start state!")
             return _result.Failure("No start state found")
@@ -279,22 +336,27 @@ class DFAAutomaton(BaseAutomaton):
             ActLogger().error("Tried to start simulation of DFA-Automaton without start state in automaton states!")
             return _result.Failure("Start state not in automaton states")
 
+        if self.char_index >= len(self.word):
+            # The empty word never leaves the start state
+            final_state: State = self.current_state if self.current_state is not None else self.start_state
+            if final_state in self._end_states:
+                return _result.Success("Automaton terminated in an end state!")
+            return _result.Failure("Automaton failed to terminate in an end state!")
 
-        for transition in self.get_transitions():
-            print(f"TRANSITION2 {self.get_transition_index(transition)} {transition.get_start_state().get_name()} - {transition.get_transition_target().get_name()} -> {transition.get_condition()}")
-
-
-        # loop die alle states und transitions deaktiviert (state#deactivate())
-        for state in self.get_states():
-            state.deactivate()
+        if _tracer.level <= TRACE:
+            for transition in self.get_transitions():
+                _tracer.emit("dfa.transitions", TRACE, index=self.get_transition_index(transition),
+                             start=transition.get_start_state().get_name(),
+                             target=transition.get_transition_target().get_name(),
+                             condition=transition.get_condition())
 
-        for transition in self.get_transitions():
-            transition.deactivate()
+        self.clear_activations()  # Only deactivates what the last step activated
 
         if self.current_state is None:
             self.current_state = self.start_state
-            print(f"ACTIVE DFA {self.current_state.get_name()}")
-            self.current_state.activate()
+            if _tracer.level <= TRACE:
+                _tracer.emit("dfa.start", TRACE, state=self.current_state.get_name())
+            self.activate_state(self.current_state)
 
         result: _result.Result = self.next_state()  # Transition to the next state.
         if not isinstance(result, _result.Success):
@@ -302,7 +364,16 @@ class DFAAutomaton(BaseAutomaton):
             return result
 
         self.next_char()  # Move to the next character in the input.
-        self.current_state.activate()  # Activate the current state (if such behavior is defined).
+        self.activate_state(self.current_state)  # Activate the current state (if such behavior is defined).
+
+    def pop_input_changes(self) -> _ty.Tuple[int, _ty.List[int]] | None:
+        """
+        The input of a finite automaton is only read, never written.
+
+        Returns:
+            _ty.Tuple[int, _ty.List[int]]: No inserted and no written cells.
+        """
+        return 0, []
 
     def get_current_return_value(self) -> _ty.Any:
         """
@@ -1,4 +1,5 @@
 from returns import result as _result
+from array import array
 import sys
 import os
 # sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../base')))
@@ -12,6 +13,10 @@ import typing as _ty
 import types as _ts
 from automaton.base.settings import Settings as BaseSettings
 
+from utils.tracer import Tracer, TRACE
+
+_tracer: Tracer = Tracer()
+
 
 # Comments generated with Chat-GPT
 
@@ -48,7 +53,7 @@ class MealyState(BaseState):
         """
         super().__init__(name)
 
-    def find_transition(self, current_input: any) -> _result.Result:
+    def find_transition(self, current_input: int) -> _result.Result:
         """
         Identifies a valid transition based on the current input symbol.
 
@@ -57,7 +62,7 @@ class MealyState(BaseState):
         deterministically to one valid transition.
 
         Args:
-            current_input (any): The symbol currently being processed by the Mealy Machine.
+            current_input (int): The symbol id of the symbol currently being processed by the Mealy Machine.
 
         Returns:
             _result.Result:
@@ -69,23 +74,18 @@ class MealyState(BaseState):
               and the target state along with the output is returned.
             - If no valid transitions are found, a failure result is returned.
         """
-        transition_functions: _ty.Set[BaseTransition] = self.get_transitions()
-
-        for function in transition_functions:
-            # Check if the transition is valid for the current input symbol
-            if not isinstance(function.canTransition(current_input), _result.Success):
-                continue
+        function: BaseTransition | None = self.match_transition(current_input)
 
-            # Activate the transition (if applicable)
-            function.activate()
-            result_output = function.canTransition(current_input)
-            output = result_output.unwrap()
+        # If no valid transitions exist, return a failure result
+        if function is None:
+            return _result.Failure(f"No transition found for state {self.get_name()}!")
 
-            # Return the target state and the output
-            return _result.Success((function.get_transition_target(), output))
+        # Activate the transition (if applicable)
+        function.activate()
+        output = function.get_effect(current_input)
 
-        # If no valid transitions exist, return a failure result
-        return _result.Failure(f"No transition found for state {self.get_name()}!")
+        # Return the target state and the output
+        return _result.Success((function.get_transition_target(), output))
 
 
 class MealyTransition(BaseTransition):
@@ -119,6 +119,7 @@ class MealyTransition(BaseTransition):
         super().__init__(start_state, transition_target_state, condition)
         self.condition_input: any = condition[0]
         self.output: any = condition[1]
+        self._wildcard: bool = self.condition_input == "_"  # Matches every input
 
     def get_condition(self):
         """
@@ -129,7 +130,19 @@ class MealyTransition(BaseTransition):
         """
         return self.condition_input
 
-    def canTransition(self, current_input: _ty.Any) -> _result.Result:
+    def set_condition(self, new_condition: any) -> None:
+        """
+        Sets a new condition, consisting of the input and the output of the transition.
+
+        Args:
+            new_condition (any): The new condition for the transition.
+        """
+        super().set_condition(new_condition)
+        self.condition_input = new_condition[0]
+        self.output = new_condition[1]
+        self._wildcard = self.condition_input == "_"
+
+    def canTransition(self, current_input: int) -> _result.Result:
         """
         Determines if the transition is valid for the given input and returns the associated output.
 
@@ -137,7 +150,7 @@ class MealyTransition(BaseTransition):
         is valid, it returns the associated output.
 
         Args:
-            current_input (_ty.Any): The current input symbol to evaluate.
+            current_input (int): The symbol id of the current input symbol to evaluate.
 
         Returns:
             _result.Result:
@@ -145,12 +158,37 @@ class MealyTransition(BaseTransition):
                 - Failure: If the transition is invalid, returns an error message.
         """
 
-        if self.condition_input == current_input or self.condition_input == "_":
+        if self.matches(current_input):
             output = self.output  # Output
             return _result.Success(output)  # Transition can occur
 
         return _result.Failure(f"Cannot transition with input {str(current_input)}!")  # Invalid transition
 
+    def has_fast_path(self) -> bool:
+        return True
+
+    def matches(self, current_input: int) -> bool:
+        """
+        Checks if the interned condition matches the current input or is the wildcard "_".
+
+        Args:
+            current_input (int): The symbol id of the current input symbol to evaluate.
+
+        Returns:
+            bool: True if the transition is valid, False otherwise.
+        """
+        condition_ids: _ty.Tuple[int, ...] = self._condition_ids
+        return self._wildcard or (bool(condition_ids) and condition_ids[0] == current_input)
+
+    def effect(self) -> _ty.Any:
+        """
+        Returns the output produced when the transition is taken.
+
+        Returns:
+            any: The output of the transition.
+        """
+        return self.output
+
 
 #from aplustools.io import ActLogger
 class MealyAutomaton(BaseAutomaton):
@@ -170,6 +208,12 @@ class MealyAutomaton(BaseAutomaton):
         current_input (any):
             The current input element being processed.
 
+        input_ids (array):
+            The input sequence encoded with the symbol table of the automaton.
+
+        current_input_id (int):
+            The symbol id of the current input element, -1 if it is not part of the alphabet.
+
         input_alphabet (list):
             The set of allowable inputs for the automaton.
 
@@ -231,6 +275,9 @@ class MealyAutomaton(BaseAutomaton):
         self.input_index: int = 0
         self.output: any = None
         self.current_input = None
+        self.input_ids: array = array("i")
+        self.current_input_id: int = -1
+        self._reported_index: int = 0  # The outputs before this index were reported by pop_input_changes
 
     def set_input(self, input: list) -> None:
         """
@@ -240,11 +287,15 @@ class MealyAutomaton(BaseAutomaton):
             input (list): The sequence of inputs to be processed by the automaton.
         """
         self.input = input
+        self.input_ids = self._symbols.encode(input)  # Outputs are written into the input, the ids stay unchanged
         self.input_index = 0
+        self._reported_index = 0
         if not self.input:
             self.current_input = None
+            self.current_input_id = -1
         else:
             self.current_input = self.input[self.input_index]
+            self.current_input_id = self.input_ids[self.input_index]
 
     def get_input(self) -> _ty.Any:
         """
@@ -303,27 +354,28 @@ class MealyAutomaton(BaseAutomaton):
         self.input_index += 1
         if self.input_index < len(self.input):
             self.current_input = self.input[self.input_index]
+            self.current_input_id = self.input_ids[self.input_index]
         else:
             self.current_input = None  # End of input sequence.
+            self.current_input_id = -1
 
     def next_state(self) -> _result.Result:
         """
         Transitions the automaton to the next state based on the current state and input.
 
-        Uses the `find_transition` method of the current state to determine the appropriate transition.
+        Uses the `match_transition` method of the current state to determine the appropriate transition.
         If no valid transition is found or the target state is invalid, the automaton halts.
 
         Returns:
             _result.Result: The output generated during the transition or a failure message.
         """
-        transition_result: _result.Result = self.current_state.find_transition(self.current_input)
-
-        if not isinstance(transition_result, _result.Success):
+        function: BaseTransition | None = self.current_state.match_transition(self.current_input_id)
+        if function is None:
             return _result.Failure("No valid transition found!")
+        self.activate_transition(function)
+        output = function.get_effect(self.current_input_id)
 
-        state, output = transition_result.value_or((None, None))
-
-        transition: MealyState = state
+        transition: MealyState = function.get_transition_target()
         if not transition or transition not in self.states:
             return _result.Failure("Invalid target state!")
 
@@ -356,17 +408,19 @@ class MealyAutomaton(BaseAutomaton):
             return _result.Failure("Start state not in automaton states")
 
         self.current_state = self.start_state
-        self.current_state.activate()
+        self.activate_state(self.current_state)
 
         while self.input_index < len(self.input):
+            self.clear_activations()
             output = self.next_state()
             if isinstance(output, _result.Failure):
                 return output
             self.output = output
             self.input[self.get_current_index()] = self.output
-            print(self.output)
+            if _tracer.level <= TRACE:
+                _tracer.emit("mealy.output", TRACE, index=self.get_current_index(), output=self.output)
             self.next_input()
-            self.current_state.activate()
+            self.activate_state(self.current_state)
 
         return _result.Success("Simulation finished successfully :)")
 
@@ -397,15 +451,11 @@ class MealyAutomaton(BaseAutomaton):
             #ActLogger().error("Tried to start simulation of Mealy Automaton without start state in automaton states!")
             return _result.Failure("Start state not in automaton states")
 
-        for state in self.states:
-            state.deactivate()
-
-        for transition in self.transitions:
-            transition.deactivate()
+        self.clear_activations()  # Only deactivates what the last step activated
 
         if self.current_state is None:
             self.current_state = self.start_state
-            self.current_state.activate()
+            self.activate_state(self.current_state)
 
         output = self.next_state()
         if isinstance(output, _result.Failure):
@@ -414,7 +464,17 @@ class MealyAutomaton(BaseAutomaton):
         self.output = output
         self.input[self.get_current_index()] = self.output
         self.next_input()
-        self.current_state.activate()
+        self.activate_state(self.current_state)
+
+    def is_transducer(self) -> bool:
+        """
+        A Mealy machine takes the first valid transition and outputs one symbol per input symbol, so it can be
+        compiled into transition and output tables.
+
+        Returns:
+            bool: True
+        """
+        return True
 
     def add_state(self, state: MealyState, state_type: str) -> None:
         self.states.add(state)
@@ -427,5 +487,23 @@ class MealyAutomaton(BaseAutomaton):
     def get_current_index(self) -> int:
         return self.input_index
 
+    def reset(self) -> None:
+        """
+        Resets the simulation state, including the last output.
+        """
+        super().reset()
+        self.output = None
+
+    def pop_input_changes(self) -> _ty.Tuple[int, _ty.List[int]] | None:
+        """
+        The outputs replace the consumed inputs, so the cells written since the last call are the ones consumed since.
+
+        Returns:
+            _ty.Tuple[int, _ty.List[int]]: No inserted cells and the indices of the written outputs.
+        """
+        written: _ty.List[int] = list(range(self._reported_index, self.input_index))
+        self._reported_index = self.input_index
+        return 0, written
+
     def get_current_return_value(self) -> _ty.Any:
         return self.output
@@ -0,0 +1,382 @@
+"""TBA"""
+from array import array
+
+from returns import result as _result
+from aplustools.io import ActLogger
+
+# Standard typing imports for aps
+import typing as _ty
+
+# Abstract Machine related imports
+from automaton.base.state import State as BaseState
+from automaton.base.transition import Transition as BaseTransition
+from automaton.base.automaton import Automaton as BaseAutomaton
+from automaton.base.settings import Settings as BaseSettings
+
+from automaton.base.state import State
+
+from utils.tracer import Tracer, TRACE
+
+_tracer: Tracer = Tracer()
+
+
+class NFASettings(BaseSettings):
+
+    def __init__(self):
+        super().__init__("nfa", "Nondeterministic Finite Automaton", "Giesbrt",
+                         [[NFATransition.EPSILON], ], [True, ], [0, ],
+                         {'Default': "Ellipse: ((180.0, 180.0), 180.0, 180.0), 6#000000##00000000;",
+                          'Start': "Ellipse: ((180.0, 180.0), 180.0, 180.0), 6#000000##00000000;Polygon: ((80.0, 160.0), (230.0, 160.0), (230.0, 130.0), (280.0, 180.0), (230.0, 230.0), (230.0, 200.0), (80.0, 200.0)), 0#ff0000##ff0000;",
+                          'End': "Ellipse: ((180.0, 180.0), 180.0, 180.0), 6#000000##00000000;Ellipse: ((180.0, 180.0), 153.0, 153.0), 2#000000##00000000;"})
+
+
+class NFAState(BaseState):
+    """
+    Represents a state in a Nondeterministic Finite Automaton (NFA).
+
+    The automaton follows all valid transitions of its current states at once, so a state only offers its first
+    valid transition through `find_transition`, like a DFA state.
+
+    Attributes:
+        Inherits all attributes from the `BaseState` class.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initializes an NFA state with a given name.
+
+        Args:
+            name (str): The name of the NFA state.
+        """
+        super().__init__(name)
+
+    def find_transition(self, current_input_char: int) -> _result.Result:
+        """
+        Finds the first transition valid for the current input character.
+
+        Args:
+            current_input_char (int): The symbol id of the current input character.
+
+        Returns:
+            _result.Result:
+                - Success: Contains the target state of the valid transition.
+                - Failure: If no valid transition exists for the given input character.
+        """
+        function: BaseTransition | None = self.match_transition(current_input_char)
+        if function is None:
+            return _result.Failure(f"No transition found for state {self.get_name()}!")
+
+        function.activate()
+        return _result.Success(function.get_transition_target())
+
+
+class NFATransition(BaseTransition):
+    """
+    Represents a transition between two states in a Nondeterministic Finite Automaton (NFA).
+
+    A transition is valid if the current input character matches its condition character. A transition with the
+    condition EPSILON is an ε-transition, it is taken without consuming any input and never matches an input.
+
+    Attributes:
+        condition (str): The character that must match the input for the transition to occur, or EPSILON.
+        start_state (BaseState): The state where the transition originates.
+        transition_target_state (BaseState): The state where the transition leads.
+    """
+    EPSILON: str = "ε"
+
+    def __init__(self, start_state: BaseState, transition_target_state: BaseState,
+                 condition: _ty.List[_ty.Any] | str) -> None:
+        """
+        Initializes a transition with the start state, target state, and the input character condition.
+
+        Args:
+            start_state (BaseState): The state where the transition originates.
+            transition_target_state (BaseState): The state where the transition leads.
+            condition (str): The input character that triggers this transition, or EPSILON.
+        """
+        super().__init__(start_state, transition_target_state, list(condition))
+
+    def canTransition(self, current_input: int) -> _result.Result:
+        """
+        Checks whether the transition is valid for the given input character.
+
+        This method wraps `matches` into the Result protocol.
+
+        Args:
+            current_input (int): The symbol id of the current input character to check.
+
+        Returns:
+            _result.Result:
+                - Success: If the transition can occur (the input matches the condition).
+                - Failure: If the transition cannot occur.
+        """
+        if self.matches(current_input):
+            return _result.Success(None)
+        return _result.Failure(f"Can not transition with input {str(current_input)}!")
+
+    def has_fast_path(self) -> bool:
+        return True
+
+    def matches(self, current_input: int) -> bool:
+        """
+        Compares the symbol id of the current input character with the interned condition character.
+
+        Args:
+            current_input (int): The symbol id of the current input character to check.
+
+        Returns:
+            bool: True if the input matches the condition, False otherwise and for ε-transitions.
+        """
+        condition_ids: _ty.Tuple[int, ...] = self._condition_ids
+        return bool(condition_ids) and condition_ids[0] == current_input and not self.is_epsilon()
+
+    def is_epsilon(self) -> bool:
+        """
+        Returns whether the condition of the transition is EPSILON.
+
+        Returns:
+            bool: True if the transition is an ε-transition, False otherwise.
+        """
+        condition: _ty.List[_ty.Any] = self._condition
+        return bool(condition) and condition[0] == self.EPSILON
+
+
+class NFAAutomaton(BaseAutomaton):
+    """
+    Represents a Nondeterministic Finite Automaton (NFA) with ε-transitions.
+
+    The automaton is in a set of states at once. Every step follows all transitions of the current states which
+    match the current character and then all ε-transitions of the reached states (the ε-closure). The word is
+    accepted if one of the states the automaton ends in is an end state.
+    Sets of states are ints used as bitsets, bit `i` stands for the state with the index `i` in `states`.
+
+    Attributes:
+        word (list):
+            The input word to be processed by the automaton.
+
+        char_index (int):
+            Tracks the current position in the input word.
+
+        word_ids (array):
+            The input word encoded with the symbol table of the automaton.
+
+        current_char_id (int):
+            The symbol id of the current character, -1 if it is not part of the alphabet.
+
+        current_states (int | None):
+            The current set of states, None before the first step.
+
+    Methods:
+        is_nondeterministic() -> bool:
+            Returns True, the automaton can be compiled into successor sets.
+
+        simulate_one_step() -> _result.Result:
+            Runs one step of the NFA simulation on the input word.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a Nondeterministic Finite Automaton (NFA) instance with an empty input word and no end states.
+        """
+        super().__init__()
+        self.word: list = []
+        self.char_index: int = 0
+        self.word_ids: array = array("i")
+        self.current_char_id: int = -1
+        self.current_states: int | None = None
+
+        self._end_states: _ty.Set[State] = set()
+        self._state_order: _ty.List[State] = []  # The states by their bit, fixed when the input is set
+        self._state_bits: _ty.Dict[State, int] = {}
+        self._end_bits: int = 0
+
+    def set_input(self, automaton_input: _ty.Any) -> None:
+        """
+        Sets a new input word for the NFA to process.
+
+        Args:
+            automaton_input (_ty.Any): The characters to be processed by the automaton.
+        """
+        self.word = list(automaton_input)
+        self.char_index = 0
+        self.word_ids = self._symbols.encode(self.word)
+        self.current_char_id = self.word_ids[0] if self.word else -1
+
+        self._state_order = list(self.states)
+        self._state_bits = {state: 1 << i for i, state in enumerate(self._state_order)}
+        self._end_bits = 0
+        for state in self._end_states:
+            self._end_bits |= self._state_bits.get(state, 0)
+
+    def get_input(self) -> _ty.Any:
+        return self.word
+
+    def set_end_states(self, new_end_states: _ty.Set[State]) -> None:
+        """
+        Sets the accepting (end) states for the NFA.
+
+        Args:
+            new_end_states (_ty.Set[State]): A set of states to mark as accepting states.
+        """
+        self._end_states = new_end_states
+
+    def get_end_states(self) -> _ty.Set[State]:
+        """
+        Retrieves the set of accepting (end) states.
+
+        Returns:
+            _ty.Set[State]: A set containing all accepting states of the NFA.
+        """
+        return self._end_states
+
+    def is_nondeterministic(self) -> bool:
+        """
+        An NFA is always a nondeterministic acceptor and can therefore be compiled into successor sets.
+
+        Returns:
+            bool: True
+        """
+        return True
+
+    def reset(self) -> None:
+        super().reset()
+        self.current_states = None
+
+    def _iter_states(self, states: int) -> _ty.Iterator[State]:
+        """
+        Iterates over the states of a set by their bit, without looking at the states not in the set.
+
+        Args:
+            states (int): The set of states, as a bitset.
+
+        Returns:
+            _ty.Iterator[State]: The states in the order of their bits.
+        """
+        state_order: _ty.List[State] = self._state_order
+        while states:
+            lowest_bit: int = states & -states
+            yield state_order[lowest_bit.bit_length() - 1]
+            states ^= lowest_bit
+
+    def _close(self, states: int) -> int:
+        """
+        Extends a set of states by all states reachable through ε-transitions and activates the taken ε-transitions.
+
+        Args:
+            states (int): The set of states, as a bitset.
+
+        Returns:
+            int: The ε-closure of the set, as a bitset.
+        """
+        state_bits: _ty.Dict[State, int] = self._state_bits
+        pending: _ty.List[State] = list(self._iter_states(states))
+        while pending:
+            for transition in pending.pop().get_transitions():
+                if not transition.is_epsilon():
+                    continue
+                bit: int = state_bits.get(transition.get_transition_target(), 0)
+                if bit and not states & bit:
+                    states |= bit
+                    pending.append(transition.get_transition_target())
+                    self.activate_transition(transition)
+        return states
+
+    def _activate_states(self) -> None:
+        """
+        Activates all current states, the first one becomes the current state.
+        """
+        self.current_state = None
+        for state in self._iter_states(self.current_states):
+            if self.current_state is None:
+                self.current_state = state
+            self.activate_state(state)
+
+    def simulate_one_step(self) -> _result.Result:
+        """
+        Runs one step of the NFA simulation on the input word.
+
+        The first step starts in the ε-closure of the start state. Every step follows all transitions of the current
+        states matching the current character, followed by the ε-closure of the reached states.
+
+        Returns:
+            _result.Result:
+                - Success: If the NFA terminates in a set containing an end state.
+                - Failure: If the set of states became empty or contains no end state at the end of the input.
+                - None: If the simulation continues.
+        """
+        if not self.start_state:
+            ActLogger().error("Tried to start simulation of NFA-Automaton without start state!")
+            return _result.Failure("No start state found")
+
+        if self.start_state not in self.states:
+            ActLogger().error("Tried to start simulation of NFA-Automaton without start state in automaton states!")
+            return _result.Failure("Start state not in automaton states")
+
+        if self.current_states is None:
+            self.clear_activations()
+            self.current_states = self._close(self._state_bits[self.start_state])
+            self._activate_states()
+
+        if self.char_index >= len(self.word):
+            if self.current_states & self._end_bits:
+                return _result.Success("Automaton terminated in an end state!")
+            return _result.Failure("Automaton failed to terminate in an end state!")
+
+        self.clear_activations()  # Only deactivates what the last step activated
+
+        state_bits: _ty.Dict[State, int] = self._state_bits
+        next_states: int = 0
+        for state in self._iter_states(self.current_states):
+            for transition in state.get_transitions():
+                if transition.matches(self.current_char_id):
+                    next_states |= state_bits.get(transition.get_transition_target(), 0)
+                    self.activate_transition(transition)
+        if _tracer.level <= TRACE:
+            _tracer.emit("nfa.step", TRACE, symbol=self.word[self.char_index],
+                         states=[state.get_name() for state in self._iter_states(next_states)])
+
+        if not next_states:
+            ActLogger().error("No valid transition found!")
+            return _result.Failure("No valid transition found!")
+
+        self.current_states = self._close(next_states)
+        self.char_index += 1
+        if self.char_index < len(self.word):
+            self.current_char_id = self.word_ids[self.char_index]
+        self._activate_states()
+
+    def pop_input_changes(self) -> _ty.Tuple[int, _ty.List[int]] | None:
+        """
+        The input of a finite automaton is only read, never written.
+
+        Returns:
+            _ty.Tuple[int, _ty.List[int]]: No inserted and no written cells.
+        """
+        return 0, []
+
+    def get_current_return_value(self) -> _ty.Any:
+        """
+        Returns the last return value of the automaton after one step of simulation
+
+        Returns:
+            _ty.Any: The return value
+        """
+        return None  # None due to the lack of return values in an nfa automaton
+
+    def get_current_index(self) -> int:
+        """
+        Returns the current index where the pointer (on the input sequence) is located
+
+        Returns:
+            int: current index of the pointer
+        """
+        return self.char_index
+
+    def add_state(self, state: State, state_type: str) -> None:
+        self.states.add(state)
+        match state_type.lower():
+            case "end":
+                self._end_states.add(state)
+
+            case "default":
+                pass
@@ -13,6 +13,12 @@ from automaton.base.automaton import Automaton as BaseAutomaton
 from automaton.base.state import State as BaseState
 from automaton.base.transition import Transition as BaseTransition
 from automaton.base.settings import Settings as BaseSettings
+from automaton.base.tape import Tape, TapeView
+from automaton.base.symbols import SymbolTable
+
+from utils.tracer import Tracer, TRACE
+
+_tracer: Tracer = Tracer()
 
 
 # Comments generated with Chat-GPT
@@ -51,7 +57,7 @@ class TMState(BaseState):
         """
         super().__init__(name)
 
-    def find_transition(self, current_input_char: str) -> _result.Result:
+    def find_transition(self, current_input_char: int) -> _result.Result:
         """
         Identifies a valid transition based on the current input character.
 
@@ -60,7 +66,7 @@ class TMState(BaseState):
         deterministically to one valid transition.
 
         Args:
-            current_input_char (str): The character currently being processed by the Turing Machine.
+            current_input_char (int): The symbol id of the character currently being processed by the Turing Machine.
 
         Returns:
             _result.Result:
@@ -72,23 +78,18 @@ class TMState(BaseState):
               and the target state is returned.
             - If no valid transitions are found, a failure result is returned.
         """
-        transition_functions: _ty.Set[BaseTransition] = self.get_transitions()
+        function: BaseTransition | None = self.match_transition(current_input_char)
 
-        for function in transition_functions:
-            # Check if the transition is valid for the current input character
-            if not isinstance(function.canTransition(current_input_char), _result.Success):
-                continue
+        # If no valid transitions exist, return a failure result
+        if function is None:
+            return _result.Failure(f"No transition found for state {self.get_name()}!")
 
-            # Activate the transition (if applicable)
-            function.activate()
-            result_condition = function.canTransition(current_input_char)
-            condition = result_condition.unwrap()
+        # Activate the transition (if applicable)
+        function.activate()
+        condition = function.get_effect(current_input_char)
 
-            # Return the target state and the condition
-            return _result.Success((function.get_transition_target(), condition))
-
-        # If no valid transitions exist, return a failure result
-        return _result.Failure(f"No transition found for state {self.get_name()}!")
+        # Return the target state and the condition
+        return _result.Success((function.get_transition_target(), condition))
 
 
 class TMTransition(BaseTransition):
@@ -124,34 +125,82 @@ class TMTransition(BaseTransition):
         """
         super().__init__(start_state, transition_target_state, condition_char)
         self.condition_char: list = condition_char
+        self._wildcard: bool = False  # Matches every character
+        self._effect: _ty.Tuple[int, str] | None = None  # (to_write, head_move), set once the condition is interned
+
+    def set_condition(self, new_condition: list) -> None:
+        """
+        Sets a new condition in the format `input|write|move`.
+
+        Args:
+            new_condition (list): The new condition for the transition.
+        """
+        super().set_condition(new_condition)
+        self.condition_char = new_condition
+
+    def intern_condition(self, symbols: SymbolTable) -> None:
+        """
+        Interns the condition and prepares the `(to_write, head_move)` tuple returned by `effect`. Incomplete
+        conditions never match.
+
+        Args:
+            symbols (SymbolTable): The symbol table of the automaton the transition belongs to.
+        """
+        super().intern_condition(symbols)
+        condition: _ty.List[_ty.Any] = self._condition
+        self._wildcard = len(condition) >= 3 and condition[0] == "_"
+        self._effect = (self._condition_ids[1], condition[2]) if len(condition) >= 3 else None
 
-    def canTransition(self, current_input: _ty.Any) -> _result.Result:
+    def canTransition(self, current_input: int) -> _result.Result:
         """
         Determines if the transition is valid for the given input and returns the associated actions.
 
         This method splits the `condition_char` into its components (`input|write|move`) and checks
-        if the `input` part matches the current input. If the transition is valid, it returns the 
-        character to write and the head movement direction.
+        if the interned `input` part matches the current input. If the transition is valid, it returns the
+        symbol id of the character to write and the head movement direction.
 
         Args:
-            current_input (_ty.Any): The current input character to evaluate.
+            current_input (int): The symbol id of the current input character to evaluate.
 
         Returns:
             _result.Result:
                 - Success: If the transition is valid, returns a tuple `(to_write, head_move)` where:
-                    - `to_write` (str): The character to write on the tape.
+                    - `to_write` (int): The symbol id of the character to write on the tape.
                     - `head_move` (str): The direction to move the head ("L", "R", or "H").
                 - Failure: If the transition is invalid, returns an error message.
         """
 
-        condition_parts = self.condition_char
-        if condition_parts[0] == current_input or condition_parts[0] == "_":
-            to_write = condition_parts[1]  # Character to write
-            head_move = condition_parts[2]  # Direction to move the head
-            return _result.Success((to_write, head_move))  # Transition can occur
+        if self.matches(current_input):
+            return _result.Success(self._effect)  # Transition can occur, (to_write, head_move)
 
         return _result.Failure(f"Cannot transition with input {str(current_input)}!")  # Invalid transition
 
+    def has_fast_path(self) -> bool:
+        return True
+
+    def matches(self, current_input: int) -> bool:
+        """
+        Checks if the interned `input` part matches the current input or is the wildcard "_".
+
+        Args:
+            current_input (int): The symbol id of the current input character to evaluate.
+
+        Returns:
+            bool: True if the transition is valid, False otherwise (also if the condition was not interned yet).
+        """
+        if self._effect is None:
+            return False
+        return self._wildcard or self._condition_ids[0] == current_input
+
+    def effect(self) -> _ty.Tuple[int, str]:
+        """
+        Returns the actions performed when the transition is taken.
+
+        Returns:
+            _ty.Tuple[int, str]: The symbol id of the character to write and the head movement ("L", "R" or "H").
+        """
+        return self._effect
+
 
 class TMAutomaton(BaseAutomaton):
     """
@@ -163,15 +212,16 @@ class TMAutomaton(BaseAutomaton):
     or right, modify tape symbols, and decide whether to halt in an accepting state.
 
     Attributes:
-        memoryTape (dict):
-            The tape used by the Turing Machine to process input.
-
-        head (int):
-            The current position of the machine's read/write head on the tape.
+        tape (Tape):
+            The two-way tape used by the Turing Machine to process input. It also tracks the position of the
+            machine's read/write head.
 
         current_char (str):
             The current symbol being processed on the tape.
 
+        current_char_id (int):
+            The symbol id of the current symbol, the tape shares the symbol table of the automaton.
+
         LBAutomaton (bool):
             Flag indicating whether the machine operates as a Linear Bounded Automaton.
 
@@ -185,11 +235,11 @@ class TMAutomaton(BaseAutomaton):
         set_mode(mode: str):
             Sets the operational mode of the automaton (e.g., LBAutomaton).
 
-        set_input(new_word: str) -> None:
+        set_input(new_word: _ty.Iterable[str]) -> None:
             Loads a new input word onto the tape and resets the head position.
 
-        get_input() -> str:
-            Retrieves the input word from the tape.
+        get_input() -> TapeView:
+            Retrieves a view onto the visited cells of the tape.
 
         right() -> None:
             Moves the machine's head to the right and updates the current character.
@@ -235,9 +285,11 @@ class TMAutomaton(BaseAutomaton):
         It also ensures that the base automaton properties, such as states and transitions, are initialized.
         """
         super().__init__()
-        self.memoryTape: str = {}
-        self.head: int = 0
+        self.tape: Tape = Tape(symbols=self._symbols)  # Tape cells and conditions share the symbol ids
+        self._written_cells: _ty.List[int] | None = None  # Tape indices written since the last pop_input_changes
+        self._reported_low: int = 0  # The lowest visited tape index at the last pop_input_changes
         self.current_char: str = ""
+        self.current_char_id: int = -1
         self.LBAutomaton: bool = False
         self.output_alphabet = []
         self.input_alphabet = []
@@ -255,30 +307,31 @@ class TMAutomaton(BaseAutomaton):
         else:
             self.LBAutomaton = False
 
-    def set_input(self, new_word: str) -> None:
+    def set_input(self, new_word: _ty.Iterable[str]) -> None:
         """
         Loads a new input word onto the tape and resets the head position.
 
         Args:
-            new_word (str): The string of characters to be loaded onto the tape.
+            new_word (_ty.Iterable[str]): The tokens to be loaded onto the tape.
         """
-        for key, char in enumerate(new_word):
-            self.memoryTape[key] = char
-        self.head = 0
-        self.current_char = self.memoryTape[self.head]
+        self.tape.load(new_word)
+        self._read()
+        self._written_cells = None  # Tracking starts again with the next pop_input_changes
+        self._reported_low = 0
 
     def get_current_state(self):
         return super().get_current_state()
 
-    def get_input(self) -> str:
+    def get_input(self) -> TapeView:
         """
-        Retrieves the input word from the memory tape.
+        Retrieves the visited cells of the tape, from the lowest to the highest index.
+
+        The returned view does not copy the tape, so this is O(1).
 
         Returns:
-            str: The reconstructed word from the tape.
+            TapeView: A view onto the visited cells of the tape.
         """
-        return "".join(
-            self.memoryTape.get(i, "B") for i in range(min(self.memoryTape.keys()), max(self.memoryTape.keys()) + 1))
+        return self.tape.window()
 
     def set_input_alphabet(self, alphabet: _ty.Any) -> None:
         """
@@ -326,15 +379,10 @@ class TMAutomaton(BaseAutomaton):
         Returns:
             _result.Failure: If the head attempts to move beyond the bounds in LBA mode.
         """
-        self.head += 1
-        if self.head in self.memoryTape:
-            self.current_char = self.memoryTape[self.head]
-        elif not self.LBAutomaton:
-            self.memoryTape[self.head] = "B"
-            self.current_char = self.memoryTape[self.head]
-            print(self.memoryTape)
-        else:
+        if self.LBAutomaton and self.tape.get_head() >= self.tape.get_bounds()[1]:
             return _result.Failure("You can't go further, your automaton is linear bounded!")
+        self.tape.move_right()
+        self._read()
 
     def left(self) -> None:
         """
@@ -346,20 +394,25 @@ class TMAutomaton(BaseAutomaton):
         Returns:
             _result.Failure: If the head attempts to move beyond the bounds in LBA mode.
         """
-        self.head -= 1
-        if self.head in self.memoryTape:
-            self.current_char = self.memoryTape[self.head]
-        elif not self.LBAutomaton:
-            self.memoryTape[self.head] = "B"
-            self.current_char = self.memoryTape[self.head]
-        else:
+        if self.LBAutomaton and self.tape.get_head() <= self.tape.get_bounds()[0]:
             return _result.Failure("You can't go further, your automaton is linear bounded!")
+        self.tape.move_left()
+        self._read()
+
+    def _read(self) -> None:
+        """
+        Reads the cell under the head into the current character and its symbol id.
+        """
+        self.current_char_id = self.tape.read_id()
+        self.current_char = self._symbols.get_symbol(self.current_char_id)
 
     def write(self) -> None:
         """
         Writes the current character to the tape at the head's position.
         """
-        self.memoryTape[self.head] = self.current_char
+        self.tape.write_id(self.current_char_id)
+        if self._written_cells is not None:
+            self._written_cells.append(self.tape.get_head())
 
     def set_end_states(self, new_end_states: _ty.Set[TMState]) -> None:
         """
@@ -389,24 +442,26 @@ class TMAutomaton(BaseAutomaton):
         """
         Processes a transition based on the current state and input character.
 
-        Uses the `find_transition` method of the current state to determine the appropriate transition.
+        Uses the `match_transition` method of the current state to determine the appropriate transition.
         If no valid transition is found or the target state is invalid, the machine halts.
 
         Returns:
             None: If the machine halts due to an invalid state or transition.
         """
-        transition_result: _result.Result = self.current_state.find_transition(self.current_char)
-        if not isinstance(transition_result, _result.Success):
+        function: BaseTransition | None = self.current_state.match_transition(self.current_char_id)
+        if function is None:
             return _result.Failure("There's no possible transition")
+        self.activate_transition(function)
+        condition = function.get_effect(self.current_char_id)
 
-        target_state, condition = transition_result.unwrap()
-
-        transition: TMState = target_state
+        transition: TMState = function.get_transition_target()
         if not transition or transition not in self.states:
             return _result.Failure("Invalid target state!")
 
         self.current_state = transition
-        print(self.current_state)
+        if _tracer.level <= TRACE:
+            _tracer.emit("tm.transition", TRACE, target=transition.get_name(), read=self.current_char,
+                         write=self._symbols.get_symbol(condition[0]), move=condition[1], head=self.tape.get_head())
         return condition
 
     def next_location(self, callback=None):
@@ -456,14 +511,16 @@ class TMAutomaton(BaseAutomaton):
             return _result.Failure("Start state not in automaton states")
 
         self.current_state = self.start_state
-        self.current_state.activate()
+        self.activate_state(self.current_state)
 
         while True:
+            self.clear_activations()
             condition = self.next_state()  # Transition to the next state.
             if isinstance(condition, _result.Failure):
                 return condition
             if isinstance(condition, tuple) and len(condition) == 2:
-                self.current_char = condition[0]
+                self.current_char_id = condition[0]
+                self.current_char = self._symbols.get_symbol(self.current_char_id)
             else:
                 return _result.Failure("There is no condition!")
             if self.current_char != "_":
@@ -475,8 +532,8 @@ class TMAutomaton(BaseAutomaton):
             elif condition[1] == "H":
                 break
 
-            self.current_char = self.memoryTape[self.head]
-            self.current_state.activate()  # Activate the current state (if such behavior is defined).
+            self._read()
+            self.activate_state(self.current_state)  # Activate the current state (if such behavior is defined).
 
         if self.current_state in self.end_states:
             return _result.Success("Automaton terminated in an end state!")
@@ -499,10 +556,7 @@ class TMAutomaton(BaseAutomaton):
             If no start state is set or the start state is not part of the automaton's states,
             an error is logged and the simulation returns a failure.
         """
-        for state in self.states:
-            state.deactivate()
-        for transition in self.transitions:
-            transition.deactivate()
+        self.clear_activations()  # Only deactivates what the last step activated
         if not self.start_state:
             #ActLogger().error("Tried to start simulation of DFA-Automaton without start state!")
             return _result.Failure("No start state found")
@@ -513,13 +567,14 @@ class TMAutomaton(BaseAutomaton):
 
         if self.current_state is None:
             self.current_state = self.start_state
-            self.current_state.activate()
+            self.activate_state(self.current_state)
 
         condition = self.next_state()  # Transition to the next state.
         if isinstance(condition, _result.Failure):
             return condition
         if isinstance(condition, tuple) and len(condition) == 2:
-            self.current_char = condition[0]
+            self.current_char_id = condition[0]
+            self.current_char = self._symbols.get_symbol(self.current_char_id)
             self.write()
         else:
             if self.current_state in self.end_states:
@@ -542,8 +597,42 @@ class TMAutomaton(BaseAutomaton):
             case "default":
                 pass
 
+    def get_configuration(self, max_cells: int) -> _a.Hashable | None:
+        """
+        Returns the current state, the head position and the visited tape cells.
+
+        The whole visited tape is part of the configuration, so a repeated configuration is a proven cycle.
+
+        Args:
+            max_cells (int): The maximum number of tape cells the snapshot may contain.
+
+        Returns:
+            _a.Hashable | None: The configuration, None if the visited tape is longer than max_cells.
+        """
+        if len(self.tape) > max_cells:
+            return None
+        low, high = self.tape.get_bounds()
+        return self.current_state, self.tape.get_head(), low, tuple(self.tape.iter_ids(low, high + 1))
+
+    def pop_input_changes(self) -> _ty.Tuple[int, _ty.List[int]] | None:
+        """
+        Returns the tape cells written since the last call, relative to the start of `get_input`.
+
+        The writes are only tracked from the first call on, so simulations without packets do not collect them.
+
+        Returns:
+            _ty.Tuple[int, _ty.List[int]]: The number of cells the tape grew to the left and the indices of the
+                written cells.
+        """
+        low: int = self.tape.get_bounds()[0]
+        written: _ty.List[int] = [cell - low for cell in self._written_cells or ()]
+        shift: int = self._reported_low - low
+        self._written_cells = []
+        self._reported_low = low
+        return shift, written
+
     def get_current_index(self) -> int:
-        return self.head
+        return self.tape.get_head() - self.tape.get_bounds()[0]  # Relative to the start of get_input
 
     def get_current_return_value(self) -> _ty.Any:
-        return self.memoryTape[self.head]
+        return self.tape.read()
@@ -37,11 +37,12 @@ from automaton.UIAutomaton import UiAutomaton
 from automaton.automatonProvider import AutomatonProvider
 from serializer import serialize, deserialize
 from storage import AppSettings
-from gui import MainWindow, assign_object_names_iterative, Theme, Style
+from gui import MainWindow, GuiThreadInvoker, assign_object_names_iterative, Theme, Style
 from abstractions import IMainWindow, IBackend, IAppSettings
 from automaton import start_backend
 from utils.IOManager import IOManager
 from utils.staticSignal import SignalCache
+from utils.tracer import Tracer, TRACE, LoggerSink, JsonLinesSink
 from automaton.UiSettingsProvider import UiSettingsProvider
 from customPythonHandler import CustomPythonHandler
 from extensions_loader import Extensions_Loader
@@ -142,6 +143,9 @@ class App:
             self.grid_view = self.window.user_panel.grid_view
             self.control_menu = self.window.user_panel.control_menu
 
+            self.gui_invoker: GuiThreadInvoker = GuiThreadInvoker()  # Backend notifications reach the gui at once
+            self.simulation_timer: QtTimidTimer | None = None
+
             self.backend: IBackend = start_backend(self.settings)
             self.backend_stop_event: threading.Event = threading.Event()
             self.backend_thread: threading.Thread = threading.Thread(target=self.backend.run_infinite,
@@ -384,6 +388,7 @@ class App:
         if not simulation_output["output"]:
             return output
         else:
+            output = list(output)  # The input is the persistent buffer of the ui automaton
             if max(0, simulation_output["pointer_index"] -1) < len(output):
                 output[max(0, simulation_output["pointer_index"] -1)] = simulation_output["output"]
             else:
@@ -392,7 +397,7 @@ class App:
 
     def start_simulation(self, automaton_input: _ty.List[str] = None) -> None:
         # print(f"Input: {self.window.user_panel.input_widget.getFormattedInput()}")
-        print(automaton_input, "inp", bool(automaton_input))
+        Tracer().emit("ui.start_simulation", logging.DEBUG, input=automaton_input)
         if automaton_input is None:
             automaton_input = self.window.user_panel.input_widget.getFormattedInput()
             self.io_manager.debug("Input: " + str(automaton_input))
@@ -407,7 +412,7 @@ class App:
             return
         else:
             try:
-                result = self.ui_automaton.simulate(automaton_input, self.handle_simulation)
+                result = self.ui_automaton.simulate(automaton_input, self.gui_invoker.wrap(self.handle_simulation))
                 if isinstance(result, _result.Success):
                     self.update_simulation_controls(running=True)
                 elif isinstance(result, _result.Failure):
@@ -425,9 +430,12 @@ class App:
             IOManager().info('Finished Simulation!', '', True, False)
 
     def handle_simulation(self) -> None:
+        if self.simulation_timer is not None:  # Playback of a previous simulation
+            self.simulation_timer.stop_all()
         self.simulation_timer = QtTimidTimer()
         self.simulation_timer.timeout.connect(self.start_simulation_visualisation)
-        self.simulation_timer.start(500, 0)
+        self.simulation_timer.start(self.settings.get_simulation_playback_interval(), 0)  # The playback clock
+        self.start_simulation_visualisation()  # The first frame is shown at once
 
     def start_simulation_visualisation(self):
         if self.ui_automaton.has_simulation_data():
@@ -435,7 +443,9 @@ class App:
             simulation_result: _ty.Dict = simulation_result_raw._inner_value
 
             # display the simulation output in the input widget
-            print(simulation_result, "SIM")
+            tracer: Tracer = Tracer()
+            if tracer.level <= TRACE:
+                tracer.emit("ui.simulation_update", TRACE, update=simulation_result)
 
             if not isinstance(simulation_result, dict):
                 self.io_manager.info(f"Simulation Message: {simulation_result}", "", True, True)
@@ -469,7 +479,7 @@ class App:
 
         self.simulation_mode = 'step'
         if self.ui_automaton and not self.ui_automaton.has_simulation_data():
-            result = self.ui_automaton.simulate(automaton_input, self.step_simulation)
+            result = self.ui_automaton.simulate(automaton_input, self.gui_invoker.wrap(self.step_simulation))
             if isinstance(result, _result.Success):
                 self.update_simulation_controls(running=True)
         else:
@@ -708,10 +718,13 @@ class App:
         """Cleans up resources"""
         if hasattr(self, "timer"):
             self.timer.stop_all()
+        if getattr(self, "simulation_timer", None) is not None:
+            self.simulation_timer.stop_all()
         if hasattr(self, "pool"):
             self.pool.shutdown()
         if hasattr(self, "backend_thread") and self.backend_thread.is_alive():  # TODO: Is it alive after error?
             self.backend_stop_event.set()
+            self.backend.wake_up()
             self.backend_thread.join()
 
     def __del__(self) -> None:
@@ -733,8 +746,18 @@ if __name__ == "__main__":
     parser.add_argument("input", nargs="?", default="", help="Path to the input file.")
     parser.add_argument("--logging-mode", choices=["DEBUG", "INFO", "WARN", "WARNING", "ERROR"], default=None,
                         help="Logging mode (default: None)")
+    parser.add_argument("--trace-mode", choices=["TRACE", "DEBUG", "INFO"], default=None,
+                        help="Logs the trace events of at least this level, TRACE includes every simulation step "
+                             "(default: None)")
+    parser.add_argument("--trace-file", default=None,
+                        help="Appends all trace events as JSON lines to this file (default: None)")
     args = parser.parse_args()
 
+    if args.trace_mode is not None:
+        Tracer().add_sink(LoggerSink(), logging.getLevelName(args.trace_mode))
+    if args.trace_file is not None:
+        Tracer().add_sink(JsonLinesSink(os.path.abspath(args.trace_file)), TRACE)
+
     logging_mode: str = args.logging_mode
     logging_level: int | None = None
     if logging_mode is not None:
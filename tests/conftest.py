@@ -0,0 +1,9 @@
+"""TBA"""
+import sys
+import os
+
+BASE_APP_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "default-config")
+sys.path.insert(0, os.path.join(BASE_APP_DIR, "core", "libs"))
+sys.path.insert(0, os.path.join(BASE_APP_DIR, "core", "modules"))
+sys.path.insert(0, BASE_APP_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,35 @@
+"""TBA"""
+import pytest
+
+from extensions.dfa import DFAAutomaton, DFAState, DFATransition
+from automaton.automatonProvider import AutomatonProvider
+from automaton.automatonSimulator import AutomatonSimulator
+from automaton.compiledAutomaton import CompiledDFA
+
+AutomatonProvider(None).register_automaton("dfa", DFAAutomaton, DFAState, DFATransition)
+
+
+def _content(start_type: str) -> list[dict]:
+    return [{"name": "q0", "type": start_type, "transitions": [{"to": 1, "condition": ["a"], "id": 0}]},
+            {"name": "q1", "type": "end", "transitions": [{"to": 0, "condition": ["b"], "id": 1}]}]
+
+
+@pytest.mark.parametrize("start_type", ["default", "end"])
+@pytest.mark.parametrize("word", [[], ["a"], ["a", "b"], ["b"], ["a", "a"]])
+def test_interpreted_and_compiled_engines_agree(start_type: str, word: list[str]):
+    automaton = AutomatonSimulator({"id": "x:dfa", "input": word, "content": _content(start_type)},
+                                   lambda _: None, lambda *_: None).build().unwrap().get_implementation()
+    automaton.set_input(word)
+
+    result = None
+    while result is None:
+        result = automaton.simulate_one_step()
+
+    assert str(result) == str(CompiledDFA.from_automaton(automaton).simulate(word))
+
+
+def test_empty_word_is_accepted_in_an_end_start_state():
+    automaton = AutomatonSimulator({"id": "x:dfa", "input": [], "content": _content("end")},
+                                   lambda _: None, lambda *_: None).build().unwrap().get_implementation()
+    automaton.set_input([])
+    assert str(automaton.simulate_one_step()) == "<Success: Automaton terminated in an end state!>"
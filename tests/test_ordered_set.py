@@ -0,0 +1,29 @@
+"""TBA"""
+import pickle
+import copy
+
+from utils.OrderedSet import OrderedSet
+
+
+def test_deepcopy_after_removal_keeps_only_live_items():
+    ordered_set = OrderedSet(["a", "b", "c", "d"])
+    ordered_set.discard("b")
+
+    copied = copy.deepcopy(ordered_set)
+    assert list(copied) == ["a", "c", "d"]
+    assert len(copied) == 3
+    assert copied.get_index("c") == 1
+    assert copied.get_by_index(-1) == "d"
+
+
+def test_pickle_after_removal_keeps_only_live_items():
+    ordered_set = OrderedSet(["a", "b", "c", "d"])
+    ordered_set.discard("c")
+
+    restored = pickle.loads(pickle.dumps(ordered_set))
+    assert restored == ordered_set
+    assert list(restored) == ["a", "b", "d"]
+
+
+def test_copy_of_empty_set():
+    assert list(copy.deepcopy(OrderedSet())) == []
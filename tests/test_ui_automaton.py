@@ -0,0 +1,57 @@
+"""TBA"""
+import copy
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtGui import QColor
+
+from automaton.UIAutomaton import UiAutomaton, UiState, UiTransition
+
+
+def _build_automaton() -> tuple[UiAutomaton, list[UiState], list[UiTransition]]:
+    automaton: UiAutomaton = UiAutomaton("dfa", "tester", {}, [["a", "b"], []], [True, False], [0])
+    states: list[UiState] = [UiState(QColor(255, 255, 255), (float(i), 0.0), f"q{i}", "default") for i in range(3)]
+    for state in states:
+        automaton.add_state(state)
+    automaton.set_start_state(states[0])
+    transitions: list[UiTransition] = [UiTransition(states[0], "e", states[1], "w", ["a"]),
+                                       UiTransition(states[1], "e", states[2], "w", ["b"]),
+                                       UiTransition(states[2], "n", states[2], "s", ["a"])]
+    for transition in transitions:
+        automaton.add_transition(transition)
+    return automaton, states, transitions
+
+
+def test_deepcopy_after_deleting_a_state():
+    automaton, states, _ = _build_automaton()
+    automaton.delete_state(states[1])
+
+    copied: UiAutomaton = copy.deepcopy(automaton)
+    assert copied == automaton
+    assert [state.get_display_text() for state in copied.get_states()] == ["q0", "q2"]
+    assert len(copied.get_transitions()) == 1
+
+
+def test_deepcopy_after_deleting_a_transition():
+    automaton, states, transitions = _build_automaton()
+    automaton.delete_transition(transitions[0])
+
+    copied: UiAutomaton = copy.deepcopy(automaton)
+    assert copied == automaton
+    assert len(copied.get_transitions()) == 2
+
+    states[2].set_position((5.0, 5.0))
+    assert copied != automaton
+
+
+def test_copied_automaton_records_edits_of_its_own_states():
+    automaton, states, _ = _build_automaton()
+    automaton.delete_state(states[0])
+    copied: UiAutomaton = copy.deepcopy(automaton)
+
+    version: int = copied.get_version()
+    copied.get_states().get_by_index(0).set_display_text("renamed")
+    assert copied.get_version() != version
+    assert states[1].get_display_text() == "q1"